@@ -0,0 +1,7 @@
+"""
+Benchmarks for Anvil Engine.
+
+This package contains performance and memory benchmarks for the Anvil
+Engine RPG system. Each module can be run on its own, for example
+``poetry run python -m benchmarks.memory_footprint``.
+"""
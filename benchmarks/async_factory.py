@@ -0,0 +1,128 @@
+"""
+Event-loop latency benchmark for the async factories.
+
+Runs a stream of small concurrent batch requests on one event loop, first
+alone and then while a bulk batch is being created, either directly with
+``CharacterFactory`` (blocking the loop) or with ``AsyncCharacterFactory``
+(offloaded in chunks). Reports the latency percentiles of the small
+requests in each scenario.
+
+Usage:
+    poetry run python -m benchmarks.async_factory --bulk 200000 --requests 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from anvil_engine.factories import AsyncCharacterFactory, CharacterFactory, RaceFactory
+
+SMALL_BATCH = 8
+BULK_DELAY = 0.05
+"""Seconds after the first small request at which the bulk job starts."""
+
+
+def rows(count: int, race: Any) -> list[dict[str, Any]]:
+    """Build raw character rows for a batch."""
+    attributes = {
+        "strength": 10,
+        "agility": 10,
+        "intelligence": 10,
+        "wisdom": 10,
+        "dexterity": 10,
+        "constitution": 10,
+        "charisma": 10,
+    }
+    return [
+        {
+            "name": f"Hero {i}",
+            "age": 18 + i % 60,
+            "gender": "female",
+            "attributes": attributes,
+            "race": race,
+        }
+        for i in range(count)
+    ]
+
+
+async def small_requests(
+    create: Callable[[list[dict[str, Any]]], Awaitable[object]],
+    batch: list[dict[str, Any]],
+    count: int,
+) -> list[float]:
+    """
+    Issue small batch requests at a steady rate and time each one.
+
+    Args:
+        create (Callable[[list[dict[str, Any]]], Awaitable[object]]): Creates
+            one small batch.
+        batch (list[dict[str, Any]]): The rows of a small batch.
+        count (int): The number of requests.
+
+    Returns:
+        list[float]: The latency of each request in seconds, measured from
+            when it was due to when it completed.
+    """
+    latencies = []
+    start = time.perf_counter()
+    for i in range(count):
+        due = start + i * 1e-3
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        await create(batch)
+        latencies.append(time.perf_counter() - due)
+    return latencies
+
+
+async def scenario(
+    label: str, bulk: Callable[[], Awaitable[object]] | None, args: argparse.Namespace
+) -> None:
+    """Measure small-request latencies, optionally alongside a bulk job."""
+    race = RaceFactory().create_elf()
+    batch = rows(SMALL_BATCH, race)
+    async with AsyncCharacterFactory() as factory:
+        await factory.create_characters(batch)  # Warm up the validators
+
+        async def delayed_bulk() -> None:
+            await asyncio.sleep(BULK_DELAY)
+            if bulk:
+                await bulk()
+
+        job = asyncio.create_task(delayed_bulk())
+        latencies = await small_requests(
+            factory.create_characters, batch, args.requests
+        )
+        await job
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{label:<32}{quantiles[49] * 1e3:>10.2f}{quantiles[98] * 1e3:>10.2f}"
+        f"{max(latencies) * 1e3:>10.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bulk", type=int, default=200_000)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    bulk_rows = rows(args.bulk, RaceFactory().create_elf())
+    sync_factory = CharacterFactory()
+
+    async def blocking_bulk() -> object:
+        return sync_factory.create_characters(bulk_rows)
+
+    async def offloaded_bulk() -> object:
+        async with AsyncCharacterFactory(sync_factory) as factory:
+            return await factory.create_characters(bulk_rows)
+
+    print(f"{'scenario':<32}{'p50 (ms)':>10}{'p99 (ms)':>10}{'max (ms)':>10}")
+    asyncio.run(scenario("no bulk job", None, args))
+    asyncio.run(scenario("blocking bulk job", blocking_bulk, args))
+    asyncio.run(scenario("AsyncCharacterFactory bulk job", offloaded_bulk, args))
+
+
+if __name__ == "__main__":
+    main()
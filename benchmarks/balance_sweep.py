@@ -0,0 +1,123 @@
+"""
+Balance sweep benchmark: vectorized duels against a Python loop.
+
+Builds a roster of randomly rolled archers and warriors of several
+races, fights duels between random pairs with a plain Python loop over
+Character objects and with the vectorized, sharded simulator, and
+prints the simulator's win-rate matrices by class and by race.
+
+Usage:
+    poetry run python -m benchmarks.balance_sweep --duels 10000000
+"""
+
+import argparse
+import random
+import time
+
+from anvil_engine.factories import RaceFactory
+from anvil_engine.generation import generate_characters
+from anvil_engine.interfaces import CharacterInterface
+from anvil_engine.roster import CharacterTable
+from anvil_engine.simulation import DuelRules, Grouping, simulate_matchups
+
+
+def loop_duel(
+    first: CharacterInterface,
+    second: CharacterInterface,
+    rng: random.Random,
+    rules: DuelRules,
+) -> int:
+    """
+    Fight one duel under the simulator's rules, one attribute at a time.
+
+    Args:
+        first (CharacterInterface): The first combatant.
+        second (CharacterInterface): The second combatant.
+        rng (random.Random): The dice.
+        rules (DuelRules): The duel rules.
+
+    Returns:
+        int: 1 if the first combatant wins, -1 if it loses, 0 for a draw.
+    """
+    stats = []
+    for character in (first, second):
+        attributes = character.get_effective_attributes()
+        best = max(
+            attributes["strength"], attributes["dexterity"], attributes["intelligence"]
+        )
+        stats.append(
+            [
+                (best - 10) // 2,
+                rules.defence_base + (attributes["agility"] - 10) // 2,
+                rules.base_hp + attributes["constitution"],
+            ]
+        )
+    (attack_a, defence_a, hp_a), (attack_b, defence_b, hp_b) = stats
+    for _ in range(rules.max_rounds):
+        if rng.randint(1, rules.hit_die) + attack_a >= defence_b:
+            hp_b -= max(rng.randint(1, rules.damage_die) + attack_a, 1)
+        if rng.randint(1, rules.hit_die) + attack_b >= defence_a:
+            hp_a -= max(rng.randint(1, rules.damage_die) + attack_b, 1)
+        if hp_a <= 0 or hp_b <= 0:
+            return (hp_b <= 0) - (hp_a <= 0)
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--roster", type=int, default=100_000)
+    parser.add_argument("--duels", type=int, default=10_000_000)
+    parser.add_argument("--loop-duels", type=int, default=50_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    race_factory = RaceFactory()
+    races = [
+        race_factory.create_human(),
+        race_factory.create_elf(),
+        race_factory.create_race(
+            name="Dwarf",
+            description="Stout and stubborn mountain folk",
+            base_attributes={"strength": 12, "constitution": 12, "agility": 8},
+        ),
+    ]
+    roster = CharacterTable.concat(
+        [
+            generate_characters(
+                args.roster // 2,
+                character_class,
+                races=races,
+                seed=seed,
+                stat_method="roll",
+            )
+            for seed, character_class in enumerate(("archer", "warrior"))
+        ]
+    )
+    rules = DuelRules()
+
+    characters = roster.to_characters()
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for _ in range(args.loop_duels):
+        loop_duel(rng.choice(characters), rng.choice(characters), rng, rules)
+    loop_rate = args.loop_duels / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    report = simulate_matchups(
+        roster, roster, duels=args.duels, rules=rules, workers=args.workers
+    )
+    elapsed = time.perf_counter() - start
+    rate = args.duels / elapsed
+
+    print(f"python loop: {loop_rate:,.0f} duels/s")
+    print(
+        f"simulator:   {rate:,.0f} duels/s ({args.duels:,} duels in {elapsed:.1f} s, "
+        f"{rate / loop_rate:.0f}x)"
+    )
+    for grouping in (Grouping.CLASS, Grouping.RACE, Grouping.CLASS_AND_RACE):
+        print(f"\nwin rate of row against column, by {grouping}:")
+        print(report.win_rates(grouping).format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Import-time benchmark for cold starts.
+
+Runs import statements in fresh interpreters with ``-X importtime`` and
+reports the best cumulative import time of each, plus the modules that
+contribute the most to the slowest one. Use it to track the startup
+latency paid by short-lived processes such as serverless functions.
+
+Usage:
+    poetry run python -m benchmarks.import_time --repeat 5 --top 15
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+
+STATEMENTS: dict[str, str] = {
+    "import anvil_engine": "import anvil_engine",
+    "factories": "from anvil_engine.factories import CharacterFactory, RaceFactory",
+    "factories + first character": (
+        "from anvil_engine.factories import CharacterFactory, RaceFactory; "
+        "CharacterFactory().create_archer('Legolas', 2931, 'male', "
+        "RaceFactory().create_elf())"
+    ),
+    "roster": "import anvil_engine.roster",
+}
+"""Statements timed, keyed by label."""
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def profile(statement: str) -> tuple[float, list[tuple[int, int, str]]]:
+    """
+    Run a statement in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        statement (str): The Python statement to run.
+
+    Returns:
+        tuple[float, list[tuple[int, int, str]]]: The total time in seconds
+            (imports and the statement itself) and the self and cumulative
+            import time in microseconds of every imported module.
+    """
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import time; start = time.perf_counter(); "
+            f"{statement}; print(time.perf_counter() - start)",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    modules = [
+        (int(match[1]), int(match[2]), match[4])
+        for match in _IMPORTTIME_LINE.finditer(output.stderr)
+    ]
+    return float(output.stdout), modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    print(f"{'statement':<32}{'best (ms)':>12}{'modules':>10}")
+    slowest: tuple[float, str, list[tuple[int, int, str]]] = (0.0, "", [])
+    for label, statement in STATEMENTS.items():
+        runs = [profile(statement) for _ in range(args.repeat)]
+        best, modules = min(runs, key=lambda run: run[0])
+        print(f"{label:<32}{best * 1e3:>12.1f}{len(modules):>10}")
+        slowest = max(slowest, (best, label, modules), key=lambda item: item[0])
+
+    best, label, modules = slowest
+    print(f"\nTop {args.top} modules by self time for {label!r}:")
+    print(f"{'module':<56}{'self (ms)':>10}{'cumul. (ms)':>12}")
+    for self_us, cumulative_us, module in sorted(modules, reverse=True)[: args.top]:
+        print(f"{module:<56}{self_us / 1e3:>10.1f}{cumulative_us / 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
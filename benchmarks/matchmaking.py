@@ -0,0 +1,111 @@
+"""
+Matchmaking throughput benchmark for the MatchQueue.
+
+Queues randomly rolled archers and warriors of several races in a
+shuffled arrival order and measures how fast parties are formed, for a
+balanced composition and one that leaves a growing backlog of archers,
+then compares the grid against a linear scan of the waiting characters
+(a single-cell grid, so both form exactly the same parties) on a subset.
+
+Usage:
+    poetry run python -m benchmarks.matchmaking --count 100000
+"""
+
+import argparse
+import random
+import time
+
+from anvil_engine.factories import RaceFactory
+from anvil_engine.generation import generate_characters
+from anvil_engine.interfaces import CharacterInterface
+from anvil_engine.matchmaking import MatchQueue
+
+SCAN_CELL_SIZE = 1_000_000
+"""Cell size putting every waiting character in the same cell."""
+
+SCENARIOS: dict[str, dict[str, int]] = {
+    "balanced": {"archer": 1, "warrior": 1},
+    "archer backlog": {"archer": 1, "warrior": 3},
+}
+"""Party compositions; the second leaves most archers waiting."""
+
+
+def run(
+    queue: MatchQueue, characters: list[CharacterInterface]
+) -> tuple[float, int, int]:
+    """
+    Queue characters one by one.
+
+    Args:
+        queue (MatchQueue): The empty queue.
+        characters (list[CharacterInterface]): The characters, in arrival order.
+
+    Returns:
+        tuple[float, int, int]: The duration in seconds, the number of
+            parties formed and the largest spread of a party.
+    """
+    parties = 0
+    spread = 0
+    start = time.perf_counter()
+    for character in characters:
+        party = queue.add(character)
+        if party is not None:
+            parties += 1
+            spread = max(spread, party.spread)
+    return time.perf_counter() - start, parties, spread
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--scan-count", type=int, default=10_000)
+    parser.add_argument("--tolerance", type=int, default=4)
+    args = parser.parse_args()
+
+    race_factory = RaceFactory()
+    races = [
+        race_factory.create_human(),
+        race_factory.create_elf(),
+        race_factory.create_race(
+            name="Dwarf",
+            description="Stout and stubborn mountain folk",
+            base_attributes={"strength": 12, "constitution": 12, "agility": 8},
+        ),
+    ]
+    half = args.count // 2
+    characters = [
+        *generate_characters(
+            half, "archer", races=races, seed=1, stat_method="roll"
+        ).to_characters(),
+        *generate_characters(
+            args.count - half, "warrior", races=races, seed=2, stat_method="roll"
+        ).to_characters(),
+    ]
+    random.Random(3).shuffle(characters)
+
+    subset = characters[: args.scan_count]
+    for label, composition in SCENARIOS.items():
+        queue = MatchQueue(composition, tolerance=args.tolerance)
+        elapsed, parties, spread = run(queue, characters)
+        print(
+            f"{label}: {len(characters):,} characters in {elapsed:.2f} s "
+            f"({len(characters) / elapsed:,.0f} characters/s), {parties:,} parties, "
+            f"max spread {spread}, waiting {queue.waiting()}"
+        )
+        scan_queue = MatchQueue(
+            composition, tolerance=args.tolerance, cell_size=SCAN_CELL_SIZE
+        )
+        scan, scan_parties, _ = run(scan_queue, subset)
+        grid, grid_parties, _ = run(
+            MatchQueue(composition, tolerance=args.tolerance), subset
+        )
+        assert scan_parties == grid_parties
+        print(
+            f"  first {len(subset):,}: {grid_parties:,} parties, "
+            f"scan {len(subset) / scan:,.0f} characters/s, "
+            f"grid {len(subset) / grid:,.0f} characters/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
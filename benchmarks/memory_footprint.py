@@ -0,0 +1,81 @@
+"""
+Memory footprint benchmark for character representations.
+
+Measures the bytes allocated per character when keeping a roster resident
+as pydantic ``Character`` models, as slotted ``CompactCharacter`` objects
+and as a columnar ``CharacterTable``. All characters share one race, as
+they would with interned races.
+
+Usage:
+    poetry run python -m benchmarks.memory_footprint --count 100000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from anvil_engine.factories import CharacterFactory, RaceFactory
+from anvil_engine.models import Character, CompactCharacter
+from anvil_engine.roster import CharacterTable
+
+
+def measure(build: Callable[[], Any]) -> int:
+    """
+    Measure the memory retained by the object built by ``build``.
+
+    Args:
+        build (Callable[[], Any]): Builds the object to measure.
+
+    Returns:
+        int: The number of bytes still allocated once ``build`` returns.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        retained = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del retained
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    race = RaceFactory().create_elf()
+    archer = CharacterFactory().create_archer("Archer", 100, "female", race)
+    names = [f"Character {i}" for i in range(args.count)]
+    data = archer.model_dump(exclude={"race"})
+
+    def build_characters() -> list[Character]:
+        return [Character(**{**data, "name": name, "race": race}) for name in names]
+
+    def build_compact() -> list[CompactCharacter]:
+        return [
+            CompactCharacter(
+                name, data["age"], data["gender"], data["attributes"], race
+            )
+            for name in names
+        ]
+
+    characters = build_characters()
+    results = {
+        "Character": measure(build_characters),
+        "CompactCharacter": measure(build_compact),
+        "CharacterTable": measure(lambda: CharacterTable.from_characters(characters)),
+    }
+
+    # Names are shared by every representation and are not counted
+    print(f"{'representation':<20}{'bytes/character':>16}")
+    for label, size in results.items():
+        print(f"{label:<20}{size / args.count:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
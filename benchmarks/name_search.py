@@ -0,0 +1,142 @@
+"""
+Name search benchmark for NameIndex against a linear scan.
+
+Builds a roster of random syllable names, indexes them, then searches
+for one of them by prefix, infix and misspelling, comparing ``NameIndex``
+with a linear scan over the casefolded names, and measures incremental
+insert and remove costs.
+
+Usage:
+    poetry run python -m benchmarks.name_search --count 10000000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from anvil_engine.roster import NameIndex
+
+ONSETS = ["", "b", "d", "g", "k", "l", "m", "n", "r", "s", "th", "v", "z"]
+VOWELS = ["a", "e", "i", "o", "u", "ae", "ia"]
+CODAS = ["", "", "l", "n", "r", "s", "th"]
+
+
+def random_names(count: int, seed: int) -> list[str]:
+    """
+    Generate given names and surnames of two to three random syllables.
+
+    Args:
+        count (int): The number of names.
+        seed (int): The random seed.
+
+    Returns:
+        list[str]: The names.
+    """
+    rng = np.random.default_rng(seed)
+    syllables = np.array(
+        [o + v + c for o in ONSETS for v in VOWELS for c in CODAS], dtype=object
+    )
+    parts = []
+    for _ in range(2):
+        lengths = rng.integers(2, 4, size=count)
+        picks = syllables[rng.integers(len(syllables), size=(count, 3))]
+        parts.append(
+            ["".join(row[:n]).title() for row, n in zip(picks, lengths, strict=True)]
+        )
+    return [f"{first} {last}" for first, last in zip(*parts, strict=True)]
+
+
+def queries(name: str) -> list[tuple[str, str]]:
+    """
+    Derive searches for one name of the roster.
+
+    Args:
+        name (str): The name looked for.
+
+    Returns:
+        list[tuple[str, str]]: Search methods and texts: short and full
+            prefixes, infixes and two misspellings.
+    """
+    given, surname = name.split()
+    swapped = given[0] + given[2] + given[1] + given[3:]
+    return [
+        ("prefix", given[:3]),
+        ("prefix", name[:-1]),
+        ("substring", surname[1:4]),
+        ("substring", f"{given[-2:]} {surname[:3]}"),
+        ("fuzzy", f"{swapped} {surname}"),
+        ("fuzzy", f"{given} {surname[:-1]}"),
+    ]
+
+
+def best_time(run: Callable[[], object], repeat: int) -> float:
+    """
+    Measure the best duration of ``run`` over several repetitions.
+
+    Args:
+        run (Callable[[], object]): The operation to time.
+        repeat (int): The number of repetitions.
+
+    Returns:
+        float: The best observed duration in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    names = random_names(args.count, seed=1)
+    start = time.perf_counter()
+    index = NameIndex(names)
+    print(
+        f"build: {time.perf_counter() - start:.1f} s for {len(index):,} names, "
+        f"{index.nbytes / len(index):.1f} bytes/name"
+    )
+
+    folded = [name.casefold() for name in names]
+    scans = {
+        "prefix": lambda text: [i for i, n in enumerate(folded) if n.startswith(text)],
+        "substring": lambda text: [i for i, n in enumerate(folded) if text in n],
+    }
+    print(f"{'query':<36}{'results':>10}{'scan (ms)':>12}{'index (ms)':>12}")
+    for kind, text in queries(names[len(names) // 2]):
+        search = getattr(index, kind)
+        results = search(text)
+        indexed = best_time(lambda s=search, t=text: s(t), args.repeat)
+        scan = (
+            f"{best_time(lambda k=kind, t=text: scans[k](t.casefold()), 1) * 1e3:.1f}"
+            if kind in scans
+            else "-"
+        )
+        label = f"{kind} {text!r}"
+        print(f"{label:<36}{len(results):>10}{scan:>12}{indexed * 1e3:>12.3f}")
+        if kind == "fuzzy" and results:
+            print(f"    best match: {names[results[0][0]]!r}")
+
+    sample = random_names(1_000, seed=2)
+    start = time.perf_counter()
+    handles = [index.add(name) for name in sample]
+    added = time.perf_counter() - start
+    start = time.perf_counter()
+    for handle in handles:
+        index.remove(handle)
+    removed = time.perf_counter() - start
+    print(
+        f"add: {added / len(sample) * 1e6:.1f} us/name, "
+        f"remove: {removed / len(sample) * 1e6:.1f} us/name"
+    )
+
+
+if __name__ == "__main__":
+    main()
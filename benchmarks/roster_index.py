@@ -0,0 +1,113 @@
+"""
+Query benchmark for RosterIndex against a linear scan.
+
+Builds a roster of randomly rolled characters of several races, then
+compares the time of multi-predicate queries answered by ``RosterIndex``
+with a linear scan over ``get_attributes()``, and measures incremental
+insert and remove costs.
+
+Usage:
+    poetry run python -m benchmarks.roster_index --count 200000
+"""
+
+import argparse
+import time
+from collections.abc import Callable, Mapping
+
+from anvil_engine.factories import RaceFactory
+from anvil_engine.generation import generate_characters
+from anvil_engine.interfaces import CharacterInterface
+from anvil_engine.roster import RosterIndex
+
+QUERIES: list[tuple[str | None, dict[str, int], dict[str, int]]] = [
+    ("Dwarf", {"strength": 14}, {"constitution": 12}),
+    ("Elf", {"agility": 15}, {}),
+    (None, {"strength": 19, "constitution": 10}, {}),
+    ("Human", {}, {"charisma": 2}),
+]
+
+
+def linear_scan(
+    characters: list[CharacterInterface],
+    race: str | None,
+    min_attributes: Mapping[str, int],
+    max_attributes: Mapping[str, int],
+) -> list[CharacterInterface]:
+    """Answer a query by checking every character."""
+    return [
+        character
+        for character in characters
+        if (race is None or character.get_race().get_name() == race)
+        and all(character.get_attributes()[k] >= v for k, v in min_attributes.items())
+        and all(character.get_attributes()[k] <= v for k, v in max_attributes.items())
+    ]
+
+
+def best_time(run: Callable[[], object], repeat: int) -> float:
+    """
+    Measure the best duration of ``run`` over several repetitions.
+
+    Args:
+        run (Callable[[], object]): The operation to time.
+        repeat (int): The number of repetitions.
+
+    Returns:
+        float: The best observed duration in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    race_factory = RaceFactory()
+    races = [
+        race_factory.create_human(),
+        race_factory.create_elf(),
+        race_factory.create_race(
+            name="Dwarf",
+            description="Stout and stubborn mountain folk",
+            base_attributes={"strength": 12, "constitution": 12, "agility": 8},
+        ),
+    ]
+    characters = generate_characters(
+        args.count, races=races, seed=1, stat_method="roll"
+    ).to_characters()
+
+    start = time.perf_counter()
+    index = RosterIndex(characters)
+    print(f"build: {time.perf_counter() - start:.3f} s for {len(index):,} characters")
+
+    print(f"{'query':<60}{'matches':>10}{'scan (ms)':>12}{'index (ms)':>12}")
+    for race, min_attributes, max_attributes in QUERIES:
+        matches = len(index.query(race, min_attributes, max_attributes))
+        query = (race, min_attributes, max_attributes)
+        scan = best_time(lambda q=query: linear_scan(characters, *q), args.repeat)
+        indexed = best_time(lambda q=query: index.query(*q), args.repeat)
+        label = f"{race} >= {min_attributes} <= {max_attributes}"
+        print(f"{label:<60}{matches:>10,}{scan * 1e3:>12.2f}{indexed * 1e3:>12.2f}")
+
+    sample = characters[:1_000]
+    start = time.perf_counter()
+    handles = [index.add(character) for character in sample]
+    added = time.perf_counter() - start
+    start = time.perf_counter()
+    for handle in handles:
+        index.remove(handle)
+    removed = time.perf_counter() - start
+    print(
+        f"add: {added / len(sample) * 1e6:.1f} us/character, "
+        f"remove: {removed / len(sample) * 1e6:.1f} us/character"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Replication benchmark: full roster transfer against change sets.
+
+Builds a keyed roster, changes a fraction of it (attribute updates,
+additions and removals), then compares shipping the whole roster as JSON
+with diffing the snapshots, shipping the change set and applying it on
+the receiving side.
+
+Usage:
+    poetry run python -m benchmarks.roster_sync --count 100000 --churn 0.01
+"""
+
+import argparse
+import time
+
+from pydantic import TypeAdapter
+
+from anvil_engine.factories import CharacterFactory, apply_delta
+from anvil_engine.generation import generate_characters
+from anvil_engine.models import Character
+from anvil_engine.roster import ChangeSet, apply_changeset, diff_rosters
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--churn", type=float, default=0.01)
+    args = parser.parse_args()
+
+    characters = generate_characters(args.count, seed=1, stat_method="roll")
+    old = {f"c{i}": character for i, character in enumerate(characters.to_characters())}
+    for character in old.values():
+        character.content_hash()  # Hashes are cached once per instance
+
+    new = dict(old)
+    churned = max(1, int(args.count * args.churn))
+    keys = list(old)
+    for key in keys[:churned]:
+        new[key] = apply_delta(old[key], {"strength": 1})
+    for key in keys[churned : 2 * churned]:
+        del new[key]
+    for i in range(churned):
+        new[f"new{i}"] = old[keys[-1 - i]]
+
+    adapter = TypeAdapter(dict[str, Character])
+    start = time.perf_counter()
+    full = adapter.dump_json(new)
+    adapter.validate_json(full)
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    changeset = diff_rosters(old, new)
+    diff_time = time.perf_counter() - start
+    start = time.perf_counter()
+    payload = changeset.to_json()
+    received = ChangeSet.from_json(payload, CharacterFactory())
+    transfer_time = time.perf_counter() - start
+    replica = dict(old)
+    start = time.perf_counter()
+    apply_changeset(replica, received)
+    apply_time = time.perf_counter() - start
+    assert replica.keys() == new.keys()
+
+    print(f"{len(new):,} characters, {len(changeset):,} changes")
+    print(f"full roster:  {len(full) / 1e6:>8.2f} MB {full_time * 1e3:>10.1f} ms")
+    print(
+        f"change set:   {len(payload) / 1e6:>8.2f} MB {transfer_time * 1e3:>10.1f} ms"
+        f" (+ diff {diff_time * 1e3:.1f} ms, apply {apply_time * 1e3:.1f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+Benchmark suite with stored baselines and regression gates.
+
+Measures the throughput (operations per second) and allocations (bytes
+allocated per operation) of the core creation and serialization paths:
+the race and character factories, direct ``Character`` validation, JSON
+serialization and parsing, list serialization with and without cached
+fragments, and the import time of ``anvil_engine`` up to its first use.
+
+Results can be saved as a JSON baseline and later runs compared against
+it; the run fails with exit status 1 if any benchmark is slower, or
+allocates more, than the baseline by more than the threshold. Allocations
+may also grow by ``ALLOCATION_SLACK`` bytes whatever the threshold, so a
+few bytes more per operation from a new interpreter or pydantic version
+do not fail operations that allocate little.
+
+The committed ``benchmarks/baseline.json`` gates allocations in the test
+suite (``pytest -m slow``); throughput baselines depend on the machine,
+so record your own before comparing them.
+
+Usage:
+    poetry run python -m benchmarks.suite --save baseline.json
+    poetry run python -m benchmarks.suite --compare baseline.json --threshold 0.2
+"""
+
+import argparse
+import gc
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from anvil_engine.factories import CharacterFactory, RaceFactory, RaceRegistry
+from anvil_engine.models import Character
+from anvil_engine.models.serialization import dump_characters_json
+
+DEFAULT_THRESHOLD = 0.25
+ALLOCATION_SLACK = 256
+"""Bytes per operation an allocation may always grow by before regressing."""
+ALLOCATION_SAMPLES = 1_000
+IMPORT_SAMPLES = 5
+COLD_RACE_REGISTRY_SIZE = 16
+IMPORT_BENCHMARK = "import anvil_engine + first use"
+LIST_SIZE = 1_000
+"""Characters per list serialization benchmark."""
+
+
+def build_cases() -> dict[str, Callable[[], object]]:
+    """
+    Build the benchmarked operations, keyed by benchmark name.
+
+    Returns:
+        dict[str, Callable[[], object]]: Callables performing one operation.
+    """
+    race_factory = RaceFactory()
+    character_factory = CharacterFactory()
+    race = race_factory.create_elf()
+    archer = character_factory.create_archer("Legolas", 2931, "male", race)
+    data = archer.model_dump()
+    data["race"] = race
+    attributes = dict(archer.attributes)
+    archer_json = archer.model_dump_json()
+    roster = [
+        character_factory.create_archer(f"Archer {i}", 18 + i % 60, "female", race)
+        for i in range(LIST_SIZE)
+    ]
+    roster_adapter = TypeAdapter(list[Character])
+    # A new race each time, so that validation is timed, not a registry hit.
+    # The small registry is always full, so every run measures evictions too.
+    race_numbers = itertools.count()
+    cold_race_factory = RaceFactory(RaceRegistry(maxsize=COLD_RACE_REGISTRY_SIZE))
+
+    return {
+        "race_factory.create_human": race_factory.create_human,
+        "race_factory.create_elf": race_factory.create_elf,
+        "race_factory.create_race": lambda: cold_race_factory.create_race(
+            name=f"Dwarf clan {next(race_numbers)}",
+            description="Stout and stubborn mountain folk",
+            base_attributes={"strength": 12, "constitution": 12},
+        ),
+        "character_factory.create_archer": lambda: character_factory.create_archer(
+            "Legolas", 2931, "male", race
+        ),
+        "character_factory.create_warrior": lambda: character_factory.create_warrior(
+            "Gimli", 139, "male", race
+        ),
+        "character_factory.create_character": lambda: (
+            character_factory.create_character(
+                "Legolas", 2931, "male", attributes, race
+            )
+        ),
+        "Character(...)": lambda: Character(**data),
+        "Character.model_dump_json": archer.model_dump_json,
+        "Character.model_validate_json": lambda: Character.model_validate_json(
+            archer_json
+        ),
+        f"list[Character] dump_json ({LIST_SIZE})": lambda: roster_adapter.dump_json(
+            roster
+        ),
+        f"dump_characters_json ({LIST_SIZE})": lambda: dump_characters_json(roster),
+    }
+
+
+def ops_per_second(run: Callable[[], object], repeat: int) -> float:
+    """
+    Measure the best throughput of ``run`` over several repetitions.
+
+    Args:
+        run (Callable[[], object]): Performs one operation.
+        repeat (int): The number of timed repetitions.
+
+    Returns:
+        float: The best observed number of operations per second.
+    """
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    return number / min(timer.repeat(repeat=repeat, number=number))
+
+
+def bytes_per_operation(run: Callable[[], object]) -> float:
+    """
+    Measure the memory allocated by one operation, including its result.
+
+    Args:
+        run (Callable[[], object]): Performs one operation.
+
+    Returns:
+        float: The peak traced memory of ``ALLOCATION_SAMPLES`` operations,
+            whose results are kept alive, divided by their number.
+    """
+    run()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        results = [run() for _ in range(ALLOCATION_SAMPLES)]
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del results
+    return (peak - start) / ALLOCATION_SAMPLES
+
+
+def import_time() -> float:
+    """
+    Measure the cold import time of ``anvil_engine`` in a fresh interpreter.
+
+    Exports are imported lazily, so the time includes the first access to
+    the factories and models rather than only the package stub.
+
+    Returns:
+        float: The best observed time in seconds to import ``anvil_engine``
+            and access ``CharacterFactory``, ``RaceFactory`` and ``Character``.
+    """
+    best = float("inf")
+    for _ in range(IMPORT_SAMPLES):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import time; start = time.perf_counter(); import anvil_engine; "
+                "anvil_engine.CharacterFactory, anvil_engine.RaceFactory, "
+                "anvil_engine.Character; print(time.perf_counter() - start)",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        best = min(best, float(output))
+    return best
+
+
+def run_suite(repeat: int, selected: str | None = None) -> dict[str, dict[str, float]]:
+    """
+    Run every benchmark.
+
+    Args:
+        repeat (int): The number of timed repetitions per benchmark.
+        selected (str | None): Only run benchmarks whose name contains it.
+
+    Returns:
+        dict[str, dict[str, float]]: The ``ops_per_sec`` and ``bytes_per_op``
+            of each benchmark, keyed by name.
+    """
+    results = {}
+    for name, run in build_cases().items():
+        if selected and selected not in name:
+            continue
+        results[name] = {
+            "ops_per_sec": ops_per_second(run, repeat),
+            "bytes_per_op": bytes_per_operation(run),
+        }
+    if not selected or selected in IMPORT_BENCHMARK:
+        results[IMPORT_BENCHMARK] = {
+            "ops_per_sec": 1 / import_time(),
+            "bytes_per_op": 0.0,
+        }
+    return results
+
+
+def find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+    metrics: tuple[str, ...] = ("ops_per_sec", "bytes_per_op"),
+) -> list[str]:
+    """
+    Compare results with a baseline.
+
+    Args:
+        results (dict[str, dict[str, float]]): The current results.
+        baseline (dict[str, dict[str, float]]): The baseline results.
+        threshold (float): The tolerated relative change, e.g. 0.25 for 25%.
+            Allocations may grow by at least ``ALLOCATION_SLACK`` bytes.
+        metrics (tuple[str, ...]): The compared metrics. Throughput depends on
+            the machine, while allocations only depend on the code and the
+            library versions.
+
+    Returns:
+        list[str]: A description of every regression.
+    """
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if "ops_per_sec" in metrics:
+            floor = reference["ops_per_sec"] * (1 - threshold)
+            if current["ops_per_sec"] < floor:
+                regressions.append(
+                    f"{name}: {current['ops_per_sec']:,.0f} ops/s "
+                    f"(baseline {reference['ops_per_sec']:,.0f})"
+                )
+        if "bytes_per_op" in metrics:
+            ceiling = reference["bytes_per_op"] + max(
+                reference["bytes_per_op"] * threshold, ALLOCATION_SLACK
+            )
+            if current["bytes_per_op"] > ceiling:
+                regressions.append(
+                    f"{name}: {current['bytes_per_op']:,.0f} B/op "
+                    f"(baseline {reference['bytes_per_op']:,.0f})"
+                )
+    return regressions
+
+
+def environment() -> dict[str, Any]:
+    """Describe the interpreter and libraries the results were measured with."""
+    return {
+        "python": platform.python_version(),
+        "pydantic": version("pydantic"),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", help="Only run benchmarks containing this text")
+    parser.add_argument("--save", type=Path, help="Write the results to this file")
+    parser.add_argument("--compare", type=Path, help="Baseline file to compare to")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    results = run_suite(args.repeat, args.filter)
+    baseline = json.loads(args.compare.read_text())["results"] if args.compare else {}
+
+    print(f"{'benchmark':<36}{'ops/s':>14}{'B/op':>10}{'vs baseline':>14}")
+    for name, current in results.items():
+        reference = baseline.get(name)
+        change = (
+            f"{current['ops_per_sec'] / reference['ops_per_sec'] - 1:+.1%}"
+            if reference
+            else ""
+        )
+        print(
+            f"{name:<36}{current['ops_per_sec']:>14,.0f}"
+            f"{current['bytes_per_op']:>10,.0f}{change:>14}"
+        )
+
+    if args.save:
+        args.save.write_text(
+            json.dumps({"environment": environment(), "results": results}, indent=2)
+            + "\n"
+        )
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    if regressions:
+        print(f"\nRegressions beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Throughput benchmark for the factories' validation modes.
+
+Measures characters created per second by ``CharacterFactory`` in the
+``strict``, ``lax`` and ``trusted`` validation modes, both one at a time
+with ``create_character`` and in bulk with ``create_characters``.
+
+Usage:
+    poetry run python -m benchmarks.validation_modes --count 100000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from anvil_engine.factories import CharacterFactory, RaceFactory, ValidationMode
+
+
+def throughput(run: Callable[[], object], count: int, repeat: int) -> float:
+    """
+    Measure the best throughput of ``run`` over several repetitions.
+
+    Args:
+        run (Callable[[], object]): Creates ``count`` characters.
+        count (int): The number of characters created by one call of ``run``.
+        repeat (int): The number of repetitions.
+
+    Returns:
+        float: The best observed number of characters created per second.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    race = RaceFactory().create_human()
+    template = CharacterFactory().create_warrior("Warrior", 30, "male", race)
+    rows = [
+        {**template.model_dump(exclude={"race"}), "name": f"Warrior {i}", "race": race}
+        for i in range(args.count)
+    ]
+
+    print(f"{'mode':<10}{'single (chars/s)':>20}{'batch (chars/s)':>20}")
+    for mode in ValidationMode:
+        factory = CharacterFactory(validation_mode=mode)
+        single = throughput(
+            lambda factory=factory: [factory.create_character(**row) for row in rows],
+            args.count,
+            args.repeat,
+        )
+        batch = throughput(
+            lambda factory=factory: factory.create_characters(rows),
+            args.count,
+            args.repeat,
+        )
+        print(f"{mode.value:<10}{single:>20,.0f}{batch:>20,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+World restart benchmark: snapshot plus log tail against a validated rebuild.
+
+Fills a world store with generated characters, snapshots it, then logs a
+tail of updates and deletions. Compares reopening the store, which maps
+the snapshot, replays the tail and optionally hydrates every snapshot
+character without validation, with rebuilding every character from plain
+rows through the validating factory.
+
+Usage:
+    poetry run python -m benchmarks.world_restart --count 1000000 --tail 10000
+"""
+
+import argparse
+import tempfile
+import time
+
+from anvil_engine.factories import CharacterFactory, apply_delta
+from anvil_engine.generation import generate_characters
+from anvil_engine.persistence import WorldStore
+
+BATCH_SIZE = 10_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--tail", type=int, default=10_000)
+    args = parser.parse_args()
+
+    characters = generate_characters(args.count, seed=1).to_characters()
+    with tempfile.TemporaryDirectory() as directory:
+        with WorldStore(directory, snapshot_every=None) as world:
+            start = time.perf_counter()
+            for offset in range(0, len(characters), BATCH_SIZE):
+                batch = characters[offset : offset + BATCH_SIZE]
+                world.put_many(enumerate(batch, offset))
+            world.sync()
+            log_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            world.snapshot()
+            snapshot_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for key in range(args.tail // 2):
+                world.put(key, apply_delta(characters[key], {"strength": 1}))
+            for key in range(args.tail // 2, args.tail):
+                world.delete(key)
+            world.sync()
+            tail_time = time.perf_counter() - start
+
+        restart_times = {}
+        for hydrate in (False, True):
+            start = time.perf_counter()
+            with WorldStore(directory, hydrate=hydrate) as world:
+                restart_times[hydrate] = time.perf_counter() - start
+                assert len(world) == args.count - (args.tail - args.tail // 2)
+
+    rows = [
+        {
+            "name": character.get_name(),
+            "age": character.get_age(),
+            "gender": character.get_gender(),
+            "attributes": character.get_attributes(),
+            "race": character.get_race(),
+        }
+        for character in characters
+    ]
+    start = time.perf_counter()
+    CharacterFactory().create_characters(rows).raise_for_errors()
+    rebuild_time = time.perf_counter() - start
+
+    print(f"{args.count:,} characters, {args.tail:,} logged changes after the snapshot")
+    print(f"logging:   {args.count / log_time:>12,.0f} puts/s")
+    print(f"tail:      {args.tail / tail_time:>12,.0f} single changes/s")
+    print(f"snapshot:  {snapshot_time:>12.2f} s")
+    print(f"rebuild:   {rebuild_time:>12.2f} s validated from rows")
+    for hydrate, label in ((False, "restart"), (True, "hydrated")):
+        restart_time = restart_times[hydrate]
+        print(
+            f"{label + ':':<10} {restart_time:>12.2f} s"
+            f" (speedup {rebuild_time / restart_time:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,9 @@ Main Components:
 - Models: Concrete implementations of characters and races
 - Factories: Factory classes for creating different types of entities
 
+Exported names are imported lazily on first access, so importing the package
+itself does not load pydantic or build any model.
+
 Example Usage:
     from anvil_engine.factories import CharacterFactory, RaceFactory
     from anvil_engine.models import Character, Race
@@ -25,14 +28,33 @@ Example Usage:
     warrior = char_factory.create_warrior("Aragorn", 87, "male", human)
 """
 
-from .factories import CharacterFactory, RaceFactory
-from .interfaces import (
-    CharacterFactoryInterface,
-    CharacterInterface,
-    RaceFactoryInterface,
-    RaceInterface,
+from typing import TYPE_CHECKING
+
+from anvil_engine._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .factories import CharacterFactory, RaceFactory
+    from .interfaces import (
+        CharacterFactoryInterface,
+        CharacterInterface,
+        RaceFactoryInterface,
+        RaceInterface,
+    )
+    from .models import Character, Race
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Character": ".models",
+        "CharacterFactory": ".factories",
+        "CharacterFactoryInterface": ".interfaces",
+        "CharacterInterface": ".interfaces",
+        "Race": ".models",
+        "RaceFactory": ".factories",
+        "RaceFactoryInterface": ".interfaces",
+        "RaceInterface": ".interfaces",
+    },
 )
-from .models import Character, Race
 
 __version__ = "0.1.0"
 __author__ = "Lucas Moragas"
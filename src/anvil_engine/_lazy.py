@@ -0,0 +1,39 @@
+import sys
+from collections.abc import Callable, Mapping
+from importlib import import_module
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` importing exports lazily.
+
+    A package assigning them defers importing each exported name's module,
+    and whatever that module depends on (pydantic, NumPy, ...), until the
+    name is first accessed. The value is then cached in the package's
+    namespace, so later accesses are plain attribute lookups.
+
+    Args:
+        package (str): The package's ``__name__``.
+        exports (Mapping[str, str]): The module defining each exported name,
+            relative to the package, e.g. ``{"Race": ".race"}``.
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]: The package's
+            ``__getattr__`` and ``__dir__``.
+    """
+
+    def getattr_(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def dir_() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *exports})
+
+    return getattr_, dir_
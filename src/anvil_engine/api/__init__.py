@@ -0,0 +1,18 @@
+"""
+API module for the Anvil Engine RPG system.
+
+This module exposes the race and character factories over HTTP with
+FastAPI, including batch creation, a cached race catalog and NDJSON
+streaming of generated rosters. Run it with:
+
+    uvicorn anvil_engine.api:app
+"""
+
+from .app import create_app
+
+app = create_app()
+
+__all__ = [
+    "app",
+    "create_app",
+]
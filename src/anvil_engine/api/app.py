@@ -0,0 +1,258 @@
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from functools import cache
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Any
+
+from fastapi import FastAPI, Query, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json, to_json
+
+from anvil_engine.factories import (
+    AsyncCharacterFactory,
+    AsyncRaceFactory,
+    BatchResult,
+    CharacterFactory,
+    RaceFactory,
+    RowError,
+    ValidationMode,
+)
+from anvil_engine.models.serialization import dump_characters_json, dump_races_json
+
+if TYPE_CHECKING:
+    from anvil_engine.models import Character, Race
+
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+MAX_STREAMED_CHARACTERS = 1_000_000
+STREAM_CHUNK_SIZE = 1_000
+
+
+@cache
+def _row_error_list_adapter() -> TypeAdapter[list[RowError]]:
+    return TypeAdapter(list[RowError])
+
+
+def _json_response(content: bytes, status_code: int = 200) -> Response:
+    return Response(content, status_code=status_code, media_type=JSON_MEDIA_TYPE)
+
+
+def _error_response(error: Exception) -> Response:
+    """
+    Build a 422 response describing why an entity could not be created.
+
+    Args:
+        error (Exception): The error raised by a factory.
+
+    Returns:
+        Response: A JSON response with the validation error details.
+    """
+    cause = error.__cause__
+    if isinstance(cause, ValidationError):
+        detail = cause.errors(include_url=False, include_input=False)
+    else:
+        detail = str(error)
+    return _json_response(to_json({"detail": detail}, fallback=str), 422)
+
+
+def _batch_response[T](
+    result: BatchResult[T], dump_items: Callable[[list[T]], bytes]
+) -> Response:
+    """
+    Serialize a batch result as ``{"items": [...], "errors": [...]}``.
+
+    Args:
+        result (BatchResult[T]): The batch result to serialize.
+        dump_items (Callable[[list[T]], bytes]): Serializes the created items
+            as a JSON array.
+
+    Returns:
+        Response: The JSON response, with status 200 if every row was created
+            and 207 otherwise.
+    """
+    content = b"".join(
+        (
+            b'{"items":',
+            dump_items(result.items),
+            b',"errors":',
+            _row_error_list_adapter().dump_json(result.errors, fallback=str),
+            b"}",
+        )
+    )
+    return _json_response(content, 200 if result.ok else 207)
+
+
+async def _read_json(request: Request) -> Any:
+    """
+    Parse the request body directly with pydantic's JSON parser.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        Any: The decoded JSON document.
+
+    Raises:
+        ValueError: If the body is not valid JSON.
+    """
+    return from_json(await request.body())
+
+
+def create_app(
+    race_factory: RaceFactory | None = None,
+    character_factory: CharacterFactory | None = None,
+) -> FastAPI:
+    """
+    Create the HTTP application exposing the race and character factories.
+
+    Endpoints parse request bodies and serialize responses with pydantic's
+    JSON support directly, bypassing FastAPI's ``jsonable_encoder``, to keep
+    per-request overhead low. Races and characters are encoded once and their
+    cached JSON is spliced into responses. Batch endpoints validate on a
+    bounded thread pool so large batches do not stall concurrent requests.
+
+    Args:
+        race_factory (RaceFactory | None): The factory creating races.
+        character_factory (CharacterFactory | None): The factory creating
+            characters.
+
+    Returns:
+        FastAPI: The configured application.
+    """
+    race_factory = race_factory or RaceFactory()
+    character_factory = character_factory or CharacterFactory()
+    async_race_factory = AsyncRaceFactory(race_factory)
+    async_character_factory = AsyncCharacterFactory(character_factory)
+    catalog: dict[str, Race] = {
+        "human": race_factory.create_human(),
+        "elf": race_factory.create_elf(),
+    }
+    catalog_json = to_json({key: race.model_dump() for key, race in catalog.items()})
+    catalog_etag = f'"{blake2b(catalog_json, digest_size=8).hexdigest()}"'
+    class_builders: dict[str, Callable[..., Character]] = {
+        "archer": character_factory.create_archer,
+        "warrior": character_factory.create_warrior,
+    }
+
+    def resolve_race(row: Any) -> Any:
+        """Replace a race given by catalog key with the catalog race."""
+        if isinstance(row, Mapping) and isinstance(row.get("race"), str):
+            race = catalog.get(row["race"].lower())
+            if race is not None:
+                return {**row, "race": race}
+        return row
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        async with async_race_factory, async_character_factory:
+            yield
+
+    app = FastAPI(
+        title="Anvil Engine",
+        description="RPG character and race creation service.",
+        lifespan=lifespan,
+    )
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+    @app.get("/races")
+    async def list_races(request: Request) -> Response:
+        """List the built-in race catalog, keyed by race key."""
+        if request.headers.get("if-none-match") == catalog_etag:
+            return Response(status_code=304, headers={"ETag": catalog_etag})
+        response = _json_response(catalog_json)
+        response.headers["ETag"] = catalog_etag
+        response.headers["Cache-Control"] = "public, max-age=3600"
+        return response
+
+    @app.get("/races/{key}")
+    async def get_race(key: str) -> Response:
+        """Get a single race from the built-in catalog."""
+        race = catalog.get(key.lower())
+        if race is None:
+            return _json_response(b'{"detail":"Race not found"}', 404)
+        return _json_response(race.json_bytes())
+
+    @app.post("/races", status_code=201)
+    async def create_race(request: Request) -> Response:
+        """Create a custom race from a JSON object."""
+        try:
+            data = await _read_json(request)
+            race = race_factory.create_race(**data)
+        except (TypeError, ValueError) as e:
+            return _error_response(e)
+        return _json_response(race.json_bytes(), 201)
+
+    @app.post("/races/batch")
+    async def create_races(request: Request) -> Response:
+        """Create many custom races from a JSON array."""
+        try:
+            rows = await _read_json(request)
+        except ValueError as e:
+            return _error_response(e)
+        if not isinstance(rows, list):
+            return _error_response(ValueError("Expected a JSON array of races"))
+        result = await async_race_factory.create_races(rows)
+        return _batch_response(result, dump_races_json)
+
+    @app.post("/characters", status_code=201)
+    async def create_character(request: Request) -> Response:
+        """
+        Create a custom character from a JSON object.
+
+        The ``race`` may be a catalog key such as ``"elf"`` or a race object.
+        """
+        try:
+            data = resolve_race(await _read_json(request))
+            character = character_factory.create_character(**data)
+        except (TypeError, ValueError) as e:
+            return _error_response(e)
+        return _json_response(character.json_bytes(), 201)
+
+    @app.post("/characters/batch")
+    async def create_characters(request: Request) -> Response:
+        """Create many custom characters from a JSON array."""
+        try:
+            rows = await _read_json(request)
+        except ValueError as e:
+            return _error_response(e)
+        if not isinstance(rows, list):
+            return _error_response(ValueError("Expected a JSON array of characters"))
+        result = await async_character_factory.create_characters(
+            resolve_race(row) for row in rows
+        )
+        return _batch_response(result, dump_characters_json)
+
+    @app.get("/characters/stream")
+    async def stream_characters(
+        character_class: str = Query("warrior", alias="class"),
+        race: str = "human",
+        count: int = Query(1_000, ge=1, le=MAX_STREAMED_CHARACTERS),
+    ) -> Response:
+        """Stream a generated roster as newline-delimited JSON."""
+        build = class_builders.get(character_class.lower())
+        race_instance = catalog.get(race.lower())
+        if build is None or race_instance is None:
+            return _json_response(b'{"detail":"Unknown class or race"}', 404)
+
+        async def lines() -> AsyncIterator[bytes]:
+            name = character_class.title()
+            template = build(name, 18, "female", race_instance)
+            trusted = CharacterFactory(validation_mode=ValidationMode.TRUSTED)
+            for start in range(0, count, STREAM_CHUNK_SIZE):
+                chunk = [
+                    trusted.create_character(
+                        f"{name} {i}",
+                        18 + i % 60,
+                        "female" if i % 2 else "male",
+                        template.attributes,
+                        race_instance,
+                    ).json_bytes()
+                    for i in range(start, min(start + STREAM_CHUNK_SIZE, count))
+                ]
+                yield b"\n".join(chunk) + b"\n"
+
+        return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
+
+    return app
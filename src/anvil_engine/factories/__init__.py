@@ -4,13 +4,73 @@ Factories module for the Anvil Engine RPG system.
 This module contains factory classes that implement the Factory pattern
 for creating characters and races. These factories provide both generic
 creation methods and specialized methods for common character types
-and races with predefined attributes.
+and races with predefined attributes, plus opt-in instrumentation
+recording call counts, latencies and errors of every factory method.
+Class and race templates can also be loaded from TOML or JSON files
+into a hot-reloadable TemplateRegistry, asyncio applications can
+create batches off the event loop with the async factories, and
+attribute deltas can be applied copy-on-write with an optional
+append-only ChangeLog.
 """
 
-from .character_factory import CharacterFactory
-from .race_factory import RaceFactory
+from typing import TYPE_CHECKING
+
+from anvil_engine._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .async_factory import AsyncCharacterFactory, AsyncRaceFactory
+    from .batch import BatchResult, RowError
+    from .character_factory import CharacterFactory
+    from .instrumentation import (
+        MetricsRegistry,
+        disable_instrumentation,
+        enable_instrumentation,
+    )
+    from .race_factory import RaceFactory
+    from .race_registry import RaceRegistry
+    from .templates import ClassTemplate, TemplateRegistry
+    from .updates import AttributeChange, ChangeLog, apply_delta, apply_deltas
+    from .validation import ValidationMode
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncCharacterFactory": ".async_factory",
+        "AsyncRaceFactory": ".async_factory",
+        "AttributeChange": ".updates",
+        "BatchResult": ".batch",
+        "ChangeLog": ".updates",
+        "CharacterFactory": ".character_factory",
+        "ClassTemplate": ".templates",
+        "MetricsRegistry": ".instrumentation",
+        "RaceFactory": ".race_factory",
+        "RaceRegistry": ".race_registry",
+        "RowError": ".batch",
+        "TemplateRegistry": ".templates",
+        "ValidationMode": ".validation",
+        "apply_delta": ".updates",
+        "apply_deltas": ".updates",
+        "disable_instrumentation": ".instrumentation",
+        "enable_instrumentation": ".instrumentation",
+    },
+)
 
 __all__ = [
+    "AsyncCharacterFactory",
+    "AsyncRaceFactory",
+    "AttributeChange",
+    "BatchResult",
+    "ChangeLog",
     "CharacterFactory",
+    "ClassTemplate",
+    "MetricsRegistry",
     "RaceFactory",
+    "RaceRegistry",
+    "RowError",
+    "TemplateRegistry",
+    "ValidationMode",
+    "apply_delta",
+    "apply_deltas",
+    "disable_instrumentation",
+    "enable_instrumentation",
 ]
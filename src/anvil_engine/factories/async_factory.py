@@ -0,0 +1,372 @@
+import asyncio
+import contextlib
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, Self
+
+from anvil_engine.factories.batch import BatchResult, RowError
+from anvil_engine.factories.character_factory import CharacterFactory
+from anvil_engine.factories.race_factory import RaceFactory
+from anvil_engine.models import Character, Race
+
+DEFAULT_CHUNK_SIZE = 1_000
+"""Rows validated per executor call; bounds how long one call holds a worker."""
+
+DEFAULT_INLINE_ROWS = 32
+"""Batches up to this size are validated on the event loop, skipping the hop."""
+
+
+class _AsyncBatchRunner:
+    """
+    Runs factory batches on a bounded executor, one chunk at a time.
+
+    Every executor call holds one permit of a semaphore until the worker has
+    actually finished, even if the awaiting task was cancelled, so at most
+    ``max_concurrency`` chunks ever occupy the executor and further callers
+    wait on the event loop instead of queueing unbounded work. Because permits
+    are taken per chunk rather than per batch, a small request waits for at
+    most one chunk of a bulk job, keeping its latency flat.
+
+    The private executor and the semaphore are created when the runner is
+    entered or first used, and dropped by ``close()``, so a runner can be
+    entered again, e.g. by every lifespan of an application, on a new loop.
+    """
+
+    def __init__(
+        self,
+        executor: Executor | None,
+        max_concurrency: int,
+        chunk_size: int,
+        inline_rows: int,
+    ):
+        """
+        Create a runner.
+
+        Args:
+            executor (Executor | None): The executor running the chunks.
+                Defaults to a private thread pool of ``max_concurrency`` workers,
+                shut down by ``close()`` and recreated when reopened.
+            max_concurrency (int): The maximum number of chunks in flight.
+            chunk_size (int): The maximum number of rows per executor call.
+            inline_rows (int): Batches of at most this many rows are run
+                directly on the event loop.
+
+        Raises:
+            ValueError: If ``max_concurrency`` or ``chunk_size`` is not positive.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self._owns_executor = executor is None
+        self._executor = executor
+        self._semaphore: asyncio.Semaphore | None = None
+        self._max_concurrency = max_concurrency
+        self._chunk_size = chunk_size
+        self._inline_rows = inline_rows
+
+    def _open(self) -> tuple[Executor, asyncio.Semaphore]:
+        """
+        Create the private executor and the semaphore unless already open.
+
+        Returns:
+            tuple[Executor, asyncio.Semaphore]: The executor and the semaphore.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrency, thread_name_prefix="anvil-factory"
+            )
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._executor, self._semaphore
+
+    async def _offload[T](self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a function on the executor once a permit is available.
+
+        Args:
+            func (Callable[..., T]): The function to run.
+            *args (Any): Its arguments.
+
+        Returns:
+            T: The function's result.
+        """
+        executor, semaphore = self._open()
+        await semaphore.acquire()
+        loop = asyncio.get_running_loop()
+        try:
+            future = executor.submit(func, *args)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        def release(_: object) -> None:
+            # Runs in the worker thread, or on the loop if cancelled before start.
+            # A closed loop raises RuntimeError, but then nobody awaits a permit.
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(semaphore.release)
+
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future, loop=loop)
+
+    async def run_batch[T](
+        self, create: Callable[[Sequence[Any]], BatchResult[T]], rows: Sequence[Any]
+    ) -> BatchResult[T]:
+        """
+        Run a batch creation method, chunking large batches.
+
+        Args:
+            create (Callable[[Sequence[Any]], BatchResult[T]]): The factory's
+                batch creation method.
+            rows (Sequence[Any]): The raw rows.
+
+        Returns:
+            BatchResult[T]: The created items in input order and one error
+                report per invalid row, indexed relative to ``rows``.
+        """
+        if len(rows) <= self._inline_rows:
+            return create(rows)
+        result: BatchResult[T] = BatchResult()
+        for start in range(0, len(rows), self._chunk_size):
+            chunk = await self._offload(create, rows[start : start + self._chunk_size])
+            result.items.extend(chunk.items)
+            result.errors.extend(
+                RowError(error.index + start, error.errors) for error in chunk.errors
+            )
+        return result
+
+    def close(self) -> None:
+        """Shut down the private executor, dropping chunks not yet started."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._semaphore = None
+
+    async def __aenter__(self) -> Self:
+        self._open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class AsyncCharacterFactory(_AsyncBatchRunner):
+    """
+    Asyncio front end of a CharacterFactory.
+
+    Batch creation is validated on a bounded executor in chunks, so a large
+    batch does not block the event loop and concurrent small requests keep a
+    flat latency. Single characters take microseconds to validate and are
+    created directly on the event loop.
+
+    Cancelling a batch stops it before its next chunk; the chunk already
+    running finishes in the background and its result is discarded.
+
+    Example:
+        async with AsyncCharacterFactory() as factory:
+            result = await factory.create_characters(rows)
+    """
+
+    def __init__(
+        self,
+        factory: CharacterFactory | None = None,
+        executor: Executor | None = None,
+        max_concurrency: int = 4,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        inline_rows: int = DEFAULT_INLINE_ROWS,
+    ):
+        """
+        Create an async character factory.
+
+        Args:
+            factory (CharacterFactory | None): The factory doing the work.
+            executor (Executor | None): The executor running batch chunks.
+                Defaults to a private thread pool of ``max_concurrency``
+                workers, shut down by ``close()`` and recreated when reopened.
+            max_concurrency (int): The maximum number of chunks in flight;
+                further batches wait for a permit.
+            chunk_size (int): The maximum number of rows per executor call.
+            inline_rows (int): Batches of at most this many rows are
+                validated directly on the event loop.
+        """
+        super().__init__(executor, max_concurrency, chunk_size, inline_rows)
+        self._factory = factory or CharacterFactory()
+
+    @property
+    def factory(self) -> CharacterFactory:
+        """CharacterFactory: The factory doing the work."""
+        return self._factory
+
+    async def create_character(
+        self, name: str, age: int, gender: str, attributes: dict[str, int], race: Race
+    ) -> Character:
+        """
+        Create a custom character with specified attributes.
+
+        Args:
+            name (str): The character's name.
+            age (int): The character's age in years.
+            gender (str): The character's gender.
+            attributes (dict[str, int]): Dictionary of attribute scores.
+            race (Race): The character's race object.
+
+        Returns:
+            Character: A new character instance.
+
+        Raises:
+            ValueError: If the character is invalid.
+        """
+        return self._factory.create_character(name, age, gender, attributes, race)
+
+    async def create_characters(
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> BatchResult[Character]:
+        """
+        Create many custom characters off the event loop.
+
+        Args:
+            rows (Iterable[Mapping[str, Any]]): Rows holding the ``name``,
+                ``age``, ``gender``, ``attributes`` and ``race`` of each
+                character. ``race`` may be a Race or a raw race mapping.
+
+        Returns:
+            BatchResult[Character]: The created characters and one error report
+                per invalid row.
+        """
+        return await self.run_batch(self._factory.create_characters, list(rows))
+
+    async def create_archer(
+        self, name: str, age: int, gender: str, race: Race
+    ) -> Character:
+        """
+        Create an archer character.
+
+        Args:
+            name (str): The character's name.
+            age (int): The character's age in years.
+            gender (str): The character's gender.
+            race (Race): The character's race object.
+
+        Returns:
+            Character: A new archer character.
+        """
+        return self._factory.create_archer(name, age, gender, race)
+
+    async def create_warrior(
+        self, name: str, age: int, gender: str, race: Race
+    ) -> Character:
+        """
+        Create a warrior character.
+
+        Args:
+            name (str): The character's name.
+            age (int): The character's age in years.
+            gender (str): The character's gender.
+            race (Race): The character's race object.
+
+        Returns:
+            Character: A new warrior character.
+        """
+        return self._factory.create_warrior(name, age, gender, race)
+
+
+class AsyncRaceFactory(_AsyncBatchRunner):
+    """
+    Asyncio front end of a RaceFactory.
+
+    Batch creation is validated on a bounded executor in chunks, like
+    ``AsyncCharacterFactory``; single races are created on the event loop.
+
+    Example:
+        async with AsyncRaceFactory() as factory:
+            result = await factory.create_races(rows)
+    """
+
+    def __init__(
+        self,
+        factory: RaceFactory | None = None,
+        executor: Executor | None = None,
+        max_concurrency: int = 4,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        inline_rows: int = DEFAULT_INLINE_ROWS,
+    ):
+        """
+        Create an async race factory.
+
+        Args:
+            factory (RaceFactory | None): The factory doing the work.
+            executor (Executor | None): The executor running batch chunks.
+                Defaults to a private thread pool of ``max_concurrency``
+                workers, shut down by ``close()`` and recreated when reopened.
+            max_concurrency (int): The maximum number of chunks in flight;
+                further batches wait for a permit.
+            chunk_size (int): The maximum number of rows per executor call.
+            inline_rows (int): Batches of at most this many rows are
+                validated directly on the event loop.
+        """
+        super().__init__(executor, max_concurrency, chunk_size, inline_rows)
+        self._factory = factory or RaceFactory()
+
+    @property
+    def factory(self) -> RaceFactory:
+        """RaceFactory: The factory doing the work."""
+        return self._factory
+
+    async def create_race(
+        self, name: str, description: str, base_attributes: dict[str, int]
+    ) -> Race:
+        """
+        Create a custom race with specified attributes.
+
+        Args:
+            name (str): The race name.
+            description (str): The race description.
+            base_attributes (dict[str, int]): Dictionary of base attribute values.
+
+        Returns:
+            Race: The canonical race instance.
+
+        Raises:
+            ValueError: If the race is invalid.
+        """
+        return self._factory.create_race(name, description, base_attributes)
+
+    async def create_races(
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> BatchResult[Race]:
+        """
+        Create many custom races off the event loop.
+
+        Args:
+            rows (Iterable[Mapping[str, Any]]): Rows holding the ``name``,
+                ``description`` and ``base_attributes`` of each race.
+
+        Returns:
+            BatchResult[Race]: The created races and one error report per
+                invalid row.
+        """
+        return await self.run_batch(self._factory.create_races, list(rows))
+
+    async def create_human(self) -> Race:
+        """
+        Get the human race.
+
+        Returns:
+            Race: The shared human race instance.
+        """
+        return self._factory.create_human()
+
+    async def create_elf(self) -> Race:
+        """
+        Get the elf race.
+
+        Returns:
+            Race: The shared elf race instance.
+        """
+        return self._factory.create_elf()
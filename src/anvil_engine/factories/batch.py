@@ -0,0 +1,98 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+
+
+@dataclass(frozen=True, slots=True)
+class RowError:
+    """
+    Validation failures reported for a single row of a batch.
+
+    Attributes:
+        index (int): Position of the row in the submitted batch.
+        errors (tuple[dict[str, Any], ...]): Pydantic error details for the row.
+            Each ``loc`` is relative to the row, e.g. ``("name",)``.
+    """
+
+    index: int
+    errors: tuple[dict[str, Any], ...]
+
+
+@dataclass(slots=True)
+class BatchResult[T]:
+    """
+    Outcome of a batch creation call.
+
+    Valid rows are returned in ``items`` (in input order) while every invalid
+    row is described by one ``RowError`` in ``errors``, so a bulk import costs
+    a single validation pass instead of one exception per bad row.
+
+    Attributes:
+        items (list[T]): Successfully created instances, in input order.
+        errors (list[RowError]): One report per rejected row, sorted by index.
+    """
+
+    items: list[T] = field(default_factory=list)
+    errors: list[RowError] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every row of the batch was created successfully.
+
+        Returns:
+            bool: True if no row was rejected.
+        """
+        return not self.errors
+
+    def raise_for_errors(self) -> None:
+        """
+        Raise if any row of the batch was rejected.
+
+        Raises:
+            ValueError: Summarizing the number of rejected rows and the first one.
+        """
+        if self.errors:
+            first = self.errors[0]
+            raise ValueError(
+                f"{len(self.errors)} invalid row(s); first at index {first.index}: "
+                f"{first.errors[0]['msg']}"
+            )
+
+
+def validate_rows[T](
+    adapter: TypeAdapter[list[T]], rows: Sequence[Any], strict: bool = False
+) -> tuple[list[T | None], dict[int, list[dict[str, Any]]]]:
+    """
+    Validate a sequence of rows with a list adapter and group failures per row.
+
+    The whole batch is validated in one call. If some rows are invalid, the
+    remaining rows are validated again in a second call so that valid rows are
+    still returned.
+
+    Args:
+        adapter (TypeAdapter[list[T]]): Adapter validating a list of rows.
+        rows (Sequence[Any]): The raw rows to validate.
+        strict (bool): Whether to validate without type coercion.
+
+    Returns:
+        tuple[list[T | None], dict[int, list[dict[str, Any]]]]: The validated
+            instances aligned with ``rows`` (``None`` for rejected rows) and the
+            error details of each rejected row, keyed by row index.
+    """
+    try:
+        return list(adapter.validate_python(rows, strict=strict)), {}
+    except ValidationError as e:
+        failures: dict[int, list[dict[str, Any]]] = {}
+        for error in e.errors(include_url=False, include_input=False):
+            index, *loc = error["loc"]
+            failures.setdefault(index, []).append({**error, "loc": tuple(loc)})
+
+    valid_indexes = [i for i in range(len(rows)) if i not in failures]
+    validated: list[T | None] = [None] * len(rows)
+    valid = adapter.validate_python([rows[i] for i in valid_indexes], strict=strict)
+    for index, item in zip(valid_indexes, valid, strict=True):
+        validated[index] = item
+    return validated, failures
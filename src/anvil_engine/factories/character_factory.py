@@ -1,6 +1,61 @@
+from collections.abc import Hashable, Iterable, Mapping
+from functools import cache
+from types import MappingProxyType
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+
+from anvil_engine.factories.batch import BatchResult, RowError, validate_rows
+from anvil_engine.factories.instrumentation import instrumented
+from anvil_engine.factories.race_registry import (
+    DEFAULT_RACE_REGISTRY,
+    RaceRegistry,
+    race_key,
+)
+from anvil_engine.factories.validation import (
+    ValidationMode,
+    build_model,
+    construct_trusted,
+)
 from anvil_engine.interfaces import CharacterFactoryInterface
 from anvil_engine.models import Character, Race
 
+ARCHER_ATTRIBUTES: Mapping[str, int] = MappingProxyType(
+    {
+        "strength": 7,
+        "agility": 10,
+        "intelligence": 13,
+        "wisdom": 10,
+        "dexterity": 10,
+        "constitution": 6,
+        "charisma": 14,
+    }
+)
+"""Attribute template of archers, focused on ranged combat."""
+
+WARRIOR_ATTRIBUTES: Mapping[str, int] = MappingProxyType(
+    {
+        "strength": 15,
+        "agility": 9,
+        "intelligence": 8,
+        "wisdom": 9,
+        "dexterity": 11,
+        "constitution": 14,
+        "charisma": 4,
+    }
+)
+"""Attribute template of warriors, focused on melee combat."""
+
+CLASS_TEMPLATES: Mapping[str, Mapping[str, int]] = MappingProxyType(
+    {"archer": ARCHER_ATTRIBUTES, "warrior": WARRIOR_ATTRIBUTES}
+)
+"""Attribute templates of the built-in character classes, keyed by class name."""
+
+
+@cache
+def _character_list_adapter() -> TypeAdapter[list[Character]]:
+    return TypeAdapter(list[Character])
+
 
 class CharacterFactory(CharacterFactoryInterface):
     """
@@ -12,6 +67,33 @@ class CharacterFactory(CharacterFactoryInterface):
     character types like archers and warriors.
     """
 
+    def __init__(
+        self,
+        race_registry: RaceRegistry | None = None,
+        validation_mode: ValidationMode | str = ValidationMode.LAX,
+    ):
+        """
+        Create a character factory.
+
+        Args:
+            race_registry (RaceRegistry | None): The registry interning races
+                given as raw mappings to the batch methods. Defaults to the
+                registry shared by all factories.
+            validation_mode (ValidationMode | str): How the created characters
+                are validated: ``strict``, ``lax`` (the default) or
+                ``trusted``, which skips validation entirely.
+        """
+        self._race_registry = (
+            race_registry if race_registry is not None else DEFAULT_RACE_REGISTRY
+        )
+        self._validation_mode = ValidationMode(validation_mode)
+
+    @property
+    def validation_mode(self) -> ValidationMode:
+        """ValidationMode: How the created characters are validated."""
+        return self._validation_mode
+
+    @instrumented
     def create_character(
         self, name: str, age: int, gender: str, attributes: dict[str, int], race: Race
     ) -> Character:
@@ -29,10 +111,102 @@ class CharacterFactory(CharacterFactoryInterface):
             Character: A new character instance with the specified parameters.
         """
         try:
-            return Character(name, age, gender, attributes, race)
+            return build_model(
+                Character,
+                {
+                    "name": name,
+                    "age": age,
+                    "gender": gender,
+                    "attributes": attributes,
+                    "race": race,
+                },
+                self._validation_mode,
+            )
         except Exception as e:
             raise ValueError(f"Error creating character: {e}") from e
 
+    @instrumented
+    def create_characters(
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> BatchResult[Character]:
+        """
+        Create many custom characters in a single validation pass.
+
+        Races given as raw mappings are interned, so every row embedding the
+        same race shares one canonical Race instance.
+        Invalid rows do not raise; each one is reported in the result instead.
+        In ``trusted`` mode the rows are not validated at all.
+
+        Args:
+            rows (Iterable[Mapping[str, Any]]): Rows holding the ``name``,
+                ``age``, ``gender``, ``attributes`` and ``race`` of each
+                character. ``race`` may be a Race or a raw race mapping.
+
+        Returns:
+            BatchResult[Character]: The created characters and one error report
+                per invalid row.
+        """
+        rows = self._share_races(list(rows))
+        if self._validation_mode is ValidationMode.TRUSTED:
+            return BatchResult(
+                items=[construct_trusted(Character, row) for row in rows]
+            )
+
+        validated, failures = validate_rows(
+            _character_list_adapter(),
+            rows,
+            strict=self._validation_mode is ValidationMode.STRICT,
+        )
+        return BatchResult(
+            items=[character for character in validated if character is not None],
+            errors=[
+                RowError(i, tuple(errors)) for i, errors in sorted(failures.items())
+            ],
+        )
+
+    def _share_races(self, rows: list[Any]) -> list[Any]:
+        """
+        Replace raw race mappings with their canonical Race instance.
+
+        Races that fail validation are left untouched so that the error is
+        reported against the character row that embeds them. Rows embedding
+        the very same race mapping object resolve it only once.
+
+        Args:
+            rows (list[Any]): The raw character rows.
+
+        Returns:
+            list[Any]: The rows, with shared Race instances where possible.
+        """
+        shared: dict[Hashable, Race | None] = {}
+        # Rows hold their race mappings alive, so their ids stay unique
+        by_identity: dict[int, Race | None] = {}
+        prepared: list[Any] = []
+        for row in rows:
+            race = row.get("race") if isinstance(row, Mapping) else None
+            if race is None or isinstance(race, Race):
+                prepared.append(row)
+                continue
+            if id(race) in by_identity:
+                instance = by_identity[id(race)]
+            else:
+                key = (
+                    race_key(race, self._validation_mode)
+                    if isinstance(race, Mapping)
+                    else None
+                )
+                if key is not None and key not in shared:
+                    try:
+                        shared[key] = self._race_registry.intern(
+                            race, validation_mode=self._validation_mode
+                        )
+                    except ValidationError:
+                        shared[key] = None
+                instance = by_identity[id(race)] = shared.get(key)
+            prepared.append(row if instance is None else {**row, "race": instance})
+        return prepared
+
+    @instrumented
     def create_archer(self, name: str, age: int, gender: str, race: Race) -> Character:
         """
         Create an archer character with optimized attributes for ranged combat.
@@ -54,20 +228,13 @@ class CharacterFactory(CharacterFactoryInterface):
                 name,
                 age,
                 gender,
-                attributes={
-                    "strength": 7,
-                    "agility": 10,
-                    "intelligence": 13,
-                    "wisdom": 10,
-                    "dexterity": 10,
-                    "constitution": 6,
-                    "charisma": 14,
-                },
+                attributes=dict(ARCHER_ATTRIBUTES),
                 race=race,
             )
         except Exception as e:
             raise ValueError(f"Error creating archer: {e}") from e
 
+    @instrumented
     def create_warrior(self, name: str, age: int, gender: str, race: Race) -> Character:
         """
         Create a warrior character with optimized attributes for melee combat.
@@ -90,15 +257,7 @@ class CharacterFactory(CharacterFactoryInterface):
                 name,
                 age,
                 gender,
-                attributes={
-                    "strength": 15,
-                    "agility": 9,
-                    "intelligence": 8,
-                    "wisdom": 9,
-                    "dexterity": 11,
-                    "constitution": 14,
-                    "charisma": 4,
-                },
+                attributes=dict(WARRIOR_ATTRIBUTES),
                 race=race,
             )
         except Exception as e:
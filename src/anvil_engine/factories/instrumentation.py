@@ -0,0 +1,356 @@
+import time
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from threading import Lock
+from typing import Any
+
+from pydantic import ValidationError
+
+from anvil_engine.factories.batch import BatchResult
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    2.5e-3,
+    5e-3,
+    1e-2,
+    1e-1,
+    1.0,
+)
+"""Upper bounds in seconds of the latency histogram buckets, besides +Inf."""
+
+SpanHook = Callable[[str, dict[str, Any]], AbstractContextManager[Any]]
+"""
+Opens a span around a factory call, given the method name and attributes.
+
+With OpenTelemetry: ``lambda name, attributes: tracer.start_as_current_span(
+name, attributes=attributes)``. Exceptions raised by the call propagate
+through the span's context manager.
+"""
+
+
+@dataclass(slots=True)
+class MethodMetrics:
+    """
+    Metrics collected for one factory method.
+
+    Only outermost calls are recorded: a call made by another instrumented
+    method, such as ``create_character`` called by ``create_archer``, is
+    part of its caller's call, latency and errors.
+
+    Attributes:
+        calls (int): The number of calls.
+        errors (Counter[str]): Failed calls and rejected batch rows, by
+            error type: the pydantic error type (e.g. ``string_too_short``)
+            for validation errors, otherwise the exception class name.
+        latency_sum (float): The total duration of the calls in seconds.
+        latency_buckets (list[int]): Non-cumulative call counts per
+            ``LATENCY_BUCKETS`` bucket, the last one being +Inf.
+    """
+
+    calls: int = 0
+    errors: Counter[str] = field(default_factory=Counter)
+    latency_sum: float = 0.0
+    latency_buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+
+
+def _error_types(error: BaseException) -> list[str]:
+    """
+    Classify an error raised by a factory.
+
+    Args:
+        error (BaseException): The error, possibly wrapping a ValidationError.
+
+    Returns:
+        list[str]: The pydantic error type of each validation failure, or the
+            exception class name.
+    """
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, ValidationError):
+            return [detail["type"] for detail in cause.errors(include_url=False)]
+        cause = cause.__cause__
+    return [type(error).__name__]
+
+
+class MetricsRegistry:
+    """
+    Thread-safe, in-process store of factory call metrics.
+
+    Example:
+        registry = enable_instrumentation()
+        factory.create_warrior("Gimli", 139, "male", dwarf)
+        print(registry.snapshot()["CharacterFactory.create_warrior"]["calls"])
+        print(registry.to_prometheus())
+    """
+
+    def __init__(self, namespace: str = "anvil_factory"):
+        """
+        Create an empty registry.
+
+        Args:
+            namespace (str): The prefix of the Prometheus metric names.
+        """
+        self._namespace = namespace
+        self._methods: dict[str, MethodMetrics] = {}
+        self._lock = Lock()
+
+    def record(
+        self, method: str, duration: float, error_types: list[str] | None = None
+    ) -> None:
+        """
+        Record one call of a factory method.
+
+        Args:
+            method (str): The method name, e.g. ``CharacterFactory.create_archer``.
+            duration (float): The call's duration in seconds.
+            error_types (list[str] | None): The types of the errors the call
+                raised or reported.
+        """
+        bucket = bisect_left(LATENCY_BUCKETS, duration)
+        with self._lock:
+            metrics = self._methods.get(method)
+            if metrics is None:
+                metrics = self._methods[method] = MethodMetrics()
+            metrics.calls += 1
+            metrics.latency_sum += duration
+            metrics.latency_buckets[bucket] += 1
+            if error_types:
+                metrics.errors.update(error_types)
+
+    def reset(self) -> None:
+        """Discard every recorded metric."""
+        with self._lock:
+            self._methods.clear()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Copy the current metrics.
+
+        Returns:
+            dict[str, dict[str, Any]]: For each method, its ``calls``,
+                ``errors`` by type, ``latency_sum`` in seconds and
+                ``latency_buckets`` mapping each upper bound to its
+                non-cumulative count.
+        """
+        with self._lock:
+            return {
+                method: {
+                    "calls": metrics.calls,
+                    "errors": dict(metrics.errors),
+                    "latency_sum": metrics.latency_sum,
+                    "latency_buckets": dict(
+                        zip(
+                            (*LATENCY_BUCKETS, float("inf")),
+                            metrics.latency_buckets,
+                            strict=True,
+                        )
+                    ),
+                }
+                for method, metrics in self._methods.items()
+            }
+
+    def to_prometheus(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The ``<namespace>_calls_total``, ``<namespace>_errors_total``
+                and ``<namespace>_latency_seconds`` histogram metrics.
+        """
+        calls = f"{self._namespace}_calls_total"
+        errors = f"{self._namespace}_errors_total"
+        latency = f"{self._namespace}_latency_seconds"
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {calls} Number of factory method calls.",
+            f"# TYPE {calls} counter",
+        ]
+        lines.extend(
+            f'{calls}{{method="{method}"}} {metrics["calls"]}'
+            for method, metrics in snapshot.items()
+        )
+        lines += [
+            f"# HELP {errors} Number of factory errors by type.",
+            f"# TYPE {errors} counter",
+        ]
+        lines.extend(
+            f'{errors}{{method="{method}",error_type="{error_type}"}} {count}'
+            for method, metrics in snapshot.items()
+            for error_type, count in metrics["errors"].items()
+        )
+        lines += [
+            f"# HELP {latency} Factory method call latency.",
+            f"# TYPE {latency} histogram",
+        ]
+        for method, metrics in snapshot.items():
+            cumulative = 0
+            for bound, count in metrics["latency_buckets"].items():
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(
+                    f'{latency}_bucket{{method="{method}",le="{le}"}} {cumulative}'
+                )
+            lines.append(f'{latency}_sum{{method="{method}"}} {metrics["latency_sum"]}')
+            lines.append(f'{latency}_count{{method="{method}"}} {metrics["calls"]}')
+        return "\n".join(lines) + "\n"
+
+
+@dataclass(frozen=True, slots=True)
+class _Instrumentation:
+    registry: MetricsRegistry
+    span_hook: SpanHook | None
+
+
+_active: _Instrumentation | None = None
+_lock = Lock()
+_methods: list[tuple[type, str, Callable[..., Any]]] = []
+"""Every instrumented method as (class, attribute name, original function)."""
+_in_call: ContextVar[bool] = ContextVar("_in_call", default=False)
+"""Whether an instrumented call is in progress in the current context."""
+
+
+def enable_instrumentation(
+    registry: MetricsRegistry | None = None, span_hook: SpanHook | None = None
+) -> MetricsRegistry:
+    """
+    Start recording metrics for every instrumented factory method call.
+
+    Args:
+        registry (MetricsRegistry | None): The registry to record into.
+            Defaults to a new registry.
+        span_hook (SpanHook | None): Opens a tracing span around each call.
+
+    Returns:
+        MetricsRegistry: The registry recording the metrics.
+    """
+    global _active
+    registry = registry or MetricsRegistry()
+    with _lock:
+        if _active is None:
+            for owner, name, func in _methods:
+                setattr(owner, name, _wrap(func))
+        _active = _Instrumentation(registry, span_hook)
+    return registry
+
+
+def disable_instrumentation() -> None:
+    """Stop recording metrics and restore the original, unwrapped methods."""
+    global _active
+    with _lock:
+        if _active is not None:
+            for owner, name, func in _methods:
+                setattr(owner, name, func)
+        _active = None
+
+
+class _InstrumentedMethod:
+    """Registers a method for instrumentation when its class is created."""
+
+    def __init__(self, func: Callable[..., Any]):
+        self._func = func
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        _methods.append((owner, name, self._func))
+        setattr(owner, name, _wrap(self._func) if _active else self._func)
+
+
+def instrumented[F: Callable[..., Any]](func: F) -> F:
+    """
+    Mark a factory method to be recorded while instrumentation is enabled.
+
+    The class keeps the plain method while instrumentation is disabled, so
+    disabled instrumentation costs nothing; enabling it swaps in a wrapper.
+
+    Args:
+        func (F): The factory method.
+
+    Returns:
+        F: The method, as installed on its class.
+    """
+    return _InstrumentedMethod(func)  # type: ignore[return-value]
+
+
+def _wrap(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap a method to record its calls into the active instrumentation.
+
+    Args:
+        func (Callable[..., Any]): The method.
+
+    Returns:
+        Callable[..., Any]: The recording wrapper.
+    """
+    method = func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        instrumentation = _active
+        if instrumentation is None or _in_call.get():
+            return func(*args, **kwargs)
+        return _call(instrumentation, method, func, args, kwargs)
+
+    return wrapper
+
+
+def _call(
+    instrumentation: _Instrumentation,
+    method: str,
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    """
+    Call an instrumented method, recording its metrics and opening its span.
+
+    Instrumented methods it calls in turn are neither recorded nor spanned.
+
+    Args:
+        instrumentation (_Instrumentation): The active instrumentation.
+        method (str): The method name.
+        func (Callable[..., Any]): The method.
+        args (tuple[Any, ...]): The positional arguments.
+        kwargs (dict[str, Any]): The keyword arguments.
+
+    Returns:
+        Any: The method's result.
+    """
+    span_hook = instrumentation.span_hook
+    span = span_hook(method, {"code.function": method}) if span_hook else None
+    token = _in_call.set(True)
+    start = time.perf_counter()
+    try:
+        if span is None:
+            result = func(*args, **kwargs)
+        else:
+            with span:
+                result = func(*args, **kwargs)
+    except Exception as e:
+        instrumentation.registry.record(
+            method, time.perf_counter() - start, _error_types(e)
+        )
+        raise
+    finally:
+        _in_call.reset(token)
+    duration = time.perf_counter() - start
+    error_types = None
+    if isinstance(result, BatchResult):
+        # Batch calls report rejected rows instead of raising
+        error_types = [detail["type"] for row in result.errors for detail in row.errors]
+    instrumentation.registry.record(method, duration, error_types)
+    return result
@@ -1,7 +1,26 @@
+from collections.abc import Hashable, Iterable, Mapping
+from functools import cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from anvil_engine.factories.batch import BatchResult, RowError, validate_rows
+from anvil_engine.factories.instrumentation import instrumented
+from anvil_engine.factories.race_registry import (
+    DEFAULT_RACE_REGISTRY,
+    RaceRegistry,
+    race_key,
+)
+from anvil_engine.factories.validation import ValidationMode, construct_trusted
 from anvil_engine.interfaces import RaceFactoryInterface
 from anvil_engine.models import Race
 
 
+@cache
+def _race_list_adapter() -> TypeAdapter[list[Race]]:
+    return TypeAdapter(list[Race])
+
+
 class RaceFactory(RaceFactoryInterface):
     """
     Factory class for creating different types of races in the RPG system.
@@ -10,8 +29,41 @@ class RaceFactory(RaceFactoryInterface):
     predefined attribute sets and characteristics. It provides both
     generic race creation and specialized methods for common races
     like humans and elves.
+
+    Races are interned in a RaceRegistry: creating a race identical to one
+    created before returns the same immutable instance without validating
+    it again.
     """
 
+    def __init__(
+        self,
+        registry: RaceRegistry | None = None,
+        validation_mode: ValidationMode | str = ValidationMode.LAX,
+    ):
+        """
+        Create a race factory.
+
+        Args:
+            registry (RaceRegistry | None): The registry interning the created
+                races. Defaults to the registry shared by all factories.
+            validation_mode (ValidationMode | str): How the created races are
+                validated: ``strict``, ``lax`` (the default) or ``trusted``,
+                which skips validation entirely.
+        """
+        self._registry = registry if registry is not None else DEFAULT_RACE_REGISTRY
+        self._validation_mode = ValidationMode(validation_mode)
+
+    @property
+    def registry(self) -> RaceRegistry:
+        """RaceRegistry: The registry interning the created races."""
+        return self._registry
+
+    @property
+    def validation_mode(self) -> ValidationMode:
+        """ValidationMode: How the created races are validated."""
+        return self._validation_mode
+
+    @instrumented
     def create_race(
         self, name: str, description: str, base_attributes: dict[str, int]
     ) -> Race:
@@ -24,13 +76,83 @@ class RaceFactory(RaceFactoryInterface):
             base_attributes (dict[str, int]): Dictionary of base attribute values.
 
         Returns:
-            Race: A new race instance with the specified parameters.
+            Race: The canonical race instance with the specified parameters.
         """
         try:
-            return Race(name, description, base_attributes)
+            return self._registry.intern(
+                {
+                    "name": name,
+                    "description": description,
+                    "base_attributes": base_attributes,
+                },
+                validation_mode=self._validation_mode,
+            )
         except Exception as e:
             raise ValueError(f"Error creating race: {e}") from e
 
+    @instrumented
+    def create_races(self, rows: Iterable[Mapping[str, Any]]) -> BatchResult[Race]:
+        """
+        Create many custom races in a single validation pass.
+
+        Identical rows share the same canonical Race instance, and only rows
+        missing from the registry are validated. Invalid rows do not raise;
+        each one is reported in the result instead. In ``trusted`` mode the
+        rows are not validated at all, and the races built from them are
+        shared within the batch but not registered.
+
+        Args:
+            rows (Iterable[Mapping[str, Any]]): Rows holding the ``name``,
+                ``description`` and ``base_attributes`` of each race.
+
+        Returns:
+            BatchResult[Race]: The created races and one error report per
+                invalid row.
+        """
+        known: list[Race | None] = []
+        unique: list[Any] = []
+        positions: dict[Hashable, int] = {}
+        slots: list[int] = []
+        for row in rows:
+            key = race_key(row, self._validation_mode)
+            position = positions.get(key) if key is not None else None
+            if position is None:
+                position = len(known)
+                known.append(self._registry.get(key) if key is not None else None)
+                unique.append(row)
+                if key is not None:
+                    positions[key] = position
+            slots.append(position)
+
+        missing = [i for i, race in enumerate(known) if race is None]
+        if self._validation_mode is ValidationMode.TRUSTED:
+            validated = [construct_trusted(Race, unique[i]) for i in missing]
+            failures = {}
+        else:
+            validated, failures = validate_rows(
+                _race_list_adapter(),
+                [unique[i] for i in missing],
+                strict=self._validation_mode is ValidationMode.STRICT,
+            )
+        errors: dict[int, list[dict[str, Any]]] = {}
+        for position, (i, race) in enumerate(zip(missing, validated, strict=True)):
+            if race is None:
+                errors[i] = failures[position]
+            elif self._validation_mode is ValidationMode.TRUSTED:
+                known[i] = race
+            else:
+                known[i] = self._registry.add(race)
+
+        result: BatchResult[Race] = BatchResult()
+        for index, slot in enumerate(slots):
+            race = known[slot]
+            if race is None:
+                result.errors.append(RowError(index, tuple(errors[slot])))
+            else:
+                result.items.append(race)
+        return result
+
+    @instrumented
     def create_human(self) -> Race:
         """
         Create a human race with balanced attributes.
@@ -40,25 +162,29 @@ class RaceFactory(RaceFactoryInterface):
         for any character class or playstyle.
 
         Returns:
-            Race: A new human race with balanced base attributes.
+            Race: The shared human race with balanced base attributes.
         """
         try:
-            return self.create_race(
-                name="Human",
-                description="Adaptable and ambitious, standard for all races",
-                base_attributes={
-                    "strength": 10,
-                    "agility": 10,
-                    "intelligence": 10,
-                    "wisdom": 10,
-                    "dexterity": 10,
-                    "constitution": 10,
-                    "charisma": 10,
+            return self._registry.intern(
+                {
+                    "name": "Human",
+                    "description": "Adaptable and ambitious, standard for all races",
+                    "base_attributes": {
+                        "strength": 10,
+                        "agility": 10,
+                        "intelligence": 10,
+                        "wisdom": 10,
+                        "dexterity": 10,
+                        "constitution": 10,
+                        "charisma": 10,
+                    },
                 },
+                pinned=True,
             )
         except Exception as e:
             raise ValueError(f"Error creating human: {e}") from e
 
+    @instrumented
     def create_elf(self) -> Race:
         """
         Create an elf race with agility and intelligence focus.
@@ -68,21 +194,24 @@ class RaceFactory(RaceFactoryInterface):
         making them ideal for classes that rely on these attributes.
 
         Returns:
-            Race: A new elf race with agility and intelligence focus.
+            Race: The shared elf race with agility and intelligence focus.
         """
         try:
-            return self.create_race(
-                name="Elf",
-                description="Intelligent and graceful, with a deep connection to nature",
-                base_attributes={
-                    "strength": 8,
-                    "agility": 12,
-                    "intelligence": 12,
-                    "wisdom": 10,
-                    "dexterity": 12,
-                    "constitution": 8,
-                    "charisma": 8,
+            return self._registry.intern(
+                {
+                    "name": "Elf",
+                    "description": "Intelligent and graceful, with a deep connection to nature",
+                    "base_attributes": {
+                        "strength": 8,
+                        "agility": 12,
+                        "intelligence": 12,
+                        "wisdom": 10,
+                        "dexterity": 12,
+                        "constitution": 8,
+                        "charisma": 8,
+                    },
                 },
+                pinned=True,
             )
         except Exception as e:
             raise ValueError(f"Error creating elf: {e}") from e
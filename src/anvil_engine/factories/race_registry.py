@@ -0,0 +1,177 @@
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from threading import Lock
+from typing import Any
+
+from anvil_engine.factories.validation import ValidationMode, build_model
+from anvil_engine.models import Race
+
+
+def _strictly_typed(data: Mapping[str, Any]) -> bool:
+    """Check that a raw race row holds the exact types strict validation needs."""
+    base_attributes = data["base_attributes"]
+    return (
+        type(data["name"]) is str
+        and type(data["description"]) is str
+        and isinstance(base_attributes, dict)
+        and all(
+            type(name) is str and type(value) is int
+            for name, value in base_attributes.items()
+        )
+    )
+
+
+def race_key(
+    data: Race | Mapping[str, Any],
+    validation_mode: ValidationMode = ValidationMode.LAX,
+) -> Hashable | None:
+    """
+    Build the content key identifying identical races.
+
+    Keys compare values, so ``{"strength": 12.0}`` has the key of a race
+    with a strength of 12. In ``strict`` mode such a row would be rejected,
+    so rows that do not hold exactly the types strict validation accepts
+    get no key and are always validated.
+
+    Args:
+        data (Race | Mapping[str, Any]): A race, or a raw race row holding
+            the ``name``, ``description`` and ``base_attributes``.
+        validation_mode (ValidationMode): How a raw row would be validated.
+
+    Returns:
+        Hashable | None: The key, or None if the row cannot be keyed (e.g. it
+            is malformed), in which case it must not be shared.
+    """
+    if isinstance(data, Race):
+        return (
+            data.name,
+            data.description,
+            tuple(sorted(data.base_attributes.items())),
+        )
+    if not isinstance(data, Mapping):
+        return None
+    try:
+        key = (
+            data["name"],
+            data["description"],
+            tuple(sorted(data["base_attributes"].items())),
+        )
+        hash(key)
+        if validation_mode is ValidationMode.STRICT and not _strictly_typed(data):
+            return None
+    except (KeyError, TypeError, AttributeError):
+        return None
+    return key
+
+
+class RaceRegistry:
+    """
+    Interning registry returning one canonical, immutable instance per race.
+
+    Races are keyed by their content (name, description and base attributes),
+    so every request for an identical race shares a single Race object instead
+    of building and validating a new one. Pinned races, such as the built-in
+    ones, are kept forever while custom races live in a bounded LRU.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Create an empty registry.
+
+        Args:
+            maxsize (int): The maximum number of custom (unpinned) races kept.
+        """
+        self._maxsize = maxsize
+        self._pinned: dict[Hashable, Race] = {}
+        self._custom: OrderedDict[Hashable, Race] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._pinned) + len(self._custom)
+
+    def get(self, key: Hashable) -> Race | None:
+        """
+        Look up the canonical race for a content key.
+
+        Args:
+            key (Hashable): A key built by ``race_key``.
+
+        Returns:
+            Race | None: The canonical race, or None if it is not registered.
+        """
+        race = self._pinned.get(key)
+        if race is not None:
+            return race
+        with self._lock:
+            race = self._custom.get(key)
+            if race is not None:
+                self._custom.move_to_end(key)
+            return race
+
+    def add(self, race: Race, pinned: bool = False) -> Race:
+        """
+        Register a race, unless an identical one is already registered.
+
+        Args:
+            race (Race): The race to register.
+            pinned (bool): Whether the race must never be evicted.
+
+        Returns:
+            Race: The canonical instance, which is ``race`` itself if no
+                identical race was registered yet.
+        """
+        key = race_key(race)
+        with self._lock:
+            existing = self._pinned.get(key)
+            if existing is None:
+                existing = self._custom.pop(key, None)
+            canonical = race if existing is None else existing
+            if pinned:
+                self._pinned[key] = canonical
+            else:
+                self._custom[key] = canonical
+                if len(self._custom) > self._maxsize:
+                    self._custom.popitem(last=False)
+        return canonical
+
+    def intern(
+        self,
+        data: Mapping[str, Any],
+        pinned: bool = False,
+        validation_mode: ValidationMode = ValidationMode.LAX,
+    ) -> Race:
+        """
+        Get the canonical race for a raw race row, creating it if needed.
+
+        Races built in ``trusted`` mode were never validated, so they are
+        returned without being registered; otherwise a later validating
+        lookup of the same content would get them unchecked.
+
+        Args:
+            data (Mapping[str, Any]): The ``name``, ``description`` and
+                ``base_attributes`` of the race.
+            pinned (bool): Whether a newly created race must never be evicted.
+            validation_mode (ValidationMode): How to validate a newly created race.
+
+        Returns:
+            Race: The canonical race instance.
+
+        Raises:
+            pydantic.ValidationError: If the race has to be created and is invalid.
+        """
+        key = race_key(data, validation_mode)
+        race = self.get(key) if key is not None else None
+        if race is None:
+            race = build_model(Race, data, validation_mode)
+            if validation_mode is not ValidationMode.TRUSTED:
+                race = self.add(race, pinned=pinned)
+        return race
+
+    def clear(self) -> None:
+        """Remove every custom race, keeping the pinned ones."""
+        with self._lock:
+            self._custom.clear()
+
+
+DEFAULT_RACE_REGISTRY = RaceRegistry()
+"""Registry shared by factories that are not given one explicitly."""
@@ -0,0 +1,312 @@
+import os
+import tomllib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from types import MappingProxyType
+from typing import Any
+
+from pydantic import TypeAdapter
+from pydantic_core import from_json
+
+from anvil_engine.factories.character_factory import CLASS_TEMPLATES, CharacterFactory
+from anvil_engine.factories.race_factory import RaceFactory
+from anvil_engine.models import Character, Race
+from anvil_engine.models.attributes import ATTRIBUTE_NAMES, pack_attributes
+
+_attribute_adapter = TypeAdapter(dict[str, int])
+
+
+@dataclass(frozen=True, slots=True)
+class ClassTemplate:
+    """
+    Immutable, pre-validated attribute template of a character class.
+
+    Attributes:
+        name (str): The class key, e.g. ``"archer"``.
+        attributes (Mapping[str, int]): Read-only attribute values, holding
+            exactly the seven attributes in ``ATTRIBUTE_NAMES`` order.
+    """
+
+    name: str
+    attributes: Mapping[str, int]
+
+
+@dataclass(frozen=True, slots=True)
+class _Templates:
+    """One consistent generation of templates, replaced as a whole on reload."""
+
+    classes: Mapping[str, ClassTemplate]
+    races: Mapping[str, Race]
+
+
+def _read(path: Path) -> dict[str, Any]:
+    """
+    Read a TOML or JSON template file.
+
+    Args:
+        path (Path): The file, with a ``.toml`` or ``.json`` suffix.
+
+    Returns:
+        dict[str, Any]: The decoded document.
+
+    Raises:
+        ValueError: If the suffix is not supported.
+    """
+    match path.suffix.lower():
+        case ".toml":
+            with path.open("rb") as fp:
+                return tomllib.load(fp)
+        case ".json":
+            return from_json(path.read_bytes())
+        case _:
+            raise ValueError(f"Unsupported template file type: {path.suffix}")
+
+
+class TemplateRegistry:
+    """
+    Registry of class and race templates loaded from configuration.
+
+    Templates are validated once when loaded and kept as immutable objects,
+    so creating a character from a template is a dictionary lookup and one
+    character validation. Reloading builds a complete new generation of
+    templates and swaps it in with a single assignment: readers never lock
+    and always see either the old or the new templates, never a mix.
+
+    A template file, in TOML or the equivalent JSON, looks like::
+
+        [classes.ranger]
+        strength = 9
+        agility = 13
+        intelligence = 10
+        wisdom = 12
+        dexterity = 13
+        constitution = 9
+        charisma = 6
+
+        [races.dwarf]
+        name = "Dwarf"
+        description = "Stout and stubborn mountain folk"
+        base_attributes = { strength = 12, constitution = 12, agility = 8 }
+
+    The built-in archer and warrior classes and human and elf races are
+    always available, and templates in the file override them by key.
+
+    Example:
+        templates = TemplateRegistry.from_file("templates.toml")
+        ranger = templates.create_by_class("ranger", "Aragorn", 87, "male", "dwarf")
+        templates.reload()  # After editing the file
+    """
+
+    def __init__(
+        self,
+        character_factory: CharacterFactory | None = None,
+        race_factory: RaceFactory | None = None,
+    ):
+        """
+        Create a registry holding only the built-in templates.
+
+        Args:
+            character_factory (CharacterFactory | None): The factory creating
+                characters from templates.
+            race_factory (RaceFactory | None): The factory interning races.
+        """
+        self._character_factory = character_factory or CharacterFactory()
+        self._race_factory = race_factory or RaceFactory()
+        self._path: Path | None = None
+        self._load_lock = Lock()
+        self._templates = self._build({})
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str | os.PathLike[str],
+        character_factory: CharacterFactory | None = None,
+        race_factory: RaceFactory | None = None,
+    ) -> "TemplateRegistry":
+        """
+        Create a registry from a TOML or JSON template file.
+
+        Args:
+            path (str | os.PathLike[str]): The template file.
+            character_factory (CharacterFactory | None): The factory creating
+                characters from templates.
+            race_factory (RaceFactory | None): The factory interning races.
+
+        Returns:
+            TemplateRegistry: The loaded registry.
+
+        Raises:
+            ValueError: If the file cannot be read or holds an invalid template.
+        """
+        registry = cls(character_factory, race_factory)
+        registry.load(path)
+        return registry
+
+    def _build(self, document: Mapping[str, Any]) -> _Templates:
+        """
+        Validate a template document into a new generation of templates.
+
+        Args:
+            document (Mapping[str, Any]): The decoded template file.
+
+        Returns:
+            _Templates: The built-in templates, overridden by the document's.
+
+        Raises:
+            ValueError: If the document is malformed or a template is invalid.
+        """
+        if not isinstance(document, Mapping):
+            raise ValueError("A template document must be a table")
+        for section in ("classes", "races"):
+            if not isinstance(document.get(section, {}), Mapping):
+                raise ValueError(f"Template section {section!r} must be a table")
+
+        class_data: dict[str, Any] = dict(CLASS_TEMPLATES)
+        class_data.update(document.get("classes", {}))
+        classes = {}
+        for key, attributes in class_data.items():
+            try:
+                values = pack_attributes(_attribute_adapter.validate_python(attributes))
+            except ValueError as e:
+                raise ValueError(f"Invalid class template {key!r}: {e}") from e
+            classes[key.lower()] = ClassTemplate(
+                key.lower(),
+                MappingProxyType(dict(zip(ATTRIBUTE_NAMES, values, strict=True))),
+            )
+
+        races = {
+            "human": self._race_factory.create_human(),
+            "elf": self._race_factory.create_elf(),
+        }
+        # Template races are not pinned: the generation holds them, and
+        # pinning would leak every race of every reloaded generation
+        for key, data in document.get("races", {}).items():
+            try:
+                races[key.lower()] = self._race_factory.create_race(**data)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid race template {key!r}: {e}") from e
+
+        return _Templates(MappingProxyType(classes), MappingProxyType(races))
+
+    def load(self, path: str | os.PathLike[str]) -> None:
+        """
+        Load templates from a file, atomically replacing the current ones.
+
+        If the file cannot be read or any template is invalid, the current
+        templates are kept.
+
+        Args:
+            path (str | os.PathLike[str]): The TOML or JSON template file.
+
+        Raises:
+            ValueError: If the file cannot be read or holds an invalid template.
+        """
+        path = Path(path)
+        with self._load_lock:
+            try:
+                templates = self._build(_read(path))
+            except (OSError, TypeError, ValueError, tomllib.TOMLDecodeError) as e:
+                raise ValueError(f"Error loading templates from {path}: {e}") from e
+            self._templates = templates
+            self._path = path
+
+    def reload(self) -> None:
+        """
+        Reload the templates from the file they were last loaded from.
+
+        Raises:
+            ValueError: If no file was loaded, or it is now invalid.
+        """
+        if self._path is None:
+            raise ValueError("No template file has been loaded")
+        self.load(self._path)
+
+    @property
+    def classes(self) -> Mapping[str, ClassTemplate]:
+        """Mapping[str, ClassTemplate]: The class templates, keyed by class."""
+        return self._templates.classes
+
+    @property
+    def races(self) -> Mapping[str, Race]:
+        """Mapping[str, Race]: The race templates, keyed by race key."""
+        return self._templates.races
+
+    def race(self, key: str) -> Race:
+        """
+        Get a race template.
+
+        Args:
+            key (str): The race key, e.g. ``"elf"``.
+
+        Returns:
+            Race: The shared race instance.
+
+        Raises:
+            ValueError: If the race is unknown.
+        """
+        try:
+            return self._templates.races[key]
+        except KeyError:
+            race = self._templates.races.get(key.lower())
+            if race is None:
+                raise ValueError(f"Unknown race: {key}") from None
+            return race
+
+    def class_template(self, character_class: str) -> ClassTemplate:
+        """
+        Get a class template.
+
+        Args:
+            character_class (str): The class key, e.g. ``"archer"``.
+
+        Returns:
+            ClassTemplate: The immutable class template.
+
+        Raises:
+            ValueError: If the class is unknown.
+        """
+        try:
+            return self._templates.classes[character_class]
+        except KeyError:
+            template = self._templates.classes.get(character_class.lower())
+            if template is None:
+                raise ValueError(
+                    f"Unknown character class: {character_class}"
+                ) from None
+            return template
+
+    def create_by_class(
+        self, character_class: str, name: str, age: int, gender: str, race: Race | str
+    ) -> Character:
+        """
+        Create a character from a class template.
+
+        Args:
+            character_class (str): The class key, e.g. ``"archer"``.
+            name (str): The character's name.
+            age (int): The character's age in years.
+            gender (str): The character's gender.
+            race (Race | str): The character's race, or a race key.
+
+        Returns:
+            Character: A new character with the class's attributes.
+
+        Raises:
+            ValueError: If the class or race is unknown, or the character is
+                invalid.
+        """
+        templates = self._templates
+        template = templates.classes.get(character_class) or self.class_template(
+            character_class
+        )
+        if isinstance(race, str):
+            race = templates.races.get(race) or self.race(race)
+        return self._character_factory.create_character(
+            name=name,
+            age=age,
+            gender=gender,
+            attributes=dict(template.attributes),
+            race=race,
+        )
@@ -0,0 +1,311 @@
+from collections.abc import Hashable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from threading import Lock
+from types import MappingProxyType
+
+from anvil_engine.models import Character, CompactCharacter
+from anvil_engine.models.attributes import ATTRIBUTE_INDEX, FrozenAttributes
+
+_object_new = object.__new__
+_object_setattr = object.__setattr__
+
+
+@dataclass(frozen=True, slots=True)
+class AttributeChange:
+    """
+    One entry of a ChangeLog.
+
+    For a Character, ``before`` and ``after`` are the attribute dictionaries
+    of the old and new versions themselves, not copies, so logging a change
+    costs one small record. Characters are treated as immutable values:
+    updates always produce new versions and never modify these mappings.
+
+    Attributes:
+        sequence (int): Position of the change in its log, starting at 0.
+        key (Hashable): Identifies the updated character, by default its name.
+        delta (Mapping[str, int]): The attribute deltas that were applied.
+        before (Mapping[str, int]): The attributes before the change.
+        after (Mapping[str, int]): The attributes after the change.
+    """
+
+    sequence: int
+    key: Hashable
+    delta: Mapping[str, int]
+    before: Mapping[str, int]
+    after: Mapping[str, int]
+
+
+class ChangeLog:
+    """
+    Thread-safe, append-only log of attribute changes.
+
+    Pass a log to ``apply_delta`` or ``apply_deltas`` to record every change
+    for auditing, or to replay the changes onto another copy of the roster.
+
+    Example:
+        log = ChangeLog()
+        party = apply_deltas(party, {"strength": 1}, log=log)
+        restored = log.replay({c.name: c for c in original_party})
+    """
+
+    def __init__(self):
+        """Create an empty log."""
+        self._changes: list[AttributeChange] = []
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    def __iter__(self) -> Iterator[AttributeChange]:
+        return iter(self.since(0))
+
+    def record(
+        self,
+        key: Hashable,
+        delta: Mapping[str, int],
+        before: Mapping[str, int],
+        after: Mapping[str, int],
+    ) -> AttributeChange:
+        """
+        Append a change to the log.
+
+        Args:
+            key (Hashable): Identifies the updated character.
+            delta (Mapping[str, int]): The applied attribute deltas.
+            before (Mapping[str, int]): The attributes before the change.
+            after (Mapping[str, int]): The attributes after the change.
+
+        Returns:
+            AttributeChange: The recorded change.
+        """
+        return self.record_many([(key, delta, before, after)])[0]
+
+    def record_many(
+        self,
+        changes: Iterable[
+            tuple[Hashable, Mapping[str, int], Mapping[str, int], Mapping[str, int]]
+        ],
+    ) -> list[AttributeChange]:
+        """
+        Append several changes to the log as one contiguous run.
+
+        Args:
+            changes (Iterable[tuple[Hashable, Mapping[str, int], Mapping[str, int], Mapping[str, int]]]):
+                The ``key``, ``delta``, ``before`` and ``after`` of each change.
+
+        Returns:
+            list[AttributeChange]: The recorded changes.
+        """
+        with self._lock:
+            start = len(self._changes)
+            recorded = [
+                AttributeChange(start + i, *change) for i, change in enumerate(changes)
+            ]
+            self._changes.extend(recorded)
+        return recorded
+
+    def since(self, sequence: int) -> list[AttributeChange]:
+        """
+        Get the changes recorded from a sequence number onwards.
+
+        Args:
+            sequence (int): The first sequence number to return.
+
+        Returns:
+            list[AttributeChange]: The changes, oldest first.
+        """
+        with self._lock:
+            return self._changes[sequence:]
+
+    def replay[C: (Character, CompactCharacter)](
+        self, characters: Mapping[Hashable, C], since: int = 0
+    ) -> dict[Hashable, C]:
+        """
+        Apply the logged deltas, in order, to a set of characters.
+
+        Args:
+            characters (Mapping[Hashable, C]): The starting characters, keyed
+                like the logged changes.
+            since (int): The first sequence number to replay.
+
+        Returns:
+            dict[Hashable, C]: The updated characters, with the same keys.
+
+        Raises:
+            ValueError: If a logged change targets an unknown key.
+        """
+        state = dict(characters)
+        for change in self.since(since):
+            character = state.get(change.key)
+            if character is None:
+                raise ValueError(f"No character to replay change onto: {change.key!r}")
+            state[change.key] = apply_delta(character, change.delta)
+        return state
+
+
+def _validate_delta(delta: Mapping[str, int]) -> Mapping[str, int]:
+    """
+    Check an attribute delta once, before it is applied.
+
+    Args:
+        delta (Mapping[str, int]): Attribute names mapped to integer changes.
+
+    Returns:
+        Mapping[str, int]: A read-only copy of the non-zero deltas.
+
+    Raises:
+        ValueError: If an attribute is unknown or a change is not an integer.
+    """
+    for name, change in delta.items():
+        if name not in ATTRIBUTE_INDEX:
+            raise ValueError(f"Unknown attribute: {name}")
+        if type(change) is not int:
+            raise ValueError(f"Attribute delta for {name} must be an int")
+    return MappingProxyType({name: change for name, change in delta.items() if change})
+
+
+def _apply[C: (Character, CompactCharacter)](
+    character: C, delta: Mapping[str, int]
+) -> C:
+    """
+    Build the updated version of a character from a validated delta.
+
+    Args:
+        character (C): The character to update.
+        delta (Mapping[str, int]): A delta returned by ``_validate_delta``.
+
+    Returns:
+        C: A new character sharing every unchanged field, the race included.
+
+    Raises:
+        ValueError: If the character lacks a changed attribute.
+    """
+    if isinstance(character, CompactCharacter):
+        values = list(character.get_packed_attributes())
+        for name, change in delta.items():
+            values[ATTRIBUTE_INDEX[name]] += change
+        return CompactCharacter.from_packed(
+            character.get_name(),
+            character.get_age(),
+            character.get_gender(),
+            tuple(values),
+            character.get_race(),
+        )
+
+    attributes = dict(character.attributes)
+    try:
+        for name, change in delta.items():
+            attributes[name] += change
+    except KeyError as e:
+        raise ValueError(f"Character has no attribute {e}") from None
+    # A shallow copy of the model with the new attributes, the fast path of
+    # ``construct_trusted`` without its checks of the field names
+    updated = _object_new(type(character))
+    _object_setattr(
+        updated,
+        "__dict__",
+        {**character.__dict__, "attributes": FrozenAttributes(attributes)},
+    )
+    _object_setattr(
+        updated, "__pydantic_fields_set__", set(character.__pydantic_fields_set__)
+    )
+    _object_setattr(updated, "__pydantic_extra__", character.__pydantic_extra__)
+    _object_setattr(updated, "__pydantic_private__", character.__pydantic_private__)
+    return updated
+
+
+def apply_delta[C: (Character, CompactCharacter)](
+    character: C,
+    delta: Mapping[str, int],
+    log: ChangeLog | None = None,
+    key: Hashable | None = None,
+) -> C:
+    """
+    Apply attribute deltas to a character, copy-on-write.
+
+    The character is not modified. The returned version shares its race,
+    name and other unchanged fields with the original and is not validated
+    again: only the delta is checked, so an update costs a fraction of
+    building a character.
+
+    Args:
+        character (C): The character to update.
+        delta (Mapping[str, int]): Attribute names mapped to the amount to
+            add, e.g. ``{"strength": 2, "agility": -1}``.
+        log (ChangeLog | None): A log recording the change.
+        key (Hashable | None): The character's key in the log. Defaults to
+            the character's name.
+
+    Returns:
+        C: The updated character, of the same type as ``character``.
+
+    Raises:
+        ValueError: If the delta is invalid.
+    """
+    delta = _validate_delta(delta)
+    updated = _apply(character, delta) if delta else character
+    if log is not None:
+        log.record(
+            character.get_name() if key is None else key,
+            delta,
+            character.get_attributes(),
+            updated.get_attributes(),
+        )
+    return updated
+
+
+def apply_deltas[C: (Character, CompactCharacter)](
+    characters: Sequence[C],
+    deltas: Mapping[str, int] | Sequence[Mapping[str, int]],
+    log: ChangeLog | None = None,
+    keys: Sequence[Hashable] | None = None,
+) -> list[C]:
+    """
+    Apply attribute deltas to many characters, copy-on-write.
+
+    A single delta, such as a party-wide buff, is validated once and applied
+    to every character; a sequence gives each character its own delta.
+
+    Args:
+        characters (Sequence[C]): The characters to update.
+        deltas (Mapping[str, int] | Sequence[Mapping[str, int]]): One delta
+            for all characters, or one per character.
+        log (ChangeLog | None): A log recording every change, in order.
+        keys (Sequence[Hashable] | None): The characters' keys in the log.
+            Defaults to their names.
+
+    Returns:
+        list[C]: The updated characters, in input order.
+
+    Raises:
+        ValueError: If a delta is invalid, or the number of deltas or keys
+            does not match the number of characters. No character is
+            logged in that case.
+    """
+    if isinstance(deltas, Mapping):
+        shared = _validate_delta(deltas)
+        validated = [shared] * len(characters)
+    else:
+        if len(deltas) != len(characters):
+            raise ValueError("Expected one delta per character")
+        validated = [_validate_delta(delta) for delta in deltas]
+    if keys is not None and len(keys) != len(characters):
+        raise ValueError("Expected one key per character")
+
+    updated = [
+        _apply(character, delta) if delta else character
+        for character, delta in zip(characters, validated, strict=True)
+    ]
+    if log is not None:
+        log.record_many(
+            (
+                before.get_name() if keys is None else keys[i],
+                delta,
+                before.get_attributes(),
+                after.get_attributes(),
+            )
+            for i, (before, after, delta) in enumerate(
+                zip(characters, updated, validated, strict=True)
+            )
+        )
+    return updated
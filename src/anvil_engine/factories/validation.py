@@ -0,0 +1,92 @@
+from collections.abc import Mapping
+from enum import StrEnum
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel
+
+from anvil_engine.models.attributes import FrozenAttributes
+
+_object_setattr = object.__setattr__
+
+
+class ValidationMode(StrEnum):
+    """
+    How much validation the factories perform when building models.
+
+    Attributes:
+        STRICT: Full validation without type coercion, e.g. ``"10"`` is
+            rejected where an int is expected.
+        LAX: Full validation with pydantic's usual coercions. This is the
+            default behaviour.
+        TRUSTED: No validation at all; models are built with
+            ``model_construct``. Only for data that was validated before,
+            such as reloads from the engine's own storage.
+    """
+
+    STRICT = "strict"
+    LAX = "lax"
+    TRUSTED = "trusted"
+
+
+def build_model[M: BaseModel](
+    model: type[M], data: Mapping[str, Any], mode: ValidationMode
+) -> M:
+    """
+    Build a model instance from raw data using the given validation mode.
+
+    Args:
+        model (type[M]): The pydantic model class to build.
+        data (Mapping[str, Any]): The model's fields.
+        mode (ValidationMode): How much validation to perform.
+
+    Returns:
+        M: The model instance.
+
+    Raises:
+        pydantic.ValidationError: If the data is invalid and the mode validates.
+    """
+    if mode is ValidationMode.TRUSTED:
+        return construct_trusted(model, data)
+    return model.model_validate(data, strict=mode is ValidationMode.STRICT)
+
+
+@cache
+def _frozen_fields(model: type[BaseModel]) -> tuple[str, ...]:
+    """Get the names of a model's fields holding read-only attributes."""
+    return tuple(
+        name
+        for name, field in model.__pydantic_fields__.items()
+        if field.annotation is FrozenAttributes
+    )
+
+
+def construct_trusted[M: BaseModel](model: type[M], data: Mapping[str, Any]) -> M:
+    """
+    Build a model instance from trusted data without any validation.
+
+    This is equivalent to ``model.model_construct(**data)``, but when ``data``
+    holds exactly the model's fields it skips the default handling done by
+    ``model_construct``, which is slower than validating simple models.
+    Attribute dictionaries are still made read-only, as validation would.
+
+    Args:
+        model (type[M]): The pydantic model class to build.
+        data (Mapping[str, Any]): The model's fields, assumed to be valid.
+
+    Returns:
+        M: The model instance.
+    """
+    data = dict(data)
+    for name in _frozen_fields(model):
+        if name in data:
+            data[name] = FrozenAttributes.freeze(data[name])
+    if data.keys() != model.__pydantic_fields__.keys() or model.__pydantic_post_init__:
+        return model.model_construct(**data)
+
+    instance = model.__new__(model)
+    _object_setattr(instance, "__dict__", data)
+    _object_setattr(instance, "__pydantic_fields_set__", set(data))
+    _object_setattr(instance, "__pydantic_extra__", None)
+    _object_setattr(instance, "__pydantic_private__", None)
+    return instance
@@ -0,0 +1,30 @@
+"""
+Generation module for the Anvil Engine RPG system.
+
+This module contains tools for generating characters at volume, such as
+sharded bulk generation across processes for test worlds and load-test
+fixtures, and vectorized, seeded attribute rolls for varied NPCs.
+"""
+
+from typing import TYPE_CHECKING
+
+from anvil_engine._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .bulk import generate_characters
+    from .stats import StatMethod, generate_attributes
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "StatMethod": ".stats",
+        "generate_attributes": ".stats",
+        "generate_characters": ".bulk",
+    },
+)
+
+__all__ = [
+    "StatMethod",
+    "generate_attributes",
+    "generate_characters",
+]
@@ -0,0 +1,155 @@
+import math
+import os
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from anvil_engine.factories import CharacterFactory, RaceFactory, ValidationMode
+from anvil_engine.factories.character_factory import CLASS_TEMPLATES
+from anvil_engine.generation.stats import StatMethod, generate_attributes
+from anvil_engine.models import Race
+from anvil_engine.models.attributes import ATTRIBUTE_NAMES
+from anvil_engine.roster import CharacterTable
+
+DEFAULT_SHARD_SIZE = 50_000
+GENDERS = ("female", "male")
+MIN_AGE = 16
+MAX_AGE = 90
+
+
+@dataclass(frozen=True, slots=True)
+class _Shard:
+    """Work description of one shard, sent to a worker process."""
+
+    start: int
+    size: int
+    seed: np.random.SeedSequence
+    character_class: str
+    attributes: Mapping[str, int]
+    races: tuple[Race, ...]
+    validation_mode: ValidationMode
+    stat_method: StatMethod | None
+
+
+def _generate_shard(shard: _Shard) -> CharacterTable:
+    """
+    Generate and validate the characters of one shard.
+
+    Args:
+        shard (_Shard): The shard to generate.
+
+    Returns:
+        CharacterTable: The shard's characters, in compact columnar form.
+    """
+    rng = np.random.default_rng(shard.seed)
+    ages = rng.integers(MIN_AGE, MAX_AGE, size=shard.size, endpoint=True).tolist()
+    genders = rng.integers(len(GENDERS), size=shard.size).tolist()
+    races = rng.integers(len(shard.races), size=shard.size).tolist()
+    name = shard.character_class.title()
+    if shard.stat_method is None:
+        attributes = [shard.attributes] * shard.size
+    else:
+        attributes = [
+            dict(zip(ATTRIBUTE_NAMES, row, strict=True))
+            for row in generate_attributes(
+                shard.size, shard.attributes, method=shard.stat_method, seed=rng
+            ).tolist()
+        ]
+
+    result = CharacterFactory(validation_mode=shard.validation_mode).create_characters(
+        {
+            "name": f"{name} {shard.start + i}",
+            "age": ages[i],
+            "gender": GENDERS[genders[i]],
+            "attributes": dict(attributes[i]),
+            "race": shard.races[races[i]],
+        }
+        for i in range(shard.size)
+    )
+    result.raise_for_errors()
+    return CharacterTable.from_characters(result.items)
+
+
+def generate_characters(
+    count: int,
+    character_class: str = "warrior",
+    races: Sequence[Race] | None = None,
+    seed: int = 0,
+    workers: int | None = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    validation_mode: ValidationMode | str = ValidationMode.LAX,
+    stat_method: StatMethod | str | None = None,
+) -> CharacterTable:
+    """
+    Generate many characters of a class, sharded across worker processes.
+
+    The characters are split into shards of ``shard_size``. Each shard draws
+    ages, genders and races from its own random stream derived from ``seed``,
+    so the output only depends on ``seed`` and ``shard_size``, not on the
+    number of workers. Shards are validated through the character factory in
+    the workers and sent back as compact CharacterTable columns instead of
+    pickled pydantic objects.
+
+    Args:
+        count (int): The number of characters to generate.
+        character_class (str): The class template to use, e.g. ``"archer"``.
+        races (Sequence[Race] | None): The races to draw from uniformly.
+            Defaults to the built-in races.
+        seed (int): The seed making the output reproducible.
+        workers (int | None): The number of worker processes. Defaults to the
+            number of CPUs; with 1, shards are generated in this process.
+        shard_size (int): The number of characters generated per shard.
+        validation_mode (ValidationMode | str): How the characters are validated.
+        stat_method (StatMethod | str | None): How attributes are drawn around
+            the class template. By default every character gets the template.
+
+    Returns:
+        CharacterTable: The generated characters, in order.
+
+    Raises:
+        ValueError: If the class is unknown or the arguments are invalid.
+    """
+    attributes = CLASS_TEMPLATES.get(character_class.lower())
+    if attributes is None:
+        raise ValueError(f"Unknown character class: {character_class}")
+    if count < 0 or shard_size < 1:
+        raise ValueError("count must not be negative and shard_size must be positive")
+
+    race_factory = RaceFactory()
+    races = tuple(races or (race_factory.create_human(), race_factory.create_elf()))
+    shard_count = math.ceil(count / shard_size)
+    seeds = np.random.SeedSequence(seed).spawn(shard_count)
+    shards = [
+        _Shard(
+            start=i * shard_size,
+            size=min(shard_size, count - i * shard_size),
+            seed=seeds[i],
+            character_class=character_class.lower(),
+            attributes=dict(attributes),
+            races=races,
+            validation_mode=ValidationMode(validation_mode),
+            stat_method=None if stat_method is None else StatMethod(stat_method),
+        )
+        for i in range(shard_count)
+    ]
+
+    workers = min(workers or os.cpu_count() or 1, max(shard_count, 1))
+    if workers == 1:
+        tables = [_generate_shard(shard) for shard in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            tables = list(executor.map(_generate_shard, shards))
+
+    table = CharacterTable.concat(tables)
+    # Races come back from the workers as copies, so restore the canonical ones
+    return CharacterTable(
+        table.names,
+        table.ages,
+        table.gender_codes,
+        table.genders,
+        table.race_codes,
+        [race_factory.registry.add(race) for race in table.races],
+        table.attributes,
+    )
@@ -0,0 +1,167 @@
+from collections.abc import Mapping
+from enum import StrEnum
+from itertools import product
+
+import numpy as np
+
+from anvil_engine.factories.character_factory import CLASS_TEMPLATES
+from anvil_engine.models import Race
+from anvil_engine.models.attributes import (
+    ATTRIBUTE_NAMES,
+    pack_attributes,
+    race_modifiers,
+)
+
+MIN_ATTRIBUTE = 1
+MAX_ATTRIBUTE = 20
+DEFAULT_POINT_BUY_BUDGET = 14
+ROLL_CENTRE = 12
+"""Rounded mean of 4d6-drop-lowest, subtracted so rolls vary around the template."""
+
+_SCORE_DTYPE = np.int16
+_SCORE_RANGE = np.iinfo(_SCORE_DTYPE)
+"""Bounds of the returned scores; sums are computed in wider ints and clamped first."""
+
+_FACES = np.array(list(product(range(1, 7), repeat=4)), dtype=np.int16)
+_ROLL_TABLE = (_FACES.sum(axis=1) - _FACES.min(axis=1)).astype(np.int16)
+"""4d6-drop-lowest result of each of the 1296 equally likely outcomes of 4d6."""
+
+
+class StatMethod(StrEnum):
+    """
+    How random attribute scores are drawn around a class template.
+
+    Attributes:
+        ROLL: Each attribute varies by a 4d6-drop-lowest roll around the
+            template, giving a bell-shaped spread from -9 to +6.
+        POINT_BUY: Each character spends the same budget of points, one point
+            per +1, on attributes chosen at random, so every stat block has
+            the same total. Points cut or added by clamping are moved to
+            other attributes, so totals only differ when the bounds cannot
+            hold them.
+    """
+
+    ROLL = "roll"
+    POINT_BUY = "point_buy"
+
+
+def generate_attributes(
+    count: int,
+    template: str | Mapping[str, int] = "warrior",
+    race: Race | None = None,
+    method: StatMethod | str = StatMethod.ROLL,
+    budget: int = DEFAULT_POINT_BUY_BUDGET,
+    low: int = MIN_ATTRIBUTE,
+    high: int = MAX_ATTRIBUTE,
+    seed: int | np.random.Generator | None = None,
+) -> np.ndarray:
+    """
+    Draw random attribute scores for many characters at once.
+
+    Scores are drawn in one batch with NumPy around the class template, the
+    race's base attributes are applied as modifiers (base value - 10) and
+    the result is clamped to ``[low, high]``. With ``POINT_BUY``, the
+    template is first lowered by ``budget // 7`` so it stays the centre of
+    the spread, and the points clamping cuts from an attribute are spent on
+    others of the same character, one at a time, to keep the total.
+
+    Args:
+        count (int): The number of stat blocks to draw.
+        template (str | Mapping[str, int]): A class name such as ``"archer"``
+            or an attribute dictionary used as the centre.
+        race (Race | None): The race whose base attributes modify the scores.
+            Leave empty for class attributes stored on a Character, which
+            does not include race bonuses.
+        method (StatMethod | str): How the scores are drawn.
+        budget (int): The points spent per character with ``POINT_BUY``.
+        low (int): The lowest allowed score.
+        high (int): The highest allowed score.
+        seed (int | np.random.Generator | None): A seed or generator making the
+            draw reproducible.
+
+    Returns:
+        np.ndarray: A ``count`` x 7 int16 array in ``ATTRIBUTE_NAMES`` order,
+            the layout of ``CharacterTable.attributes``.
+
+    Raises:
+        ValueError: If the template, method or bounds are invalid, or the
+            bounds do not fit in int16.
+    """
+    if isinstance(template, str):
+        attributes = CLASS_TEMPLATES.get(template.lower())
+        if attributes is None:
+            raise ValueError(f"Unknown character class: {template}")
+        template = attributes
+    if count < 0 or budget < 0 or low > high:
+        raise ValueError("count and budget must not be negative and low <= high")
+    if low < _SCORE_RANGE.min or high > _SCORE_RANGE.max:
+        raise ValueError(
+            f"low and high must be within [{_SCORE_RANGE.min}, {_SCORE_RANGE.max}]"
+        )
+
+    rng = np.random.default_rng(seed)
+    centre = np.array(pack_attributes(dict(template)), dtype=np.int64)
+    if race is not None:
+        centre += np.array(race_modifiers(race.base_attributes), dtype=np.int64)
+
+    shape = (count, len(ATTRIBUTE_NAMES))
+    match StatMethod(method):
+        case StatMethod.ROLL:
+            # Draw outcome numbers instead of individual dice
+            outcomes = rng.integers(len(_ROLL_TABLE), size=shape, dtype=np.int16)
+            # Centres past a bound by more than any roll are clamped alike, so
+            # clipping them first lets the sums fit in int32
+            centre = np.clip(centre, low - ROLL_CENTRE, high + ROLL_CENTRE)
+            scores = _ROLL_TABLE[outcomes] - ROLL_CENTRE + centre.astype(np.int32)
+        case StatMethod.POINT_BUY:
+            # Count how many of each character's points went to each attribute
+            picks = rng.integers(shape[1], size=(count, budget), dtype=np.int64)
+            picks += np.arange(count)[:, None] * shape[1]
+            offsets = np.bincount(picks.ravel(), minlength=count * shape[1])
+            offsets = offsets.reshape(shape) - budget // shape[1] + centre
+            totals = offsets.sum(axis=1)
+            scores = np.clip(offsets, low, high).astype(_SCORE_DTYPE)
+            _respend_clamped(scores, totals, low, high, rng)
+            return scores
+
+    np.clip(scores, low, high, out=scores)
+    return scores.astype(_SCORE_DTYPE)
+
+
+def _respend_clamped(
+    scores: np.ndarray,
+    totals: np.ndarray,
+    low: int,
+    high: int,
+    rng: np.random.Generator,
+) -> None:
+    """
+    Restore each row's total after clamping by moving points between attributes.
+
+    A row that lost points gets them back one at a time on random attributes
+    below ``high``; a row that gained points gives them back from random
+    attributes above ``low``. Rows whose total cannot fit the bounds keep
+    the closest total.
+
+    Args:
+        scores (np.ndarray): The clamped N x 7 scores, modified in place.
+        totals (np.ndarray): The total of each row before clamping.
+        low (int): The lowest allowed score.
+        high (int): The highest allowed score.
+        rng (np.random.Generator): The generator picking the attributes.
+    """
+    excess = totals - scores.sum(axis=1, dtype=np.int64)
+    rows = np.flatnonzero(excess)
+    excess = excess[rows]
+    while len(rows):
+        block = scores[rows]
+        room = np.where((excess > 0)[:, None], block < high, block > low)
+        movable = room.any(axis=1)
+        # The attribute with the largest random key among those with room
+        columns = np.where(room, rng.random(room.shape), -1.0).argmax(axis=1)
+        rows, columns, excess = rows[movable], columns[movable], excess[movable]
+        step = np.sign(excess)
+        scores[rows, columns] += step.astype(scores.dtype)
+        excess -= step
+        pending = excess != 0
+        rows, excess = rows[pending], excess[pending]
@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-from anvil_engine.models import Character, Race
+if TYPE_CHECKING:
+    from anvil_engine.models import Character, Race
 
 
 class CharacterFactoryInterface(ABC):
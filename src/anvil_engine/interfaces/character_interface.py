@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-from anvil_engine.models import Race
+if TYPE_CHECKING:
+    from anvil_engine.models import Race
 
 
 class CharacterInterface(ABC):
@@ -12,6 +16,8 @@ class CharacterInterface(ABC):
     and race information.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_name(self) -> str:
         """
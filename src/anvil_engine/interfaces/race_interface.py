@@ -10,6 +10,8 @@ class RaceInterface(ABC):
     base attribute modifiers.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_name(self) -> str:
         """
@@ -0,0 +1,38 @@
+"""
+Matchmaking module for the Anvil Engine RPG system.
+
+This module forms parties from pools of waiting characters: the
+``RoleClassifier`` assigns roles from attribute profiles such as the
+archer and warrior class templates, the ``AttributeGrid`` buckets
+attribute vectors for fast neighbourhood queries, and the ``MatchQueue``
+forms parties of a given role composition incrementally as characters
+arrive.
+"""
+
+from typing import TYPE_CHECKING
+
+from anvil_engine._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .grid import AttributeGrid, chebyshev
+    from .queue import MatchQueue, Party
+    from .roles import RoleClassifier
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AttributeGrid": ".grid",
+        "MatchQueue": ".queue",
+        "Party": ".queue",
+        "RoleClassifier": ".roles",
+        "chebyshev": ".grid",
+    },
+)
+
+__all__ = [
+    "AttributeGrid",
+    "MatchQueue",
+    "Party",
+    "RoleClassifier",
+    "chebyshev",
+]
@@ -0,0 +1,213 @@
+import heapq
+from collections.abc import Hashable, Iterator, Sequence
+from itertools import count, product
+from math import prod
+from operator import sub
+
+
+def chebyshev(a: Sequence[int], b: Sequence[int]) -> int:
+    """
+    Compute the Chebyshev (L-infinity) distance between two attribute vectors.
+
+    Args:
+        a (Sequence[int]): The first vector.
+        b (Sequence[int]): The second vector.
+
+    Returns:
+        int: The largest absolute difference of any attribute.
+    """
+    return max(map(abs, map(sub, a, b)))
+
+
+class AttributeGrid[H: Hashable]:
+    """
+    Bucketed grid over integer attribute vectors, answering radius queries.
+
+    Vectors are stored in cubic cells of ``cell_size`` along every attribute.
+    A query within ``radius`` only visits the cells its neighbourhood
+    overlaps, and nearest-neighbour queries widen their search from the
+    immediate neighbourhood only until a match is found, so in a dense grid
+    they visit a few small cells whatever the number of stored vectors.
+    While fewer cells are occupied than a query overlaps, the occupied cells
+    are scanned instead. Inserts and removals are O(1).
+
+    Example:
+        grid = AttributeGrid(radius=3)
+        grid.insert("gimli", (15, 9, 8, 9, 11, 14, 4))
+        grid.nearest((14, 10, 8, 9, 12, 13, 5))  # "gimli"
+    """
+
+    __slots__ = ("_cell_size", "_cells", "_entries", "_radius", "_sequence")
+
+    def __init__(self, radius: int, cell_size: int | None = None):
+        """
+        Create an empty grid.
+
+        Args:
+            radius (int): The Chebyshev distance within which queries match.
+            cell_size (int | None): The cell width along every attribute.
+                Defaults to three quarters of ``radius``, small enough for the
+                closest vectors of a dense grid to be found in a few cells.
+
+        Raises:
+            ValueError: If ``radius`` is negative or ``cell_size`` is not
+                positive.
+        """
+        cell_size = cell_size or max(1, 3 * radius // 4)
+        if radius < 0:
+            raise ValueError("radius must not be negative")
+        if cell_size < 1:
+            raise ValueError("cell_size must be positive")
+        self._radius = radius
+        self._cell_size = cell_size
+        self._cells: dict[tuple[int, ...], dict[H, tuple[int, tuple[int, ...]]]] = {}
+        self._entries: dict[H, tuple[int, ...]] = {}
+        self._sequence = count()
+
+    @property
+    def radius(self) -> int:
+        """int: The Chebyshev distance within which queries match."""
+        return self._radius
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, handle: object) -> bool:
+        return handle in self._entries
+
+    def __iter__(self) -> Iterator[H]:
+        return iter(self._entries)
+
+    def _cell(self, vector: Sequence[int]) -> tuple[int, ...]:
+        size = self._cell_size
+        return tuple([value // size for value in vector])
+
+    def insert(self, handle: H, vector: Sequence[int]) -> None:
+        """
+        Store a vector.
+
+        Args:
+            handle (H): Identifies the vector; ties between equally distant
+                vectors are broken in favour of the earliest inserted.
+            vector (Sequence[int]): The attribute vector.
+
+        Raises:
+            ValueError: If the handle is already stored.
+        """
+        if handle in self._entries:
+            raise ValueError(f"Handle already in grid: {handle!r}")
+        vector = tuple(vector)
+        cell = self._cell(vector)
+        self._entries[handle] = cell
+        self._cells.setdefault(cell, {})[handle] = (next(self._sequence), vector)
+
+    def remove(self, handle: H) -> bool:
+        """
+        Remove a vector.
+
+        Args:
+            handle (H): The vector's handle.
+
+        Returns:
+            bool: Whether the handle was stored.
+        """
+        cell = self._entries.pop(handle, None)
+        if cell is None:
+            return False
+        members = self._cells[cell]
+        del members[handle]
+        if not members:
+            del self._cells[cell]
+        return True
+
+    def _buckets(
+        self, vector: Sequence[int], radius: int
+    ) -> tuple[list[dict[H, tuple[int, tuple[int, ...]]]], bool]:
+        """
+        Collect the occupied cells overlapping a query radius.
+
+        Returns:
+            tuple[list[dict], bool]: The cells, and whether they are all the
+                occupied ones, which is cheaper when fewer cells are occupied
+                than the radius overlaps.
+        """
+        size = self._cell_size
+        spans = [
+            range((value - radius) // size, (value + radius) // size + 1)
+            for value in vector
+        ]
+        cells = self._cells
+        if len(cells) <= prod(map(len, spans)):
+            return list(cells.values()), True
+        return [
+            members for cell in product(*spans) if (members := cells.get(cell))
+        ], False
+
+    def within(self, vector: Sequence[int]) -> list[H]:
+        """
+        Find every vector within ``radius`` of a query.
+
+        Args:
+            vector (Sequence[int]): The query vector.
+
+        Returns:
+            list[H]: The matching handles, in no particular order.
+        """
+        radius = self._radius
+        buckets, _ = self._buckets(vector, radius)
+        return [
+            handle
+            for members in buckets
+            for handle, (_, stored) in members.items()
+            if chebyshev(vector, stored) <= radius
+        ]
+
+    def k_nearest(self, vector: Sequence[int], k: int) -> list[H]:
+        """
+        Find the closest vectors within ``radius`` of a query.
+
+        The search starts with the cells within distance 1 and doubles the
+        distance until ``k`` vectors are found within it, so in a dense grid
+        only the immediate neighbourhood is visited.
+
+        Args:
+            vector (Sequence[int]): The query vector.
+            k (int): The number of vectors to find.
+
+        Returns:
+            list[H]: Up to ``k`` handles, closest first and the earliest
+                inserted first among equally close ones.
+        """
+        radius = self._radius
+        limit = min(1, radius)
+        while True:
+            buckets, exhaustive = self._buckets(vector, limit)
+            ranked = [
+                (distance, sequence, handle)
+                for members in buckets
+                for handle, (sequence, stored) in members.items()
+                if (distance := chebyshev(vector, stored)) <= radius
+            ]
+            # Sequences are unique, so handles themselves are never compared
+            ranked = heapq.nsmallest(k, ranked) if len(ranked) > k else sorted(ranked)
+            if (
+                exhaustive
+                or limit >= radius
+                or (len(ranked) == k and ranked[-1][0] <= limit)
+            ):
+                return [handle for _, _, handle in ranked]
+            limit = min(2 * limit, radius)
+
+    def nearest(self, vector: Sequence[int]) -> H | None:
+        """
+        Find the closest vector within ``radius`` of a query.
+
+        Args:
+            vector (Sequence[int]): The query vector.
+
+        Returns:
+            H | None: The handle of the closest vector, the earliest inserted
+                among equally close ones, or None if none is within ``radius``.
+        """
+        found = self.k_nearest(vector, 1)
+        return found[0] if found else None
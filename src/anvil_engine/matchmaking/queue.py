@@ -0,0 +1,250 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from itertools import combinations, count
+from operator import sub
+
+import numpy as np
+
+from anvil_engine.interfaces import CharacterInterface
+from anvil_engine.matchmaking.grid import AttributeGrid, chebyshev
+from anvil_engine.matchmaking.roles import RoleClassifier
+from anvil_engine.models.attributes import effective_attributes, pack_attributes
+
+DEFAULT_TOLERANCE = 4
+"""Default largest attribute offset difference between a newcomer and its party."""
+
+
+@dataclass(frozen=True, slots=True)
+class Party:
+    """
+    A party formed by the match queue.
+
+    Attributes:
+        members (tuple[CharacterInterface, ...]): The members, the character
+            completing the party last.
+        roles (tuple[str, ...]): The role of each member.
+        spread (int): The largest difference between two members of any
+            attribute offset from their role's template.
+    """
+
+    members: tuple[CharacterInterface, ...]
+    roles: tuple[str, ...]
+    spread: int
+
+
+@dataclass(slots=True)
+class _Ticket:
+    character: CharacterInterface
+    role: str
+    vector: tuple[int, ...]
+
+
+class MatchQueue:
+    """
+    Incremental matchmaking queue forming parties as characters arrive.
+
+    Waiting characters are kept in one ``AttributeGrid`` per role, keyed on
+    their effective attributes minus their role's template. Characters of
+    different roles are thus compared by how far they rolled above or below
+    their class, not by their classes' very different attribute profiles,
+    and a strong warrior is grouped with a strong archer. When a character
+    arrives, each open slot of the party composition is filled with the
+    closest waiting character of that role within ``tolerance``, oldest
+    first among equally close ones. If every slot can be filled the party
+    is formed at once, otherwise the newcomer waits. Each arrival therefore
+    costs a few grid lookups rather than a scan of the queue, however long
+    it is.
+
+    Every member is within ``tolerance`` of the character completing the
+    party, so any two members are within twice the tolerance.
+
+    Example:
+        queue = MatchQueue({"warrior": 2, "archer": 1})
+        for character in arrivals:
+            party = queue.add(character)
+            if party is not None:
+                start_match(party)
+    """
+
+    def __init__(
+        self,
+        composition: Mapping[str, int] | None = None,
+        classifier: RoleClassifier | None = None,
+        tolerance: int = DEFAULT_TOLERANCE,
+        cell_size: int | None = None,
+    ):
+        """
+        Create an empty queue.
+
+        Args:
+            composition (Mapping[str, int] | None): The number of members of
+                each role in a party. Defaults to one of every role.
+            classifier (RoleClassifier | None): Assigns roles to characters.
+                Defaults to a classifier over the class templates.
+            tolerance (int): The largest difference of any attribute offset
+                from the role template between the character completing a
+                party and the others.
+            cell_size (int | None): The grid cell width, see ``AttributeGrid``.
+
+        Raises:
+            ValueError: If the composition names an unknown role, has no
+                members, or the tolerance or cell size is invalid.
+        """
+        self._classifier = classifier or RoleClassifier()
+        if composition is None:
+            composition = dict.fromkeys(self._classifier.roles, 1)
+        unknown = sorted(set(composition) - set(self._classifier.roles))
+        if unknown:
+            raise ValueError(f"Unknown roles: {', '.join(unknown)}")
+        if any(size < 0 for size in composition.values()):
+            raise ValueError("Role counts must not be negative")
+        self._composition = {role: size for role, size in composition.items() if size}
+        if not self._composition:
+            raise ValueError("A party needs at least one member")
+        self._grids = {
+            role: AttributeGrid[int](tolerance, cell_size) for role in self._composition
+        }
+        self._tolerance = tolerance
+        self._templates = {
+            role: self._classifier.template(role) for role in self._composition
+        }
+        self._tickets: dict[int, _Ticket] = {}
+        self._by_identity: dict[int, int] = {}
+        self._sequence = count()
+
+    @property
+    def composition(self) -> Mapping[str, int]:
+        """Mapping[str, int]: The number of members of each role in a party."""
+        return dict(self._composition)
+
+    @property
+    def tolerance(self) -> int:
+        """int: The largest attribute offset difference to a party's last member."""
+        return self._tolerance
+
+    def __len__(self) -> int:
+        return len(self._tickets)
+
+    def __contains__(self, character: object) -> bool:
+        return id(character) in self._by_identity
+
+    def waiting(self) -> dict[str, int]:
+        """
+        Count the waiting characters of each role.
+
+        Returns:
+            dict[str, int]: The number of waiting characters by role.
+        """
+        return {role: len(grid) for role, grid in self._grids.items()}
+
+    def add(self, character: CharacterInterface) -> Party | None:
+        """
+        Queue a character, forming a party if possible.
+
+        Args:
+            character (CharacterInterface): The arriving character.
+
+        Returns:
+            Party | None: The party completed by the character, or None if it
+                is waiting.
+
+        Raises:
+            ValueError: If the character is already queued or its role is not
+                part of the composition.
+        """
+        packed = pack_attributes(character.get_attributes())
+        return self._add(character, self._classifier.classify_packed(packed), packed)
+
+    def add_many(self, characters: Iterable[CharacterInterface]) -> list[Party]:
+        """
+        Queue characters in arrival order, classifying them in one pass.
+
+        Args:
+            characters (Iterable[CharacterInterface]): The arriving characters.
+
+        Returns:
+            list[Party]: The parties formed, in order of completion.
+
+        Raises:
+            ValueError: If a character is already queued or its role is not
+                part of the composition. Parties formed before are kept.
+        """
+        characters = list(characters)
+        if not characters:
+            return []
+        packed = [pack_attributes(c.get_attributes()) for c in characters]
+        roles = self._classifier.roles
+        indexes = self._classifier.classify_matrix(np.array(packed)).tolist()
+        parties = []
+        for character, attributes, index in zip(
+            characters, packed, indexes, strict=True
+        ):
+            party = self._add(character, roles[index], attributes)
+            if party is not None:
+                parties.append(party)
+        return parties
+
+    def remove(self, character: CharacterInterface) -> bool:
+        """
+        Take a waiting character out of the queue.
+
+        Args:
+            character (CharacterInterface): The character, by identity.
+
+        Returns:
+            bool: Whether the character was waiting.
+        """
+        handle = self._by_identity.pop(id(character), None)
+        if handle is None:
+            return False
+        ticket = self._tickets.pop(handle)
+        self._grids[ticket.role].remove(handle)
+        return True
+
+    def _add(
+        self, character: CharacterInterface, role: str, packed: tuple[int, ...]
+    ) -> Party | None:
+        if id(character) in self._by_identity:
+            raise ValueError(f"Character already queued: {character.get_name()}")
+        if role not in self._composition:
+            raise ValueError(f"Role {role} is not part of the party composition")
+        effective = effective_attributes(packed, character.get_race()).values()
+        vector = tuple(map(sub, effective, self._templates[role]))
+
+        # Fill the scarcest role first so a missing member is found cheaply
+        slots = {
+            slot_role: open_slots
+            for slot_role, size in self._composition.items()
+            if (open_slots := size - (slot_role == role))
+        }
+        chosen: dict[str, list[int]] = {}
+        for slot_role in sorted(slots, key=lambda r: len(self._grids[r]) - slots[r]):
+            grid, size = self._grids[slot_role], slots[slot_role]
+            if len(grid) < size:
+                return self._enqueue(character, role, vector)
+            handles = chosen[slot_role] = grid.k_nearest(vector, size)
+            if len(handles) < size:
+                return self._enqueue(character, role, vector)
+
+        handles = [handle for r in self._composition for handle in chosen.get(r, ())]
+        members = [self._tickets.pop(handle) for handle in handles]
+        for handle, ticket in zip(handles, members, strict=True):
+            self._grids[ticket.role].remove(handle)
+            del self._by_identity[id(ticket.character)]
+        members.append(_Ticket(character, role, vector))
+        return Party(
+            members=tuple(ticket.character for ticket in members),
+            roles=tuple(ticket.role for ticket in members),
+            spread=max(
+                (chebyshev(a.vector, b.vector) for a, b in combinations(members, 2)),
+                default=0,
+            ),
+        )
+
+    def _enqueue(
+        self, character: CharacterInterface, role: str, vector: tuple[int, ...]
+    ) -> None:
+        handle = next(self._sequence)
+        self._tickets[handle] = _Ticket(character, role, vector)
+        self._by_identity[id(character)] = handle
+        self._grids[role].insert(handle, vector)
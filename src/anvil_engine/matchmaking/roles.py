@@ -0,0 +1,136 @@
+from collections.abc import Iterable, Mapping
+
+import numpy as np
+
+from anvil_engine.factories.character_factory import CLASS_TEMPLATES
+from anvil_engine.interfaces import CharacterInterface
+from anvil_engine.models.attributes import ATTRIBUTE_NAMES, pack_attributes
+
+
+class RoleClassifier:
+    """
+    Assigns characters to roles by comparing attribute profiles.
+
+    Each role is described by an attribute template, such as the archer and
+    warrior class templates. A character gets the role whose template has
+    the closest profile, where a profile is the attribute vector minus its
+    own mean: an archer rolled low everywhere is still an archer. Raw
+    attributes are used, so race modifiers do not change a role.
+
+    Example:
+        classifier = RoleClassifier()
+        classifier.classify(character)  # "archer"
+    """
+
+    def __init__(self, templates: Mapping[str, Mapping[str, int]] = CLASS_TEMPLATES):
+        """
+        Create a classifier.
+
+        Args:
+            templates (Mapping[str, Mapping[str, int]]): Attribute template of
+                each role, keyed by role name. Defaults to the class templates.
+
+        Raises:
+            ValueError: If there is no template or one is incomplete.
+        """
+        if not templates:
+            raise ValueError("At least one role template is required")
+        self._roles = tuple(templates)
+        self._templates = {
+            role: pack_attributes(dict(template))
+            for role, template in templates.items()
+        }
+        matrix = np.array(list(self._templates.values()), dtype=np.float64)
+        self._profiles = matrix - matrix.mean(axis=1, keepdims=True)
+        self._profile_rows = self._profiles.tolist()
+
+    @property
+    def roles(self) -> tuple[str, ...]:
+        """tuple[str, ...]: The role names, in template order."""
+        return self._roles
+
+    def template(self, role: str) -> tuple[int, ...]:
+        """
+        Get the attribute template of a role.
+
+        Args:
+            role (str): The role name.
+
+        Returns:
+            tuple[int, ...]: The template in ``ATTRIBUTE_NAMES`` order.
+
+        Raises:
+            ValueError: If the role is unknown.
+        """
+        try:
+            return self._templates[role]
+        except KeyError as e:
+            raise ValueError(f"Unknown role: {role}") from e
+
+    def classify_packed(self, attributes: tuple[int, ...]) -> str:
+        """
+        Get the role of packed attributes.
+
+        Args:
+            attributes (tuple[int, ...]): Attributes in ``ATTRIBUTE_NAMES`` order.
+
+        Returns:
+            str: The role with the closest profile.
+        """
+        mean = sum(attributes) / len(ATTRIBUTE_NAMES)
+        best_role, best_distance = self._roles[0], float("inf")
+        for role, profile in zip(self._roles, self._profile_rows, strict=True):
+            distance = 0.0
+            for value, expected in zip(attributes, profile, strict=True):
+                distance += (value - mean - expected) ** 2
+            if distance < best_distance:
+                best_role, best_distance = role, distance
+        return best_role
+
+    def classify(self, character: CharacterInterface) -> str:
+        """
+        Get the role of a character.
+
+        Args:
+            character (CharacterInterface): The character.
+
+        Returns:
+            str: The role with the closest profile.
+
+        Raises:
+            ValueError: If the character's attributes are incomplete.
+        """
+        return self.classify_packed(pack_attributes(character.get_attributes()))
+
+    def classify_matrix(self, attributes: np.ndarray) -> np.ndarray:
+        """
+        Classify a whole attribute matrix at once.
+
+        Args:
+            attributes (np.ndarray): N x 7 attributes in ``ATTRIBUTE_NAMES``
+                order, e.g. ``CharacterTable.attributes``.
+
+        Returns:
+            np.ndarray: The index in ``roles`` of each row's role.
+        """
+        values = np.asarray(attributes, dtype=np.float64)
+        profiles = values - values.mean(axis=1, keepdims=True)
+        distances = ((profiles[:, None, :] - self._profiles[None, :, :]) ** 2).sum(
+            axis=2
+        )
+        return distances.argmin(axis=1)
+
+    def classify_many(self, characters: Iterable[CharacterInterface]) -> list[str]:
+        """
+        Classify many characters in one vectorized pass.
+
+        Args:
+            characters (Iterable[CharacterInterface]): The characters.
+
+        Returns:
+            list[str]: The role of each character, in order.
+        """
+        matrix = [pack_attributes(c.get_attributes()) for c in characters]
+        if not matrix:
+            return []
+        return [self._roles[i] for i in self.classify_matrix(np.array(matrix)).tolist()]
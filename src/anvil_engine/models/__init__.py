@@ -7,10 +7,26 @@ models represent the actual game entities with their attributes and
 characteristics.
 """
 
-from .character import Character
-from .race import Race
+from typing import TYPE_CHECKING
+
+from anvil_engine._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .character import Character
+    from .compact_character import CompactCharacter
+    from .race import Race
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Character": ".character",
+        "CompactCharacter": ".compact_character",
+        "Race": ".race",
+    },
+)
 
 __all__ = [
     "Character",
+    "CompactCharacter",
     "Race",
 ]
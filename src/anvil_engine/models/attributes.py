@@ -0,0 +1,193 @@
+from collections.abc import Mapping
+from functools import lru_cache
+from operator import add
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NoReturn, Self
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+    from pydantic_core import CoreSchema
+
+    from anvil_engine.models.race import Race
+
+ATTRIBUTE_NAMES: tuple[str, ...] = (
+    "strength",
+    "agility",
+    "intelligence",
+    "wisdom",
+    "dexterity",
+    "constitution",
+    "charisma",
+)
+"""Fixed order of the seven attributes used by every packed attribute layout."""
+
+ATTRIBUTE_INDEX: dict[str, int] = {name: i for i, name in enumerate(ATTRIBUTE_NAMES)}
+"""Position of each attribute within ``ATTRIBUTE_NAMES``."""
+
+
+def pack_attributes(attributes: dict[str, int]) -> tuple[int, ...]:
+    """
+    Pack an attribute dictionary into a tuple in ``ATTRIBUTE_NAMES`` order.
+
+    Args:
+        attributes (dict[str, int]): Dictionary mapping every attribute name
+            to its value.
+
+    Returns:
+        tuple[int, ...]: The attribute values in ``ATTRIBUTE_NAMES`` order.
+
+    Raises:
+        ValueError: If an attribute is missing or an unknown one is present.
+    """
+    if len(attributes) != len(ATTRIBUTE_NAMES):
+        unknown = sorted(set(attributes) - ATTRIBUTE_INDEX.keys())
+        if unknown:
+            raise ValueError(f"Unknown attributes: {', '.join(unknown)}")
+    try:
+        return tuple([attributes[name] for name in ATTRIBUTE_NAMES])
+    except KeyError as e:
+        raise ValueError(f"Missing attribute: {e.args[0]}") from e
+
+
+class FrozenAttributes(dict[str, int]):
+    """
+    Read-only attribute dictionary held by characters and races.
+
+    Races are shared by every character of the race and both models cache
+    their content hash and JSON, so their attributes must never change.
+    A dict subclass rather than a ``MappingProxyType`` keeps the models
+    picklable for worker processes and as fast to serialize as before.
+    Use ``dict(attributes)`` for a mutable copy.
+
+    Example:
+        attributes = FrozenAttributes(strength=12)
+        attributes["strength"] = 13  # TypeError
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *_args: object, **_kwargs: object) -> NoReturn:
+        raise TypeError("Attributes are read-only; update a dict(...) copy instead")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> tuple[type[Self], tuple[dict[str, int]]]:
+        return type(self), (dict(self),)
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self
+
+    @classmethod
+    def freeze(cls, attributes: Mapping[str, int]) -> "FrozenAttributes":
+        """
+        Get a read-only version of an attribute mapping.
+
+        Args:
+            attributes (Mapping[str, int]): The attributes.
+
+        Returns:
+            FrozenAttributes: ``attributes`` itself if it is already frozen,
+                otherwise a frozen copy.
+        """
+        if type(attributes) is cls:
+            return attributes
+        return cls(attributes)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: "GetCoreSchemaHandler"
+    ) -> "CoreSchema":
+        from pydantic_core import core_schema
+
+        return core_schema.no_info_after_validator_function(
+            cls.freeze, handler(dict[str, int])
+        )
+
+
+EFFECTIVE_CACHE_SIZE = 4_096
+"""Maximum number of memoized (race modifiers, attributes) combinations."""
+
+_MAX_TRACKED_RACES = 1_024
+
+RACE_BASELINE = 10
+"""Base attribute value of a race that neither raises nor lowers an attribute."""
+
+
+def race_modifiers(base_attributes: dict[str, int]) -> tuple[int, ...]:
+    """
+    Convert a race's base attributes into modifiers in ``ATTRIBUTE_NAMES`` order.
+
+    A base value of ``RACE_BASELINE`` is neutral, so an elf's agility of 12
+    is a +2 modifier. Attributes the race does not define are neutral.
+
+    Args:
+        base_attributes (dict[str, int]): The race's base attribute values.
+
+    Returns:
+        tuple[int, ...]: The modifier of each attribute.
+    """
+    return tuple(
+        [
+            base_attributes.get(name, RACE_BASELINE) - RACE_BASELINE
+            for name in ATTRIBUTE_NAMES
+        ]
+    )
+
+
+_modifiers_by_race: dict[int, tuple["Race", tuple[int, ...]]] = {}
+
+
+def _modifiers_of(race: "Race") -> tuple[int, ...]:
+    """
+    Get a race's modifiers, memoized per race instance.
+
+    Races are immutable and usually shared, so their modifiers are looked up
+    by identity instead of hashing the race.
+
+    Args:
+        race (Race): The race.
+
+    Returns:
+        tuple[int, ...]: The race's modifiers in ``ATTRIBUTE_NAMES`` order.
+    """
+    known = _modifiers_by_race.get(id(race))
+    if known is not None and known[0] is race:
+        return known[1]
+    modifiers = race_modifiers(race.base_attributes)
+    if len(_modifiers_by_race) >= _MAX_TRACKED_RACES:
+        _modifiers_by_race.clear()
+    _modifiers_by_race[id(race)] = (race, modifiers)
+    return modifiers
+
+
+@lru_cache(maxsize=EFFECTIVE_CACHE_SIZE)
+def _combine(
+    modifiers: tuple[int, ...], attributes: tuple[int, ...]
+) -> Mapping[str, int]:
+    return MappingProxyType(
+        dict(zip(ATTRIBUTE_NAMES, map(add, attributes, modifiers), strict=True))
+    )
+
+
+def effective_attributes(
+    attributes: tuple[int, ...], race: "Race"
+) -> Mapping[str, int]:
+    """
+    Combine packed attributes with a race's modifiers.
+
+    Results are memoized per (race modifiers, attributes) pair, so characters
+    sharing a race and a class template share one read-only mapping instead
+    of each building a dictionary.
+
+    Args:
+        attributes (tuple[int, ...]): The attributes in ``ATTRIBUTE_NAMES`` order.
+        race (Race): The race whose base attributes modify the attributes.
+
+    Returns:
+        Mapping[str, int]: Read-only mapping of attribute names to effective values.
+    """
+    return _combine(_modifiers_of(race), attributes)
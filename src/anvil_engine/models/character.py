@@ -1,9 +1,17 @@
-from typing import Any
+from collections.abc import Mapping
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from anvil_engine.interfaces import CharacterInterface
-from anvil_engine.models import Race
+from anvil_engine.models.attributes import (
+    ATTRIBUTE_NAMES,
+    FrozenAttributes,
+    effective_attributes,
+    pack_attributes,
+)
+from anvil_engine.models.hashing import character_content_hash
+from anvil_engine.models.race import Race
+from anvil_engine.models.serialization import render_character_json
 
 
 class Character(CharacterInterface, BaseModel):
@@ -14,20 +22,73 @@ class Character(CharacterInterface, BaseModel):
     personal information, and racial characteristics. Characters can
     be of different classes and races, each affecting their abilities
     and gameplay experience.
+
+    Characters are immutable: updates create new versions, sharing unchanged
+    fields such as the race (see ``anvil_engine.factories.apply_delta``).
+    Their ``attributes`` are read-only.
     """
 
+    __slots__ = ("_content_hash", "_json")
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     name: str = Field(
         ..., min_length=3, max_length=50, description="The character's name."
     )
     age: int = Field(..., description="The character's age in years.")
     gender: str = Field(..., description="The character's gender.")
-    attributes: dict[str, int] = Field(
+    attributes: FrozenAttributes = Field(
         ..., description="Dictionary of attribute scores."
     )
     race: Race = Field(..., description="The character's race object.")
 
-    def __init__(self, **data: Any):
-        super().__init__(**data)
+    def __hash__(self) -> int:
+        return int.from_bytes(self.content_hash()[:8])
+
+    def content_hash(self) -> bytes:
+        """
+        Get the character's stable content hash.
+
+        The hash is computed on first use and cached on the instance. It is
+        equal for equal characters on every machine, and equal to the hash
+        of a CompactCharacter holding the same data.
+
+        Returns:
+            bytes: A 16-byte digest of the character's fields and race.
+        """
+        try:
+            return self._content_hash
+        except AttributeError:
+            content_hash = character_content_hash(
+                self.name, self.age, self.gender, self.attributes, self.race
+            )
+            object.__setattr__(self, "_content_hash", content_hash)
+            return content_hash
+
+    def json_bytes(self) -> bytes:
+        """
+        Get the character's JSON encoding.
+
+        The JSON is rendered on first use around the race's cached JSON and
+        cached on the instance. Updated versions of a character, such as
+        those returned by ``apply_delta`` or ``model_copy``, are new
+        instances and render their own JSON.
+
+        Returns:
+            bytes: The same JSON as ``model_dump_json()``, UTF-8 encoded.
+        """
+        try:
+            return self._json
+        except AttributeError:
+            json = render_character_json(
+                self.name,
+                self.age,
+                self.gender,
+                self.attributes,
+                self.race.json_bytes(),
+            )
+            object.__setattr__(self, "_json", json)
+            return json
 
     def get_name(self) -> str:
         """
@@ -61,7 +122,8 @@ class Character(CharacterInterface, BaseModel):
         Get the character's attribute scores.
 
         Returns:
-            dict[str, int]: Dictionary mapping attribute names to their values.
+            dict[str, int]: Read-only dictionary mapping attribute names to
+                their values.
         """
         return self.attributes
 
@@ -73,3 +135,26 @@ class Character(CharacterInterface, BaseModel):
             Race: The race object associated with this character.
         """
         return self.race
+
+    def get_effective_attributes(self) -> Mapping[str, int]:
+        """
+        Get the character's attributes with its race's modifiers applied.
+
+        A race's base value of 10 is neutral, so an elf archer's agility is
+        the archer's agility + 2. Results are memoized per race and attribute
+        values, so characters sharing both share the result.
+
+        Characters may hold only some attributes: missing ones count as 0
+        before the race's modifier is applied, and attributes outside
+        ``ATTRIBUTE_NAMES`` have no effective value.
+
+        Returns:
+            Mapping[str, int]: Read-only mapping of attribute names to their
+                effective values.
+        """
+        attributes = self.attributes
+        try:
+            packed = pack_attributes(attributes)
+        except ValueError:
+            packed = tuple([attributes.get(name, 0) for name in ATTRIBUTE_NAMES])
+        return effective_attributes(packed, self.race)
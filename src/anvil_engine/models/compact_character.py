@@ -0,0 +1,247 @@
+from collections.abc import Mapping
+from sys import intern
+from typing import Self
+
+from anvil_engine.interfaces import CharacterInterface
+from anvil_engine.models.attributes import (
+    ATTRIBUTE_NAMES,
+    effective_attributes,
+    pack_attributes,
+)
+from anvil_engine.models.character import Character
+from anvil_engine.models.hashing import character_content_hash
+from anvil_engine.models.race import Race
+
+
+class CompactCharacter(CharacterInterface):
+    """
+    Memory-compact implementation of a character in the RPG system.
+
+    A compact character is a slotted object holding its attributes as a
+    tuple in ``ATTRIBUTE_NAMES`` order and a reference to a shared, interned
+    race, instead of a pydantic model with a per-instance attribute
+    dictionary. It is immutable and a fraction of the size of a Character,
+    which makes it suited to keeping very large rosters resident.
+    """
+
+    __slots__ = ("_age", "_attributes", "_content_hash", "_gender", "_name", "_race")
+
+    _name: str
+    _age: int
+    _gender: str
+    _attributes: tuple[int, ...]
+    _race: Race
+
+    def __init__(
+        self,
+        name: str,
+        age: int,
+        gender: str,
+        attributes: Mapping[str, int],
+        race: Race,
+    ):
+        """
+        Create a compact character, validating its fields.
+
+        Args:
+            name (str): The character's name.
+            age (int): The character's age in years.
+            gender (str): The character's gender.
+            attributes (Mapping[str, int]): Dictionary mapping every attribute
+                of ``ATTRIBUTE_NAMES`` to its score.
+            race (Race): The character's race object.
+
+        Raises:
+            ValueError: If a field is invalid.
+        """
+        if not isinstance(name, str) or not 3 <= len(name) <= 50:
+            raise ValueError("Character name must be between 3 and 50 characters")
+        if not isinstance(age, int) or not isinstance(gender, str):
+            raise ValueError("Character age must be an int and gender a str")
+        if not isinstance(race, Race):
+            raise ValueError("Character race must be a Race")
+        packed = pack_attributes(dict(attributes))
+        if not all(isinstance(value, int) for value in packed):
+            raise ValueError("Character attributes must be integers")
+        self._init(name, age, gender, packed, race)
+
+    def _init(
+        self, name: str, age: int, gender: str, attributes: tuple[int, ...], race: Race
+    ) -> None:
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_age", age)
+        object.__setattr__(self, "_gender", intern(gender))
+        object.__setattr__(self, "_attributes", attributes)
+        object.__setattr__(self, "_race", race)
+
+    @classmethod
+    def from_packed(
+        cls, name: str, age: int, gender: str, attributes: tuple[int, ...], race: Race
+    ) -> Self:
+        """
+        Create a compact character from already validated, packed fields.
+
+        No validation is performed, so this is only meant for trusted data.
+
+        Args:
+            name (str): The character's name.
+            age (int): The character's age in years.
+            gender (str): The character's gender.
+            attributes (tuple[int, ...]): The attribute scores in
+                ``ATTRIBUTE_NAMES`` order.
+            race (Race): The character's race object.
+
+        Returns:
+            CompactCharacter: The new compact character.
+        """
+        character = cls.__new__(cls)
+        character._init(name, age, gender, attributes, race)
+        return character
+
+    @classmethod
+    def from_character(cls, character: CharacterInterface) -> Self:
+        """
+        Create a compact copy of another character.
+
+        Args:
+            character (CharacterInterface): The character to copy.
+
+        Returns:
+            CompactCharacter: The compact character.
+
+        Raises:
+            ValueError: If the character does not have exactly the attributes
+                of ``ATTRIBUTE_NAMES``.
+        """
+        return cls.from_packed(
+            character.get_name(),
+            character.get_age(),
+            character.get_gender(),
+            pack_attributes(character.get_attributes()),
+            character.get_race(),
+        )
+
+    def to_character(self) -> Character:
+        """
+        Convert this compact character into a Character model.
+
+        Returns:
+            Character: A validated character sharing the same race instance.
+        """
+        return Character(
+            name=self._name,
+            age=self._age,
+            gender=self._gender,
+            attributes=self.get_attributes(),
+            race=self._race,
+        )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactCharacter):
+            return NotImplemented
+        return (
+            self._name == other._name
+            and self._age == other._age
+            and self._gender == other._gender
+            and self._attributes == other._attributes
+            and self._race == other._race
+        )
+
+    def __hash__(self) -> int:
+        return int.from_bytes(self.content_hash()[:8])
+
+    def content_hash(self) -> bytes:
+        """
+        Get the character's stable content hash.
+
+        The hash is computed on first use and cached on the instance, and
+        equals the hash of a Character holding the same data.
+
+        Returns:
+            bytes: A 16-byte digest of the character's fields and race.
+        """
+        try:
+            return self._content_hash
+        except AttributeError:
+            content_hash = character_content_hash(
+                self._name, self._age, self._gender, self.get_attributes(), self._race
+            )
+            object.__setattr__(self, "_content_hash", content_hash)
+            return content_hash
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(name={self._name!r}, age={self._age!r}, "
+            f"gender={self._gender!r}, attributes={self.get_attributes()!r}, "
+            f"race={self._race.name!r})"
+        )
+
+    def get_name(self) -> str:
+        """
+        Get the character's name.
+
+        Returns:
+            str: The character's name.
+        """
+        return self._name
+
+    def get_age(self) -> int:
+        """
+        Get the character's age.
+
+        Returns:
+            int: The character's age in years.
+        """
+        return self._age
+
+    def get_gender(self) -> str:
+        """
+        Get the character's gender.
+
+        Returns:
+            str: The character's gender.
+        """
+        return self._gender
+
+    def get_attributes(self) -> dict[str, int]:
+        """
+        Get the character's attribute scores.
+
+        The dictionary is built on demand; modifying it does not affect the
+        character.
+
+        Returns:
+            dict[str, int]: Dictionary mapping attribute names to their values.
+        """
+        return dict(zip(ATTRIBUTE_NAMES, self._attributes, strict=True))
+
+    def get_packed_attributes(self) -> tuple[int, ...]:
+        """
+        Get the character's attribute scores without building a dictionary.
+
+        Returns:
+            tuple[int, ...]: The attribute scores in ``ATTRIBUTE_NAMES`` order.
+        """
+        return self._attributes
+
+    def get_effective_attributes(self) -> Mapping[str, int]:
+        """
+        Get the character's attributes with its race's modifiers applied.
+
+        Returns:
+            Mapping[str, int]: Read-only mapping of attribute names to their
+                effective values.
+        """
+        return effective_attributes(self._attributes, self._race)
+
+    def get_race(self) -> Race:
+        """
+        Get the character's race.
+
+        Returns:
+            Race: The race object associated with this character.
+        """
+        return self._race
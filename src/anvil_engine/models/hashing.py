@@ -0,0 +1,63 @@
+from collections.abc import Mapping
+from hashlib import blake2b
+from typing import TYPE_CHECKING
+
+from pydantic_core import to_json
+
+if TYPE_CHECKING:
+    from anvil_engine.models.race import Race
+
+CONTENT_HASH_SIZE = 16
+"""Size in bytes of a content hash."""
+
+
+def race_content_hash(
+    name: str, description: str, base_attributes: Mapping[str, int]
+) -> bytes:
+    """
+    Compute the stable content hash of a race.
+
+    The hash only depends on the race's fields, not on the order of its
+    base attributes, the process or the Python version, so it can be
+    compared across machines.
+
+    Args:
+        name (str): The race's name.
+        description (str): The race's description.
+        base_attributes (Mapping[str, int]): The race's base attributes.
+
+    Returns:
+        bytes: A ``CONTENT_HASH_SIZE``-byte BLAKE2b digest.
+    """
+    content = to_json([name, description, sorted(base_attributes.items())])
+    return blake2b(
+        content, digest_size=CONTENT_HASH_SIZE, person=b"anvil-race"
+    ).digest()
+
+
+def character_content_hash(
+    name: str, age: int, gender: str, attributes: Mapping[str, int], race: "Race"
+) -> bytes:
+    """
+    Compute the stable content hash of a character.
+
+    Characters with equal fields have the same hash whatever their
+    implementation, e.g. a Character and its CompactCharacter copy.
+
+    Args:
+        name (str): The character's name.
+        age (int): The character's age in years.
+        gender (str): The character's gender.
+        attributes (Mapping[str, int]): The character's attribute scores.
+        race (Race): The character's race, whose own cached hash is reused.
+
+    Returns:
+        bytes: A ``CONTENT_HASH_SIZE``-byte BLAKE2b digest.
+    """
+    digest = blake2b(
+        to_json([name, age, gender, sorted(attributes.items())]),
+        digest_size=CONTENT_HASH_SIZE,
+        person=b"anvil-character",
+    )
+    digest.update(race.content_hash())
+    return digest.digest()
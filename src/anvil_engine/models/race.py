@@ -1,8 +1,9 @@
-from typing import Any
-
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from anvil_engine.interfaces import RaceInterface
+from anvil_engine.models.attributes import FrozenAttributes
+from anvil_engine.models.hashing import race_content_hash
+from anvil_engine.models.serialization import render_race_json
 
 
 class Race(RaceInterface, BaseModel):
@@ -13,8 +14,15 @@ class Race(RaceInterface, BaseModel):
     base attributes and characteristics to characters. Different
     races offer various bonuses and penalties to character
     attributes, affecting gameplay and character development.
+
+    Races are immutable so that a single instance can be shared by every
+    character of that race. Their ``base_attributes`` are read-only.
     """
 
+    __slots__ = ("_content_hash", "_json")
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     name: str = Field(..., min_length=3, max_length=50, description="The race's name.")
     description: str = Field(
         ...,
@@ -22,12 +30,48 @@ class Race(RaceInterface, BaseModel):
         max_length=500,
         description="A descriptive text about the race.",
     )
-    base_attributes: dict[str, int] = Field(
+    base_attributes: FrozenAttributes = Field(
         ..., description="Dictionary of base attribute values."
     )
 
-    def __init__(self, **data: Any):
-        super().__init__(**data)
+    def __hash__(self) -> int:
+        return int.from_bytes(self.content_hash()[:8])
+
+    def content_hash(self) -> bytes:
+        """
+        Get the race's stable content hash.
+
+        The hash is computed on first use and cached on the instance.
+
+        Returns:
+            bytes: A 16-byte digest of the race's fields, equal for equal races
+                on every machine.
+        """
+        try:
+            return self._content_hash
+        except AttributeError:
+            content_hash = race_content_hash(
+                self.name, self.description, self.base_attributes
+            )
+            object.__setattr__(self, "_content_hash", content_hash)
+            return content_hash
+
+    def json_bytes(self) -> bytes:
+        """
+        Get the race's JSON encoding.
+
+        The JSON is rendered on first use and cached on the instance, and
+        spliced as is into the JSON of every character of the race.
+
+        Returns:
+            bytes: The same JSON as ``model_dump_json()``, UTF-8 encoded.
+        """
+        try:
+            return self._json
+        except AttributeError:
+            json = render_race_json(self)
+            object.__setattr__(self, "_json", json)
+            return json
 
     def get_name(self) -> str:
         """
@@ -52,6 +96,7 @@ class Race(RaceInterface, BaseModel):
         Get the race's base attribute values.
 
         Returns:
-            dict[str, int]: Dictionary mapping attribute names to their base values.
+            dict[str, int]: Read-only dictionary mapping attribute names to
+                their base values.
         """
         return self.base_attributes
@@ -0,0 +1,73 @@
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING
+
+from pydantic_core import to_json
+
+if TYPE_CHECKING:
+    from anvil_engine.models.character import Character
+    from anvil_engine.models.race import Race
+
+
+def render_race_json(race: "Race") -> bytes:
+    """
+    Encode a race as JSON.
+
+    Args:
+        race (Race): The race.
+
+    Returns:
+        bytes: The same JSON as ``race.model_dump_json()``, UTF-8 encoded.
+    """
+    return to_json(race)
+
+
+def render_character_json(
+    name: str, age: int, gender: str, attributes: Mapping[str, int], race_json: bytes
+) -> bytes:
+    """
+    Encode a character as JSON around its race's pre-rendered fragment.
+
+    Args:
+        name (str): The character's name.
+        age (int): The character's age in years.
+        gender (str): The character's gender.
+        attributes (Mapping[str, int]): The character's attribute scores.
+        race_json (bytes): The race's JSON, spliced in without re-encoding.
+
+    Returns:
+        bytes: The same JSON as ``Character.model_dump_json()``, UTF-8 encoded.
+    """
+    head = to_json(
+        {"name": name, "age": age, "gender": gender, "attributes": attributes}
+    )
+    return b"".join((head[:-1], b',"race":', race_json, b"}"))
+
+
+def dump_races_json(races: Iterable["Race"]) -> bytes:
+    """
+    Encode races as a JSON array by splicing their cached encodings.
+
+    Args:
+        races (Iterable[Race]): The races.
+
+    Returns:
+        bytes: The same JSON as ``TypeAdapter(list[Race]).dump_json()``.
+    """
+    return b"[" + b",".join([race.json_bytes() for race in races]) + b"]"
+
+
+def dump_characters_json(characters: Iterable["Character"]) -> bytes:
+    """
+    Encode characters as a JSON array by splicing their cached encodings.
+
+    Each character is encoded at most once in its lifetime and each race
+    once in total, so serializing the same characters again, e.g. for
+    every request of a list endpoint, only copies bytes.
+
+    Args:
+        characters (Iterable[Character]): The characters.
+
+    Returns:
+        bytes: The same JSON as ``TypeAdapter(list[Character]).dump_json()``.
+    """
+    return b"[" + b",".join([character.json_bytes() for character in characters]) + b"]"
@@ -0,0 +1,34 @@
+"""
+Persistence module for the Anvil Engine RPG system.
+
+This module contains repositories storing characters and races, such as
+the SQLite repository with bulk writes, indexed attribute queries and
+lazily hydrated, paged results, and the world store combining periodic
+snapshots with a write-ahead log for fast restarts.
+"""
+
+from typing import TYPE_CHECKING
+
+from anvil_engine._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .sqlite import SQLiteCharacterRepository
+    from .wal import WriteAheadLog, read_log
+    from .world import WorldStore
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "SQLiteCharacterRepository": ".sqlite",
+        "WorldStore": ".world",
+        "WriteAheadLog": ".wal",
+        "read_log": ".wal",
+    },
+)
+
+__all__ = [
+    "SQLiteCharacterRepository",
+    "WorldStore",
+    "WriteAheadLog",
+    "read_log",
+]
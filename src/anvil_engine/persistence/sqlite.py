@@ -0,0 +1,500 @@
+import os
+import sqlite3
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from itertools import batched
+from queue import Empty, Full, LifoQueue
+from threading import Lock
+from typing import Any, Self
+
+from pydantic_core import from_json, to_json
+
+from anvil_engine.factories import CharacterFactory, RaceFactory, ValidationMode
+from anvil_engine.factories.race_registry import race_key
+from anvil_engine.interfaces import CharacterInterface
+from anvil_engine.models import Character, Race
+from anvil_engine.models.attributes import (
+    ATTRIBUTE_INDEX,
+    ATTRIBUTE_NAMES,
+    pack_attributes,
+)
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_PAGE_SIZE = 1_000
+WRITE_CHUNK_SIZE = 10_000
+_MAX_TRACKED_RACE_OBJECTS = 1_024
+
+_CHARACTER_COLUMNS = ("name", "age", "gender", "race_id", *ATTRIBUTE_NAMES)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS races (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    base_attributes TEXT NOT NULL,
+    UNIQUE (name, description, base_attributes)
+);
+CREATE INDEX IF NOT EXISTS ix_races_name ON races (name);
+CREATE TABLE IF NOT EXISTS characters (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    age INTEGER NOT NULL,
+    gender TEXT NOT NULL,
+    race_id INTEGER NOT NULL REFERENCES races (id),
+    {", ".join(f"{name} INTEGER NOT NULL" for name in ATTRIBUTE_NAMES)}
+);
+"""
+"""Normalized schema: one row per distinct race, one column per attribute."""
+
+CHARACTER_INDEXES: dict[str, str] = {
+    f"ix_characters_{column}": (
+        f"CREATE INDEX IF NOT EXISTS ix_characters_{column} ON characters ({column})"
+    )
+    for column in ("race_id", *ATTRIBUTE_NAMES)
+}
+"""Secondary indexes of the character table, keyed by index name."""
+
+WRITER_CACHE_KIB = 65_536
+
+
+def _connect(path: str | os.PathLike[str]) -> sqlite3.Connection:
+    """
+    Open a connection tuned for a WAL-mode repository.
+
+    Args:
+        path (str | os.PathLike[str]): The database file.
+
+    Returns:
+        sqlite3.Connection: The connection, usable from any thread.
+    """
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.execute("PRAGMA foreign_keys = ON")
+    return connection
+
+
+class SQLiteCharacterRepository:
+    """
+    Character repository stored in a local SQLite database.
+
+    Races are stored once in a normalized table and characters hold one
+    indexed column per attribute. Writes are batched with ``executemany``
+    inside a single transaction on a dedicated writer connection, while
+    reads borrow connections from a small pool; in WAL mode readers do not
+    block the writer or each other. Query results are fetched page by page
+    and hydrated into Character objects lazily.
+
+    Example:
+        with SQLiteCharacterRepository("roster.db") as repository:
+            repository.add_characters(characters)
+            for dwarf in repository.query(race="Dwarf", min_attributes={"strength": 14}):
+                print(dwarf.name)
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        pool_size: int = DEFAULT_POOL_SIZE,
+        race_factory: RaceFactory | None = None,
+        character_factory: CharacterFactory | None = None,
+    ):
+        """
+        Open a repository, creating its schema if needed.
+
+        Args:
+            path (str | os.PathLike[str]): The database file. It must be a file
+                so the pooled connections share it; use a temporary directory
+                for throwaway databases.
+            pool_size (int): The maximum number of idle reader connections kept.
+            race_factory (RaceFactory | None): The factory interning loaded races.
+            character_factory (CharacterFactory | None): The factory hydrating
+                loaded characters. Defaults to ``trusted`` mode, since stored
+                rows were valid characters when written.
+        """
+        self._path = path
+        self._race_factory = race_factory or RaceFactory()
+        self._character_factory = character_factory or CharacterFactory(
+            validation_mode=ValidationMode.TRUSTED
+        )
+        self._writer = _connect(path)
+        self._write_lock = Lock()
+        self._readers: LifoQueue[sqlite3.Connection] = LifoQueue(maxsize=pool_size)
+        self._races: dict[int, Race] = {}
+        self._race_ids: dict[Hashable, int] = {}
+        self._race_ids_by_object: dict[int, tuple[Race, int]] = {}
+        self._writer.execute(f"PRAGMA cache_size = -{WRITER_CACHE_KIB}")
+        with self._write_lock, self._writer:
+            self._writer.executescript(SCHEMA)
+            for statement in CHARACTER_INDEXES.values():
+                self._writer.execute(statement)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the writer and every pooled reader connection."""
+        with self._write_lock:
+            self._writer.close()
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except Empty:
+                break
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a reader connection from the pool, opening one if none is idle.
+
+        Yields:
+            sqlite3.Connection: The connection, returned to the pool afterwards
+                or closed if the pool is full.
+        """
+        try:
+            connection = self._readers.get_nowait()
+        except Empty:
+            connection = _connect(self._path)
+        try:
+            yield connection
+        finally:
+            try:
+                self._readers.put_nowait(connection)
+            except Full:
+                connection.close()
+
+    def _race_id(self, race: Race) -> int:
+        """
+        Get the id of a race, inserting it if it is not stored yet.
+
+        Must be called with the write lock held, inside a transaction.
+
+        Args:
+            race (Race): The race.
+
+        Returns:
+            int: The race's row id.
+        """
+        # Races are usually shared instances, so look them up by identity first
+        known = self._race_ids_by_object.get(id(race))
+        if known is not None and known[0] is race:
+            return known[1]
+        key = race_key(race)
+        race_id = self._race_ids.get(key)
+        if race_id is None:
+            row = (
+                race.name,
+                race.description,
+                to_json(dict(sorted(race.base_attributes.items()))).decode(),
+            )
+            self._writer.execute(
+                "INSERT OR IGNORE INTO races (name, description, base_attributes) "
+                "VALUES (?, ?, ?)",
+                row,
+            )
+            (race_id,) = self._writer.execute(
+                "SELECT id FROM races "
+                "WHERE name = ? AND description = ? AND base_attributes = ?",
+                row,
+            ).fetchone()
+            self._race_ids[key] = race_id
+        if len(self._race_ids_by_object) >= _MAX_TRACKED_RACE_OBJECTS:
+            self._race_ids_by_object.clear()
+        self._race_ids_by_object[id(race)] = (race, race_id)
+        return race_id
+
+    def _load_race(self, connection: sqlite3.Connection, race_id: int) -> Race:
+        """
+        Get a stored race by id, loading and interning it on first use.
+
+        Args:
+            connection (sqlite3.Connection): The connection to read with.
+            race_id (int): The race's row id.
+
+        Returns:
+            Race: The shared race instance.
+        """
+        race = self._races.get(race_id)
+        if race is None:
+            name, description, base_attributes = connection.execute(
+                "SELECT name, description, base_attributes FROM races WHERE id = ?",
+                (race_id,),
+            ).fetchone()
+            race = self._race_factory.create_race(
+                name=name,
+                description=description,
+                base_attributes=from_json(base_attributes),
+            )
+            self._races[race_id] = race
+        return race
+
+    def _row(self, character: CharacterInterface) -> tuple[Any, ...]:
+        return (
+            character.get_name(),
+            character.get_age(),
+            character.get_gender(),
+            self._race_id(character.get_race()),
+            *pack_attributes(character.get_attributes()),
+        )
+
+    def add_character(self, character: CharacterInterface) -> int:
+        """
+        Store a single character.
+
+        Args:
+            character (CharacterInterface): The character to store.
+
+        Returns:
+            int: The new character's id.
+
+        Raises:
+            ValueError: If the character's attributes are incomplete.
+        """
+        with self._write_lock:
+            try:
+                with self._writer:
+                    cursor = self._writer.execute(
+                        f"INSERT INTO characters ({', '.join(_CHARACTER_COLUMNS)}) "
+                        f"VALUES ({', '.join('?' * len(_CHARACTER_COLUMNS))})",
+                        self._row(character),
+                    )
+            except BaseException:
+                # A race inserted by the rolled back transaction no longer exists
+                self._race_ids.clear()
+                self._race_ids_by_object.clear()
+                raise
+        return cursor.lastrowid
+
+    def add_characters(
+        self,
+        characters: Iterable[CharacterInterface],
+        chunk_size: int = WRITE_CHUNK_SIZE,
+    ) -> int:
+        """
+        Store many characters in a single transaction.
+
+        Characters are consumed lazily and inserted with ``executemany`` in
+        chunks of ``chunk_size`` rows. When loading into an empty repository,
+        the secondary indexes are dropped and rebuilt once at the end, which
+        is much faster than updating them row by row. If any character is
+        invalid, nothing is stored.
+
+        Args:
+            characters (Iterable[CharacterInterface]): The characters to store.
+            chunk_size (int): The number of rows sent per ``executemany``.
+
+        Returns:
+            int: The number of characters stored.
+
+        Raises:
+            ValueError: If a character's attributes are incomplete.
+        """
+        statement = (
+            f"INSERT INTO characters ({', '.join(_CHARACTER_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(_CHARACTER_COLUMNS))})"
+        )
+        count = 0
+        with self._write_lock:
+            try:
+                with self._writer:
+                    (bulk_load,) = self._writer.execute(
+                        "SELECT NOT EXISTS (SELECT 1 FROM characters)"
+                    ).fetchone()
+                    if bulk_load:
+                        for index in CHARACTER_INDEXES:
+                            self._writer.execute(f"DROP INDEX IF EXISTS {index}")
+                    for chunk in batched(characters, chunk_size, strict=False):
+                        self._writer.executemany(statement, map(self._row, chunk))
+                        count += len(chunk)
+                    if bulk_load:
+                        for index_statement in CHARACTER_INDEXES.values():
+                            self._writer.execute(index_statement)
+                        # Let the planner pick the most selective index
+                        self._writer.execute("ANALYZE characters")
+            except BaseException:
+                # Races inserted by the rolled back transaction no longer exist
+                self._race_ids.clear()
+                self._race_ids_by_object.clear()
+                raise
+        return count
+
+    def delete(self, character_id: int) -> bool:
+        """
+        Delete a stored character.
+
+        Args:
+            character_id (int): The character's id.
+
+        Returns:
+            bool: True if the character existed.
+        """
+        with self._write_lock, self._writer:
+            cursor = self._writer.execute(
+                "DELETE FROM characters WHERE id = ?", (character_id,)
+            )
+        return cursor.rowcount > 0
+
+    def get(self, character_id: int) -> Character | None:
+        """
+        Load a stored character.
+
+        Args:
+            character_id (int): The character's id.
+
+        Returns:
+            Character | None: The character, or None if it does not exist.
+        """
+        with self._reader() as connection:
+            row = connection.execute(
+                f"SELECT id, {', '.join(_CHARACTER_COLUMNS)} FROM characters "
+                "WHERE id = ?",
+                (character_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            return self._hydrate(connection, [row])[0]
+
+    def _hydrate(
+        self, connection: sqlite3.Connection, rows: list[tuple[Any, ...]]
+    ) -> list[Character]:
+        """
+        Build characters from ``id`` + ``_CHARACTER_COLUMNS`` rows.
+
+        Args:
+            connection (sqlite3.Connection): The connection to load races with.
+            rows (list[tuple[Any, ...]]): The rows of one page.
+
+        Returns:
+            list[Character]: The characters, in row order.
+
+        Raises:
+            ValueError: If a stored row is not a valid character.
+        """
+        result = self._character_factory.create_characters(
+            {
+                "name": row[1],
+                "age": row[2],
+                "gender": row[3],
+                "attributes": dict(zip(ATTRIBUTE_NAMES, row[5:], strict=True)),
+                "race": self._load_race(connection, row[4]),
+            }
+            for row in rows
+        )
+        result.raise_for_errors()
+        return result.items
+
+    def _where(
+        self,
+        race: str | None,
+        min_attributes: Mapping[str, int] | None,
+        max_attributes: Mapping[str, int] | None,
+    ) -> tuple[list[str], list[Any]]:
+        """
+        Build the filter clauses of a character query.
+
+        Args:
+            race (str | None): The race name to match.
+            min_attributes (Mapping[str, int] | None): Inclusive lower bounds.
+            max_attributes (Mapping[str, int] | None): Inclusive upper bounds.
+
+        Returns:
+            tuple[list[str], list[Any]]: The SQL conditions and their parameters.
+
+        Raises:
+            ValueError: If an attribute is unknown.
+        """
+        conditions: list[str] = []
+        parameters: list[Any] = []
+        if race is not None:
+            conditions.append("race_id IN (SELECT id FROM races WHERE name = ?)")
+            parameters.append(race)
+        for bounds, operator in ((min_attributes, ">="), (max_attributes, "<=")):
+            for name, value in (bounds or {}).items():
+                # Only known attribute names are interpolated into the SQL
+                if name not in ATTRIBUTE_INDEX:
+                    raise ValueError(f"Unknown attribute: {name}")
+                conditions.append(f"{name} {operator} ?")
+                parameters.append(value)
+        return conditions, parameters
+
+    def count(
+        self,
+        race: str | None = None,
+        min_attributes: Mapping[str, int] | None = None,
+        max_attributes: Mapping[str, int] | None = None,
+    ) -> int:
+        """
+        Count the stored characters matching a query.
+
+        Args:
+            race (str | None): The race name to match.
+            min_attributes (Mapping[str, int] | None): Inclusive lower bounds.
+            max_attributes (Mapping[str, int] | None): Inclusive upper bounds.
+
+        Returns:
+            int: The number of matching characters.
+
+        Raises:
+            ValueError: If an attribute is unknown.
+        """
+        conditions, parameters = self._where(race, min_attributes, max_attributes)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._reader() as connection:
+            (count,) = connection.execute(
+                f"SELECT COUNT(*) FROM characters{where}", parameters
+            ).fetchone()
+        return count
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def query(
+        self,
+        race: str | None = None,
+        min_attributes: Mapping[str, int] | None = None,
+        max_attributes: Mapping[str, int] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[Character]:
+        """
+        Lazily load the stored characters matching a query, in id order.
+
+        Pages of ``page_size`` rows are fetched with keyset pagination, each
+        on a briefly borrowed connection, and only hydrated when reached, so
+        memory use does not depend on the number of results and abandoning
+        the iterator early skips the remaining pages.
+
+        Args:
+            race (str | None): The race name to match, e.g. ``"Elf"``.
+            min_attributes (Mapping[str, int] | None): Inclusive lower bounds,
+                e.g. ``{"strength": 14}``.
+            max_attributes (Mapping[str, int] | None): Inclusive upper bounds.
+            page_size (int): The number of characters fetched per page.
+
+        Yields:
+            Character: The matching characters.
+
+        Raises:
+            ValueError: If an attribute is unknown.
+        """
+        conditions, parameters = self._where(race, min_attributes, max_attributes)
+        conditions.append("id > ?")
+        statement = (
+            f"SELECT id, {', '.join(_CHARACTER_COLUMNS)} FROM characters "
+            f"WHERE {' AND '.join(conditions)} ORDER BY id LIMIT ?"
+        )
+        last_id = 0
+        while True:
+            with self._reader() as connection:
+                rows = connection.execute(
+                    statement, (*parameters, last_id, page_size)
+                ).fetchall()
+                if not rows:
+                    return
+                characters = self._hydrate(connection, rows)
+            yield from characters
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1][0]
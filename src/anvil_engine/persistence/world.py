@@ -0,0 +1,375 @@
+import gc
+import os
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Self
+
+from anvil_engine.factories import CharacterFactory, RaceFactory, ValidationMode
+from anvil_engine.interfaces import CharacterInterface
+from anvil_engine.models import Race
+from anvil_engine.models.attributes import ATTRIBUTE_NAMES, pack_attributes
+from anvil_engine.persistence.wal import (
+    DEFAULT_SYNC_EVERY,
+    DEFAULT_SYNC_INTERVAL,
+    WriteAheadLog,
+    read_log,
+)
+from anvil_engine.roster import RosterSnapshot, write_snapshot
+
+SNAPSHOT_FILE = "world.snapshot"
+LOG_FILE = "world.wal"
+DEFAULT_SNAPSHOT_EVERY = 1_000_000
+
+type WorldKey = str | int
+"""Key of a character in a world store; keys are stored as JSON."""
+
+
+def _fsync_path(path: Path) -> None:
+    """Flush a file, or a directory entry on POSIX, to disk."""
+    if path.is_dir() and os.name != "posix":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def _collection_paused() -> Iterator[None]:
+    """
+    Pause the cyclic garbage collector while hydrating many objects.
+
+    Hydrated characters hold no reference cycles, yet every few hundred
+    allocations trigger a collection that traverses all of them, which
+    costs more than building them.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class WorldStore:
+    """
+    Durable, keyed world state of races and characters.
+
+    The state is held in memory. Every change is appended to a write-ahead
+    log with batched fsync, and every ``snapshot_every`` changes a compact
+    binary roster snapshot of all races and characters replaces the
+    previous one, after which the log starts over. Opening a store maps
+    the snapshot, exposes its characters as lazy ``SnapshotCharacter``
+    views and replays the short log tail, hydrating the logged characters
+    in one batch without validation, since they were valid when written.
+    A restart is thus bounded by the snapshot load speed rather than by
+    building millions of objects; pass ``hydrate=True`` to build Character
+    objects for the whole snapshot, also without validation, instead.
+
+    Log records carry a sequence number and the snapshot records the last
+    one it holds, so a crash at any point, including between writing a
+    snapshot and truncating the log, loses at most the unsynced tail.
+
+    Example:
+        with WorldStore("data/world") as world:
+            world.put("legolas", legolas)
+            world.delete("boromir")
+            world.sync()  # Durable now rather than within the sync interval
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        snapshot_every: int | None = DEFAULT_SNAPSHOT_EVERY,
+        sync_every: int = DEFAULT_SYNC_EVERY,
+        sync_interval: float | None = DEFAULT_SYNC_INTERVAL,
+        race_factory: RaceFactory | None = None,
+        character_factory: CharacterFactory | None = None,
+        hydrate: bool = False,
+    ):
+        """
+        Open a store, loading its snapshot and replaying its log.
+
+        Args:
+            directory (str | os.PathLike[str]): The directory holding the
+                snapshot and the log, created if needed.
+            snapshot_every (int | None): The number of logged changes after
+                which a snapshot is written. None only snapshots on request.
+            sync_every (int): The number of logged changes per fsync.
+            sync_interval (float | None): The longest time in seconds a change
+                stays unsynced. None only syncs every ``sync_every`` changes
+                and on request.
+            race_factory (RaceFactory | None): The factory interning loaded races.
+            character_factory (CharacterFactory | None): The factory hydrating
+                loaded characters. Defaults to ``trusted`` mode.
+            hydrate (bool): Whether to build the snapshot's characters with
+                ``character_factory`` rather than viewing the mapped file.
+
+        Raises:
+            ValueError: If the snapshot or the log is invalid.
+        """
+        if snapshot_every is not None and snapshot_every < 1:
+            raise ValueError("snapshot_every must be positive")
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._snapshot_every = snapshot_every
+        self._race_factory = race_factory or RaceFactory()
+        self._character_factory = character_factory or CharacterFactory(
+            validation_mode=ValidationMode.TRUSTED
+        )
+        self._hydrate = hydrate
+        self._lock = Lock()
+        self._races: list[Race] = []
+        self._race_ids: dict[bytes, int] = {}
+        self._characters: dict[WorldKey, CharacterInterface] = {}
+        self._sequence = 0
+        self._changes = 0
+
+        log_path = self._directory / LOG_FILE
+        try:
+            with _collection_paused():
+                self._load_snapshot()
+                records, valid_size = read_log(log_path)
+                self._replay(records)
+        except (KeyError, TypeError, IndexError, ValueError) as e:
+            raise ValueError(f"Error loading world store from {directory}: {e}") from e
+        self._log = WriteAheadLog(log_path, sync_every, sync_interval, valid_size)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Sync and close the log.
+
+        Characters viewing the snapshot stay readable; the snapshot is
+        unmapped once none of them is referenced any more.
+        """
+        self._log.close()
+
+    @property
+    def characters(self) -> Mapping[WorldKey, CharacterInterface]:
+        """Mapping[WorldKey, CharacterInterface]: Read-only view of the characters."""
+        return MappingProxyType(self._characters)
+
+    @property
+    def races(self) -> tuple[Race, ...]:
+        """tuple[Race, ...]: Every race of the world, in order of registration."""
+        return tuple(self._races)
+
+    @property
+    def sequence(self) -> int:
+        """int: The sequence number of the last change."""
+        return self._sequence
+
+    def __len__(self) -> int:
+        return len(self._characters)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._characters
+
+    def get(self, key: WorldKey) -> CharacterInterface | None:
+        """
+        Get a character.
+
+        Args:
+            key (WorldKey): The character's key.
+
+        Returns:
+            CharacterInterface | None: The character, or None if absent.
+        """
+        return self._characters.get(key)
+
+    def _register_race(self, race: Race, records: list[list[Any]]) -> int:
+        """Get a race's id, registering and logging it if it is new."""
+        content_hash = race.content_hash()
+        race_id = self._race_ids.get(content_hash)
+        if race_id is None:
+            race_id = self._race_ids[content_hash] = len(self._races)
+            self._races.append(race)
+            self._sequence += 1
+            records.append([self._sequence, "race", race_id, race.model_dump()])
+        return race_id
+
+    def add_race(self, race: Race) -> None:
+        """
+        Add a race to the world, even if no character has it yet.
+
+        Args:
+            race (Race): The race.
+        """
+        with self._lock:
+            records: list[list[Any]] = []
+            self._register_race(race, records)
+            self._commit(records)
+
+    def put(self, key: WorldKey, character: CharacterInterface) -> None:
+        """
+        Create or replace a character.
+
+        Args:
+            key (WorldKey): The character's key.
+            character (CharacterInterface): The character.
+
+        Raises:
+            ValueError: If the key is not a string or integer, or the
+                character's attributes are incomplete.
+        """
+        self.put_many(((key, character),))
+
+    def put_many(
+        self,
+        characters: Mapping[WorldKey, CharacterInterface]
+        | Iterable[tuple[WorldKey, CharacterInterface]],
+    ) -> None:
+        """
+        Create or replace characters, logged in one write.
+
+        Args:
+            characters (Mapping[WorldKey, CharacterInterface] |
+                Iterable[tuple[WorldKey, CharacterInterface]]): The
+                characters by key.
+
+        Raises:
+            ValueError: If a key is not a string or integer, or a character's
+                attributes are incomplete. Nothing is changed then.
+        """
+        items = list(
+            characters.items() if isinstance(characters, Mapping) else characters
+        )
+        rows = []
+        for key, character in items:
+            if type(key) not in (str, int):
+                raise ValueError(f"World keys must be strings or integers: {key!r}")
+            rows.append(
+                [
+                    key,
+                    character.get_name(),
+                    character.get_age(),
+                    character.get_gender(),
+                    pack_attributes(character.get_attributes()),
+                ]
+            )
+        with self._lock:
+            records: list[list[Any]] = []
+            for row, (key, character) in zip(rows, items, strict=True):
+                race_id = self._register_race(character.get_race(), records)
+                self._sequence += 1
+                records.append([self._sequence, "put", *row, race_id])
+                self._characters[key] = character
+            self._commit(records)
+
+    def delete(self, key: WorldKey) -> bool:
+        """
+        Delete a character.
+
+        Args:
+            key (WorldKey): The character's key.
+
+        Returns:
+            bool: Whether the character existed.
+        """
+        with self._lock:
+            if self._characters.pop(key, None) is None:
+                return False
+            self._sequence += 1
+            self._commit([[self._sequence, "delete", key]])
+            return True
+
+    def sync(self) -> None:
+        """Make every change durable."""
+        self._log.sync()
+
+    def snapshot(self) -> None:
+        """Write a snapshot of the whole world and start a new log."""
+        with self._lock:
+            self._snapshot()
+
+    def _commit(self, records: list[list[Any]]) -> None:
+        """Log the records of a change and snapshot when enough accumulated."""
+        if not records:
+            return
+        self._log.append_many(records)
+        self._changes += len(records)
+        if self._snapshot_every is not None and self._changes >= self._snapshot_every:
+            self._snapshot()
+
+    def _snapshot(self) -> None:
+        path = self._directory / SNAPSHOT_FILE
+        staging = path.with_name(f"{SNAPSHOT_FILE}.tmp")
+        write_snapshot(
+            staging,
+            self._characters.values(),
+            metadata={
+                "sequence": self._sequence,
+                "keys": list(self._characters),
+                "races": [race.model_dump() for race in self._races],
+            },
+        )
+        _fsync_path(staging)
+        os.replace(staging, path)
+        _fsync_path(self._directory)
+        # A crash before this point replays the log over the new snapshot,
+        # skipping the records it already holds by their sequence number
+        self._log.truncate()
+        self._changes = 0
+
+    def _load_snapshot(self) -> None:
+        path = self._directory / SNAPSHOT_FILE
+        if not path.exists():
+            return
+        snapshot = RosterSnapshot(path, self._race_factory)
+        metadata = snapshot.metadata
+        characters: Iterable[CharacterInterface] = snapshot
+        if self._hydrate:
+            with snapshot:
+                characters = snapshot.to_table().to_characters(self._character_factory)
+        for race in metadata["races"]:
+            self._register_race(self._race_factory.create_race(**race), [])
+        self._characters = dict(zip(metadata["keys"], characters, strict=True))
+        self._sequence = metadata["sequence"]
+
+    def _replay(self, records: list[list[Any]]) -> None:
+        """Apply the log records newer than the snapshot, hydrating in one batch."""
+        rows: dict[WorldKey, dict[str, Any] | None] = {}
+        snapshot_sequence = self._sequence
+        for record in records:
+            sequence, operation, key = record[0], record[1], record[2]
+            if sequence <= snapshot_sequence:
+                continue
+            if operation == "race":
+                if (
+                    self._register_race(self._race_factory.create_race(**record[3]), [])
+                    != key
+                ):
+                    raise ValueError(f"Race {key} logged out of order")
+            elif operation == "put":
+                rows[key] = {
+                    "name": record[3],
+                    "age": record[4],
+                    "gender": record[5],
+                    "attributes": dict(zip(ATTRIBUTE_NAMES, record[6], strict=True)),
+                    "race": self._races[record[7]],
+                }
+            elif operation == "delete":
+                rows[key] = None
+            else:
+                raise ValueError(f"Unknown log operation: {operation}")
+            self._sequence = sequence
+            self._changes += 1
+
+        puts = {key: row for key, row in rows.items() if row is not None}
+        result = self._character_factory.create_characters(puts.values())
+        result.raise_for_errors()
+        for key, row in rows.items():
+            if row is None:
+                self._characters.pop(key, None)
+        self._characters.update(zip(puts, result.items, strict=True))
@@ -0,0 +1,54 @@
+"""
+Roster module for the Anvil Engine RPG system.
+
+This module contains containers and tools for working with large rosters
+of characters, such as the columnar ``CharacterTable`` that stores
+attributes in NumPy arrays for vectorized analytics, streaming NDJSON
+import and export, memory-mapped binary snapshots, the ``RosterIndex``
+answering race and attribute range queries through secondary indexes,
+the trigram ``NameIndex`` for prefix, substring and fuzzy name searches,
+and change sets replicating keyed rosters by their churn.
+"""
+
+from typing import TYPE_CHECKING
+
+from anvil_engine._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .binary import RosterSnapshot, SnapshotCharacter, write_snapshot
+    from .index import RosterIndex
+    from .names import NameIndex
+    from .ndjson import iter_characters, write_characters
+    from .sync import ChangeSet, apply_changeset, diff_rosters
+    from .table import CharacterTable
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ChangeSet": ".sync",
+        "CharacterTable": ".table",
+        "NameIndex": ".names",
+        "RosterIndex": ".index",
+        "RosterSnapshot": ".binary",
+        "SnapshotCharacter": ".binary",
+        "apply_changeset": ".sync",
+        "diff_rosters": ".sync",
+        "iter_characters": ".ndjson",
+        "write_characters": ".ndjson",
+        "write_snapshot": ".binary",
+    },
+)
+
+__all__ = [
+    "ChangeSet",
+    "CharacterTable",
+    "NameIndex",
+    "RosterIndex",
+    "RosterSnapshot",
+    "SnapshotCharacter",
+    "apply_changeset",
+    "diff_rosters",
+    "iter_characters",
+    "write_characters",
+    "write_snapshot",
+]
@@ -0,0 +1,444 @@
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from collections.abc import Hashable, Iterable, Iterator
+from itertools import batched
+from typing import Any, Self
+
+import numpy as np
+from pydantic_core import from_json, to_json
+
+from anvil_engine.factories import RaceFactory
+from anvil_engine.factories.race_registry import race_key
+from anvil_engine.interfaces import CharacterInterface
+from anvil_engine.models import Race
+from anvil_engine.models.attributes import ATTRIBUTE_NAMES
+from anvil_engine.roster.table import CharacterTable, effective_attribute_matrix
+
+MAGIC = b"ANVR"
+VERSION = 1
+
+PREAMBLE = struct.Struct("<4sHHQQQQ")
+"""magic, version, record size, record count, header size, heap size, records offset."""
+
+RECORD = struct.Struct("<QiHHH7h")
+"""name offset, age, name length, gender code, race id, seven attributes."""
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("name_offset", "<u8"),
+        ("age", "<i4"),
+        ("name_length", "<u2"),
+        ("gender", "<u2"),
+        ("race", "<u2"),
+        ("attributes", "<i2", (len(ATTRIBUTE_NAMES),)),
+    ]
+)
+
+WRITE_CHUNK_SIZE = 65_536
+
+
+def write_snapshot(
+    path: str | os.PathLike[str],
+    characters: Iterable[CharacterInterface] | CharacterTable,
+    metadata: dict[str, Any] | None = None,
+) -> int:
+    """
+    Write characters to a binary roster snapshot.
+
+    The file starts with a fixed preamble, followed by a JSON header holding
+    the race and gender dictionaries, a heap of UTF-8 encoded names and
+    finally one fixed-width record per character: name offset and length,
+    age, gender code, race id and the seven attributes as int16. Characters
+    are consumed in chunks, so memory use does not depend on their number.
+
+    Args:
+        path (str | os.PathLike[str]): The file to write.
+        characters (Iterable[CharacterInterface] | CharacterTable): The
+            characters to store, in order.
+        metadata (dict[str, Any] | None): JSON-serializable data stored in the
+            header and returned by ``RosterSnapshot.metadata``.
+
+    Returns:
+        int: The number of characters written.
+
+    Raises:
+        ValueError: If a character cannot be represented in the format.
+    """
+    if isinstance(characters, CharacterTable):
+        tables: Iterable[CharacterTable] = [characters]
+    else:
+        tables = (
+            CharacterTable.from_characters(chunk)
+            for chunk in batched(characters, WRITE_CHUNK_SIZE, strict=False)
+        )
+
+    races: list[Race] = []
+    race_ids: dict[Hashable, int] = {}
+    genders: dict[str, int] = {}
+    count = heap_size = 0
+
+    with tempfile.TemporaryFile() as heap, tempfile.TemporaryFile() as records:
+        for table in tables:
+            race_map = np.empty(len(table.races), dtype=np.uint16)
+            for i, race in enumerate(table.races):
+                key = race_key(race)
+                if key not in race_ids:
+                    race_ids[key] = len(races)
+                    races.append(race)
+                race_map[i] = race_ids[key]
+            gender_map = np.array(
+                [genders.setdefault(g, len(genders)) for g in table.genders],
+                dtype=np.uint16,
+            )
+            if len(races) > 0xFFFF or len(genders) > 0xFFFF:
+                raise ValueError("Too many distinct races or genders")
+
+            names = [name.encode() for name in table.names.tolist()]
+            lengths = np.fromiter(map(len, names), dtype=np.int64, count=len(names))
+            if len(lengths) and lengths.max() > 0xFFFF:
+                raise ValueError("Character name too long for the snapshot format")
+
+            chunk = np.empty(len(table), dtype=RECORD_DTYPE)
+            chunk["name_offset"] = heap_size + np.cumsum(lengths) - lengths
+            chunk["name_length"] = lengths
+            chunk["age"] = table.ages
+            chunk["gender"] = gender_map[table.gender_codes]
+            chunk["race"] = race_map[table.race_codes]
+            chunk["attributes"] = table.attributes
+
+            heap.write(b"".join(names))
+            records.write(chunk.tobytes())
+            heap_size += int(lengths.sum())
+            count += len(table)
+
+        header = to_json(
+            {
+                "races": [race.model_dump() for race in races],
+                "genders": list(genders),
+                "metadata": metadata or {},
+            }
+        )
+        records_offset = PREAMBLE.size + len(header) + heap_size
+        records_offset += -records_offset % 8
+
+        with open(path, "wb") as fp:
+            fp.write(
+                PREAMBLE.pack(
+                    MAGIC,
+                    VERSION,
+                    RECORD.size,
+                    count,
+                    len(header),
+                    heap_size,
+                    records_offset,
+                )
+            )
+            fp.write(header)
+            heap.seek(0)
+            shutil.copyfileobj(heap, fp)
+            fp.write(b"\0" * (records_offset - fp.tell()))
+            records.seek(0)
+            shutil.copyfileobj(records, fp)
+    return count
+
+
+class RosterSnapshot:
+    """
+    Read-only, memory-mapped view of a binary roster snapshot.
+
+    Opening a snapshot only parses its small header: records are decoded
+    lazily from the mapped file when accessed, and the attribute block is
+    exposed as a NumPy array without copying, so even rosters of millions
+    of characters open in milliseconds.
+
+    The ``records``, ``attributes``, ``ages`` and ``race_ids`` arrays are
+    views into the mapped file: they, and any array sliced from them, must
+    be dropped before the snapshot is closed. ``effective_attributes`` and
+    ``to_table`` return copies that outlive the snapshot.
+
+    Example:
+        with RosterSnapshot("roster.bin") as snapshot:
+            strongest = snapshot.attributes[:, 0].argmax()
+            print(snapshot[strongest].get_name())
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], race_factory: RaceFactory | None = None
+    ):
+        """
+        Open a snapshot written by ``write_snapshot``.
+
+        Args:
+            path (str | os.PathLike[str]): The snapshot file.
+            race_factory (RaceFactory | None): The factory interning the races.
+
+        Raises:
+            ValueError: If the file is not a valid roster snapshot.
+        """
+        with open(path, "rb") as fp:
+            try:
+                self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise ValueError(f"Error opening roster snapshot: {e}") from e
+        try:
+            (
+                magic,
+                version,
+                record_size,
+                self._count,
+                header_size,
+                heap_size,
+                self._records_offset,
+            ) = PREAMBLE.unpack_from(self._mmap)
+            if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+                raise ValueError("Not a supported roster snapshot")
+            if (
+                PREAMBLE.size + header_size + heap_size > self._records_offset
+                or self._records_offset + self._count * RECORD.size > len(self._mmap)
+            ):
+                raise ValueError("Truncated roster snapshot")
+
+            header = from_json(self._mmap[PREAMBLE.size : PREAMBLE.size + header_size])
+            race_factory = race_factory or RaceFactory()
+            self._races = tuple(
+                race_factory.create_race(**race) for race in header["races"]
+            )
+            self._genders = tuple(header["genders"])
+            self._metadata: dict[str, Any] = header["metadata"]
+        except (struct.error, KeyError, TypeError, ValueError) as e:
+            self._mmap.close()
+            raise ValueError(f"Error opening roster snapshot: {e}") from e
+        self._heap_offset = PREAMBLE.size + header_size
+        self._records = np.frombuffer(
+            self._mmap,
+            dtype=RECORD_DTYPE,
+            count=self._count,
+            offset=self._records_offset,
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmap the snapshot.
+
+        Character views must no longer be used after closing.
+
+        Raises:
+            BufferError: If a zero-copy array returned by ``records``,
+                ``attributes``, ``ages`` or ``race_ids`` is still referenced.
+        """
+        self._records = None
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> "SnapshotCharacter":
+        """
+        Get a lazy view of the character stored at ``index``.
+
+        Args:
+            index (int): The record position. Negative positions count from
+                the end.
+
+        Returns:
+            SnapshotCharacter: A view decoding fields only when accessed.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Roster snapshot index out of range")
+        return SnapshotCharacter(self, index)
+
+    def __iter__(self) -> Iterator["SnapshotCharacter"]:
+        for index in range(self._count):
+            yield SnapshotCharacter(self, index)
+
+    @property
+    def races(self) -> tuple[Race, ...]:
+        """tuple[Race, ...]: The race dictionary, indexed by race id."""
+        return self._races
+
+    @property
+    def genders(self) -> tuple[str, ...]:
+        """tuple[str, ...]: The gender dictionary, indexed by gender code."""
+        return self._genders
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """dict[str, Any]: The metadata stored by ``write_snapshot``."""
+        return self._metadata
+
+    @property
+    def records(self) -> np.ndarray:
+        """np.ndarray: Zero-copy structured array of the records."""
+        return self._records
+
+    @property
+    def attributes(self) -> np.ndarray:
+        """np.ndarray: Zero-copy N x 7 int16 view of the attribute block."""
+        return self._records["attributes"]
+
+    def effective_attributes(self) -> np.ndarray:
+        """
+        Compute every character's attributes with race modifiers applied.
+
+        Returns:
+            np.ndarray: A new N x 7 int16 matrix in ``ATTRIBUTE_NAMES`` order.
+        """
+        return effective_attribute_matrix(
+            self._records["attributes"], self._records["race"], self._races
+        )
+
+    @property
+    def ages(self) -> np.ndarray:
+        """np.ndarray: Zero-copy view of the ages."""
+        return self._records["age"]
+
+    @property
+    def race_ids(self) -> np.ndarray:
+        """np.ndarray: Zero-copy view of each character's index in ``races``."""
+        return self._records["race"]
+
+    def record(self, index: int) -> tuple[int, ...]:
+        """
+        Decode the raw record stored at ``index``.
+
+        Args:
+            index (int): The record position.
+
+        Returns:
+            tuple[int, ...]: Name offset, age, name length, gender code, race id
+                and the seven attributes.
+        """
+        return RECORD.unpack_from(
+            self._mmap, self._records_offset + index * RECORD.size
+        )
+
+    def name(self, index: int) -> str:
+        """
+        Decode the name of the character stored at ``index``.
+
+        Args:
+            index (int): The record position.
+
+        Returns:
+            str: The character's name.
+        """
+        offset, _, length = RECORD.unpack_from(
+            self._mmap, self._records_offset + index * RECORD.size
+        )[:3]
+        start = self._heap_offset + offset
+        return self._mmap[start : start + length].decode()
+
+    def to_table(self) -> CharacterTable:
+        """
+        Copy the whole snapshot into a CharacterTable.
+
+        Returns:
+            CharacterTable: A table holding every character of the snapshot,
+                independent of the mapped file.
+        """
+        heap_end = self._heap_offset + (
+            int(self._records["name_offset"][-1] + self._records["name_length"][-1])
+            if self._count
+            else 0
+        )
+        heap = self._mmap[self._heap_offset : heap_end]
+        names = [
+            heap[offset : offset + length].decode()
+            for offset, length in zip(
+                self._records["name_offset"].tolist(),
+                self._records["name_length"].tolist(),
+                strict=True,
+            )
+        ]
+        return CharacterTable(
+            names,
+            np.array(self._records["age"], copy=True),
+            np.array(self._records["gender"], copy=True),
+            self._genders,
+            np.array(self._records["race"], copy=True),
+            self._races,
+            np.array(self._records["attributes"], copy=True),
+        )
+
+
+class SnapshotCharacter(CharacterInterface):
+    """
+    Lazy character view over one record of a RosterSnapshot.
+
+    The view only holds the snapshot and a record position; every getter
+    decodes its field from the memory-mapped file when called.
+    """
+
+    __slots__ = ("_index", "_snapshot")
+
+    def __init__(self, snapshot: RosterSnapshot, index: int):
+        """
+        Create a view of a snapshot record.
+
+        Args:
+            snapshot (RosterSnapshot): The snapshot holding the record.
+            index (int): The record position.
+        """
+        self._snapshot = snapshot
+        self._index = index
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(index={self._index}, name={self.get_name()!r})"
+
+    def get_name(self) -> str:
+        """
+        Get the character's name.
+
+        Returns:
+            str: The character's name.
+        """
+        return self._snapshot.name(self._index)
+
+    def get_age(self) -> int:
+        """
+        Get the character's age.
+
+        Returns:
+            int: The character's age in years.
+        """
+        return self._snapshot.record(self._index)[1]
+
+    def get_gender(self) -> str:
+        """
+        Get the character's gender.
+
+        Returns:
+            str: The character's gender.
+        """
+        return self._snapshot.genders[self._snapshot.record(self._index)[3]]
+
+    def get_attributes(self) -> dict[str, int]:
+        """
+        Get the character's attribute scores.
+
+        Returns:
+            dict[str, int]: Dictionary mapping attribute names to their values.
+        """
+        return dict(
+            zip(ATTRIBUTE_NAMES, self._snapshot.record(self._index)[5:], strict=True)
+        )
+
+    def get_race(self) -> Race:
+        """
+        Get the character's race.
+
+        Returns:
+            Race: The race object associated with this character.
+        """
+        return self._snapshot.races[self._snapshot.record(self._index)[4]]
@@ -0,0 +1,461 @@
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Mapping
+
+from anvil_engine.interfaces import CharacterInterface
+from anvil_engine.models.attributes import (
+    ATTRIBUTE_INDEX,
+    ATTRIBUTE_NAMES,
+    pack_attributes,
+)
+
+_HANDLE_BITS = 32
+_HANDLE_MASK = (1 << _HANDLE_BITS) - 1
+
+
+_BUCKET_SIZE = 1_024
+_MIN_KEY = -(2**63)
+_MAX_KEY = 2**63 - 1
+
+
+def _key(value: int, handle: int) -> int:
+    """Encode an attribute value and a handle into one sortable int64 key."""
+    return (value << _HANDLE_BITS) + handle
+
+
+class _SortedKeys:
+    """
+    Sorted multiset of int64 keys stored in bounded ``array`` buckets.
+
+    Inserting into or deleting from a bucket only moves up to twice
+    ``_BUCKET_SIZE`` keys, instead of shifting one large array. Bucket
+    sizes are summed in a Fenwick tree, so counting the keys of a range
+    is O(log n) however many buckets it spans.
+    """
+
+    __slots__ = ("_buckets", "_maxes", "_sizes")
+
+    def __init__(self, keys: list[int] | None = None):
+        """
+        Create the set from keys.
+
+        Args:
+            keys (list[int] | None): The keys, sorted in place.
+        """
+        keys = keys or []
+        keys.sort()
+        self._buckets = [
+            array("q", keys[i : i + _BUCKET_SIZE])
+            for i in range(0, len(keys), _BUCKET_SIZE)
+        ]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+        self._rebuild_sizes()
+
+    def __iter__(self) -> Iterator[int]:
+        for bucket in self._buckets:
+            yield from bucket
+
+    def _rebuild_sizes(self) -> None:
+        """Rebuild the Fenwick tree of bucket sizes after buckets changed."""
+        sizes = [0, *map(len, self._buckets)]
+        for i in range(1, len(sizes)):
+            parent = i + (i & -i)
+            if parent < len(sizes):
+                sizes[parent] += sizes[i]
+        self._sizes = sizes
+
+    def _resize(self, bucket: int, delta: int) -> None:
+        """Add ``delta`` to the size of a bucket in the Fenwick tree."""
+        sizes = self._sizes
+        i = bucket + 1
+        while i < len(sizes):
+            sizes[i] += delta
+            i += i & -i
+
+    def _keys_before(self, bucket: int) -> int:
+        """Count the keys in the buckets before ``bucket``."""
+        sizes = self._sizes
+        total = 0
+        while bucket:
+            total += sizes[bucket]
+            bucket &= bucket - 1
+        return total
+
+    def insert(self, key: int) -> None:
+        if not self._buckets:
+            self._buckets.append(array("q", [key]))
+            self._maxes.append(key)
+            self._rebuild_sizes()
+            return
+        i = min(bisect_left(self._maxes, key), len(self._maxes) - 1)
+        bucket = self._buckets[i]
+        bucket.insert(bisect_left(bucket, key), key)
+        self._maxes[i] = bucket[-1]
+        if len(bucket) > 2 * _BUCKET_SIZE:
+            self._buckets[i : i + 1] = [bucket[:_BUCKET_SIZE], bucket[_BUCKET_SIZE:]]
+            self._maxes[i : i + 1] = [bucket[_BUCKET_SIZE - 1], bucket[-1]]
+            self._rebuild_sizes()
+        else:
+            self._resize(i, 1)
+
+    def remove(self, key: int) -> None:
+        i = bisect_left(self._maxes, key)
+        bucket = self._buckets[i]
+        del bucket[bisect_left(bucket, key)]
+        if bucket:
+            self._maxes[i] = bucket[-1]
+            self._resize(i, -1)
+        else:
+            del self._buckets[i], self._maxes[i]
+            self._rebuild_sizes()
+
+    def _locate(self, key: int, right: bool) -> tuple[int, int]:
+        """Find the (bucket, offset) position where ``key`` would be inserted."""
+        find = bisect_right if right else bisect_left
+        i = find(self._maxes, key)
+        if i == len(self._buckets):
+            return i, 0
+        return i, find(self._buckets[i], key)
+
+    def count(self, low: int, high: int) -> int:
+        """Count the keys within ``[low, high]``."""
+        if low > high:
+            return 0
+        start_bucket, start = self._locate(low, right=False)
+        end_bucket, end = self._locate(high, right=True)
+        if start_bucket == end_bucket:
+            return end - start
+        return (
+            self._keys_before(end_bucket)
+            + end
+            - self._keys_before(start_bucket)
+            - start
+        )
+
+    def range(self, low: int, high: int) -> Iterator[int]:
+        """Iterate over the keys within ``[low, high]``, in order."""
+        if low > high:
+            return
+        start_bucket, start = self._locate(low, right=False)
+        end_bucket, end = self._locate(high, right=True)
+        if start_bucket == end_bucket:
+            if start_bucket < len(self._buckets):
+                yield from self._buckets[start_bucket][start:end]
+            return
+        yield from self._buckets[start_bucket][start:]
+        for bucket in self._buckets[start_bucket + 1 : end_bucket]:
+            yield from bucket
+        if end:
+            yield from self._buckets[end_bucket][:end]
+
+
+class RosterIndex:
+    """
+    In-memory roster with secondary indexes for race and attribute queries.
+
+    Characters are indexed by race name in a hash index, and by every
+    attribute in a sorted int64 array of ``(value, handle)`` keys searched
+    with ``bisect``, split into small buckets so updates stay cheap. A
+    query first counts the matches of each predicate (O(1) for the race,
+    O(log n) for a range), scans only the most selective one and checks
+    the other predicates against each candidate. Adding and removing
+    characters updates every index incrementally.
+
+    Indexed values are captured when a character is added; call ``update``
+    after changing a character's attributes or race.
+
+    Example:
+        index = RosterIndex(characters)
+        dwarves = index.query(
+            race="Dwarf",
+            min_attributes={"strength": 14},
+            max_attributes={"constitution": 12},
+        )
+    """
+
+    __slots__ = (
+        "_attribute_keys",
+        "_attributes",
+        "_characters",
+        "_next_handle",
+        "_race_names",
+        "_races",
+    )
+
+    def __init__(self, characters: Iterable[CharacterInterface] = ()):
+        """
+        Create an index, optionally filled with characters.
+
+        Args:
+            characters (Iterable[CharacterInterface]): The initial characters.
+        """
+        self._characters: dict[int, CharacterInterface] = {}
+        self._attributes: dict[int, tuple[int, ...]] = {}
+        self._race_names: dict[int, str] = {}
+        self._races: dict[str, set[int]] = {}
+        self._attribute_keys = [_SortedKeys() for _ in ATTRIBUTE_NAMES]
+        self._next_handle = 0
+        self.add_many(characters)
+
+    def __len__(self) -> int:
+        return len(self._characters)
+
+    def __contains__(self, handle: object) -> bool:
+        return handle in self._characters
+
+    def __iter__(self) -> Iterator[CharacterInterface]:
+        return iter(self._characters.values())
+
+    def get(self, handle: int) -> CharacterInterface:
+        """
+        Get an indexed character.
+
+        Args:
+            handle (int): The handle returned by ``add``.
+
+        Returns:
+            CharacterInterface: The character.
+
+        Raises:
+            KeyError: If no character has this handle.
+        """
+        return self._characters[handle]
+
+    def _register(self, handle: int, character: CharacterInterface) -> tuple[int, ...]:
+        """
+        Store a character and add it to the race index.
+
+        Args:
+            handle (int): The character's handle.
+            character (CharacterInterface): The character.
+
+        Returns:
+            tuple[int, ...]: The character's packed attributes, still to be added
+                to the attribute indexes.
+        """
+        if handle > _HANDLE_MASK:
+            raise ValueError("Roster index handle space exhausted")
+        attributes = pack_attributes(character.get_attributes())
+        race_name = character.get_race().get_name()
+        self._characters[handle] = character
+        self._attributes[handle] = attributes
+        self._race_names[handle] = race_name
+        self._races.setdefault(race_name, set()).add(handle)
+        return attributes
+
+    def _index(self, handle: int, character: CharacterInterface) -> None:
+        attributes = self._register(handle, character)
+        for keys, value in zip(self._attribute_keys, attributes, strict=True):
+            keys.insert(_key(value, handle))
+
+    def add(self, character: CharacterInterface) -> int:
+        """
+        Add a character to the index.
+
+        Args:
+            character (CharacterInterface): The character to add.
+
+        Returns:
+            int: The character's handle, used to update or remove it.
+
+        Raises:
+            ValueError: If the character's attributes are incomplete.
+        """
+        handle = self._next_handle
+        self._index(handle, character)
+        self._next_handle += 1
+        return handle
+
+    def add_many(self, characters: Iterable[CharacterInterface]) -> list[int]:
+        """
+        Add many characters, sorting each attribute index once.
+
+        Args:
+            characters (Iterable[CharacterInterface]): The characters to add.
+
+        Returns:
+            list[int]: The handle of each character, in order.
+
+        Raises:
+            ValueError: If a character's attributes are incomplete.
+        """
+        handles = []
+        new_keys: list[list[int]] = [[] for _ in ATTRIBUTE_NAMES]
+        try:
+            for character in characters:
+                handle = self._next_handle
+                attributes = self._register(handle, character)
+                for keys, value in zip(new_keys, attributes, strict=True):
+                    keys.append(_key(value, handle))
+                self._next_handle += 1
+                handles.append(handle)
+        except BaseException:
+            # Nothing was added to the attribute indexes yet
+            for handle in handles:
+                self._unregister(handle)
+            raise
+        if handles:
+            for i, keys in enumerate(new_keys):
+                keys.extend(self._attribute_keys[i])
+                self._attribute_keys[i] = _SortedKeys(keys)
+        return handles
+
+    def remove(self, handle: int) -> CharacterInterface:
+        """
+        Remove a character from the index.
+
+        Args:
+            handle (int): The handle returned by ``add``.
+
+        Returns:
+            CharacterInterface: The removed character.
+
+        Raises:
+            KeyError: If no character has this handle.
+        """
+        character, attributes = self._unregister(handle)
+        for keys, value in zip(self._attribute_keys, attributes, strict=True):
+            keys.remove(_key(value, handle))
+        return character
+
+    def _unregister(self, handle: int) -> tuple[CharacterInterface, tuple[int, ...]]:
+        """
+        Forget a character and remove it from the race index.
+
+        Args:
+            handle (int): The character's handle.
+
+        Returns:
+            tuple[CharacterInterface, tuple[int, ...]]: The character and its
+                packed attributes, still to be removed from the attribute indexes.
+        """
+        character = self._characters.pop(handle)
+        attributes = self._attributes.pop(handle)
+        race_name = self._race_names.pop(handle)
+        handles = self._races[race_name]
+        handles.discard(handle)
+        if not handles:
+            del self._races[race_name]
+        return character, attributes
+
+    def update(self, handle: int, character: CharacterInterface) -> None:
+        """
+        Replace an indexed character, keeping its handle.
+
+        Args:
+            handle (int): The handle returned by ``add``.
+            character (CharacterInterface): The new or modified character.
+
+        Raises:
+            KeyError: If no character has this handle.
+            ValueError: If the character's attributes are incomplete.
+        """
+        if handle not in self._characters:
+            raise KeyError(handle)
+        # Validate first so an invalid character leaves the index unchanged
+        pack_attributes(character.get_attributes())
+        self.remove(handle)
+        self._index(handle, character)
+
+    def query_handles(
+        self,
+        race: str | None = None,
+        min_attributes: Mapping[str, int] | None = None,
+        max_attributes: Mapping[str, int] | None = None,
+    ) -> list[int]:
+        """
+        Find the handles of the characters matching every predicate.
+
+        Args:
+            race (str | None): The race name to match, e.g. ``"Dwarf"``.
+            min_attributes (Mapping[str, int] | None): Inclusive lower bounds,
+                e.g. ``{"strength": 14}``.
+            max_attributes (Mapping[str, int] | None): Inclusive upper bounds.
+
+        Returns:
+            list[int]: The matching handles. Without predicates, every handle.
+
+        Raises:
+            ValueError: If an attribute is unknown.
+        """
+        bounds: dict[str, tuple[int | None, int | None]] = {}
+        for name, low in (min_attributes or {}).items():
+            bounds[name] = (low, None)
+        for name, high in (max_attributes or {}).items():
+            bounds[name] = (bounds.get(name, (None, None))[0], high)
+
+        ranges = []
+        for name, (low, high) in bounds.items():
+            try:
+                position = ATTRIBUTE_INDEX[name]
+            except KeyError as e:
+                raise ValueError(f"Unknown attribute: {name}") from e
+            low_key = _MIN_KEY if low is None else _key(low, 0)
+            high_key = _MAX_KEY if high is None else _key(high, _HANDLE_MASK)
+            ranges.append(
+                (
+                    self._attribute_keys[position].count(low_key, high_key),
+                    position,
+                    -math.inf if low is None else low,
+                    math.inf if high is None else high,
+                    low_key,
+                    high_key,
+                )
+            )
+        ranges.sort()
+        race_handles = None if race is None else self._races.get(race, set())
+
+        # Scan the most selective index, then check the other predicates
+        if race_handles is not None and (
+            not ranges or len(race_handles) <= ranges[0][0]
+        ):
+            candidates: Iterable[int] = race_handles
+            race = None
+        elif ranges:
+            _, position, _, _, low_key, high_key = ranges.pop(0)
+            candidates = [
+                key & _HANDLE_MASK
+                for key in self._attribute_keys[position].range(low_key, high_key)
+            ]
+        else:
+            return list(self._characters)
+
+        attributes = self._attributes
+        race_names = self._race_names
+        return [
+            handle
+            for handle in candidates
+            if (race is None or race_names[handle] == race)
+            and all(
+                low <= attributes[handle][position] <= high
+                for _, position, low, high, _, _ in ranges
+            )
+        ]
+
+    def query(
+        self,
+        race: str | None = None,
+        min_attributes: Mapping[str, int] | None = None,
+        max_attributes: Mapping[str, int] | None = None,
+    ) -> list[CharacterInterface]:
+        """
+        Find the characters matching every predicate.
+
+        Args:
+            race (str | None): The race name to match, e.g. ``"Dwarf"``.
+            min_attributes (Mapping[str, int] | None): Inclusive lower bounds,
+                e.g. ``{"strength": 14}``.
+            max_attributes (Mapping[str, int] | None): Inclusive upper bounds.
+
+        Returns:
+            list[CharacterInterface]: The matching characters.
+
+        Raises:
+            ValueError: If an attribute is unknown.
+        """
+        characters = self._characters
+        return [
+            characters[handle]
+            for handle in self.query_handles(race, min_attributes, max_attributes)
+        ]
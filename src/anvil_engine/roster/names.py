@@ -0,0 +1,402 @@
+import math
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import batched
+
+import numpy as np
+
+_START = b"\x02\x02"
+"""Padding before a name, so that its first bytes form prefix trigrams."""
+_END = b"\x03"
+"""Padding after a name, so that its last bytes form a suffix trigram."""
+_SEPARATOR = b"\x00"
+"""Separator between names in the heap, so no match spans two names."""
+
+_MAX_HANDLE = 2**32 - 1
+BUILD_CHUNK_SIZE = 262_144
+_FIRST_CHUNK = 256
+_MAX_CHUNK = 65_536
+_EMPTY = array("I")
+
+
+def _fold(text: str) -> bytes:
+    """Normalize text for case-insensitive matching."""
+    return text.casefold().encode()
+
+
+def _trigrams(data: bytes) -> set[int]:
+    """Encode the distinct byte trigrams of ``data`` as 24-bit integers."""
+    return {int.from_bytes(data[i : i + 3]) for i in range(len(data) - 2)}
+
+
+class NameIndex:
+    """
+    Trigram index answering prefix, substring and fuzzy name searches.
+
+    Names are casefolded and UTF-8 encoded, padded at both ends and split
+    into byte trigrams. Each trigram maps to a posting list of the handles
+    of the names containing it, stored as a sorted ``array`` of uint32, so
+    an indexed name costs about four bytes per distinct trigram plus its
+    folded bytes. Prefix and substring searches intersect the posting
+    lists of the query's trigrams, rarest first and in growing chunks, and
+    verify each candidate against the stored name until ``limit`` matches
+    are found, so a query costs about the size of its rarest posting list
+    rather than the size of the roster. Fuzzy searches rank names by their
+    trigram similarity to the query, tolerating typos and transpositions.
+
+    Handles are assigned in order from 0, so the handles of names added to
+    an empty index in one batch are their positions, e.g. the rows of a
+    CharacterTable. Removed handles are never reused.
+
+    Example:
+        index = NameIndex(table.names)
+        rows = index.prefix("leg")          # Legolas, Legate...
+        rows = index.substring("olas")
+        ranked = index.fuzzy("Lgeolas")     # [(row, similarity), ...]
+    """
+
+    __slots__ = ("_count", "_heap", "_offsets", "_postings", "_sizes")
+
+    def __init__(self, names: Iterable[str] = ()):
+        """
+        Create an index, optionally filled with names.
+
+        Args:
+            names (Iterable[str]): The initial names.
+        """
+        self._postings: dict[int, array] = {}
+        self._heap = bytearray()
+        self._offsets = array("Q")
+        self._sizes = array("H")
+        self._count = 0
+        self.add_many(names)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, handle: object) -> bool:
+        return (
+            isinstance(handle, int)
+            and 0 <= handle < len(self._sizes)
+            and self._sizes[handle] > 0
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """int: Bytes held by the posting lists, the name heap and per-handle arrays."""
+        arrays = (*self._postings.values(), self._offsets, self._sizes)
+        return len(self._heap) + sum(len(a) * a.itemsize for a in arrays)
+
+    def _end(self, handle: int) -> int:
+        """Find the heap offset where the folded name of ``handle`` ends."""
+        if handle + 1 < len(self._offsets):
+            return self._offsets[handle + 1] - len(_SEPARATOR)
+        return len(self._heap) - len(_SEPARATOR)
+
+    def _check_capacity(self, count: int) -> int:
+        handle = len(self._offsets)
+        if handle + count > _MAX_HANDLE:
+            raise ValueError("Name index handle space exhausted")
+        return handle
+
+    def add(self, name: str) -> int:
+        """
+        Add a name to the index.
+
+        Args:
+            name (str): The name, e.g. a character's ``get_name()``.
+
+        Returns:
+            int: The name's handle, used to remove it and returned by searches.
+        """
+        handle = self._check_capacity(1)
+        folded = _fold(name)
+        codes = _trigrams(_START + folded + _END)
+        for code in codes:
+            postings = self._postings.get(code)
+            if postings is None:
+                postings = self._postings[code] = array("I")
+            postings.append(handle)
+        self._offsets.append(len(self._heap))
+        self._heap += folded + _SEPARATOR
+        self._sizes.append(len(codes))
+        self._count += 1
+        return handle
+
+    def add_many(self, names: Iterable[str]) -> range:
+        """
+        Add many names, extracting their trigrams with NumPy in chunks.
+
+        Args:
+            names (Iterable[str]): The names to add.
+
+        Returns:
+            range: The consecutive handles of the names, in order.
+        """
+        first = len(self._offsets)
+        for chunk in batched(names, BUILD_CHUNK_SIZE, strict=False):
+            self._add_chunk([_fold(name) for name in chunk])
+        return range(first, len(self._offsets))
+
+    def _add_chunk(self, folded: list[bytes]) -> None:
+        first = self._check_capacity(len(folded))
+        lengths = np.fromiter(map(len, folded), dtype=np.int64, count=len(folded))
+        padded_lengths = lengths + len(_START) + len(_END)
+        padded = np.frombuffer(
+            _START + (_END + _START).join(folded) + _END, dtype=np.uint8
+        ).astype(np.uint32)
+
+        # A trigram starts at each position but the last two of every name
+        starts = np.cumsum(padded_lengths) - padded_lengths
+        owners = np.repeat(np.arange(len(folded), dtype=np.int64), padded_lengths)
+        local = np.arange(len(padded)) - starts[owners]
+        valid = local < padded_lengths[owners] - 2
+        codes = padded[:-2] << 16 | padded[1:-1] << 8 | padded[2:]
+
+        # Sorting (code, handle) keys dedupes each name's trigrams and groups
+        # them into posting lists of ascending handles in one pass
+        keys = np.unique(
+            codes[valid[:-2]].astype(np.uint64) << 32
+            | (owners[:-2][valid[:-2]] + first).astype(np.uint64)
+        )
+        handles = (keys & 0xFFFFFFFF).astype(np.uint32)
+        codes = (keys >> 32).astype(np.int64)
+        bounds = np.flatnonzero(np.diff(codes)) + 1
+        for code, postings in zip(
+            codes[np.r_[0, bounds]].tolist(),
+            np.split(handles, bounds),
+            strict=True,
+        ):
+            existing = self._postings.get(code)
+            if existing is None:
+                existing = self._postings[code] = array("I")
+            existing.frombytes(postings.tobytes())
+
+        offsets = len(self._heap) + np.cumsum(lengths + len(_SEPARATOR)) - lengths - 1
+        self._offsets.frombytes(offsets.astype(np.uint64).tobytes())
+        self._heap += _SEPARATOR.join(folded) + _SEPARATOR
+        sizes = np.bincount(handles - first, minlength=len(folded))
+        self._sizes.frombytes(sizes.astype(np.uint16).tobytes())
+        self._count += len(folded)
+
+    def remove(self, handle: int) -> None:
+        """
+        Remove a name from the index.
+
+        Its folded bytes stay in the name heap, which is never compacted.
+
+        Args:
+            handle (int): The handle returned by ``add``.
+
+        Raises:
+            KeyError: If no name has this handle.
+        """
+        if handle not in self:
+            raise KeyError(handle)
+        start = self._offsets[handle]
+        folded = bytes(self._heap[start : self._end(handle)])
+        for code in _trigrams(_START + folded + _END):
+            postings = self._postings[code]
+            del postings[bisect_right(postings, handle) - 1]
+            if not postings:
+                del self._postings[code]
+        self._sizes[handle] = 0
+        self._count -= 1
+
+    def _candidates(self, codes: set[int]) -> Iterator[np.ndarray]:
+        """
+        Yield the handles of the names holding all trigrams, in growing chunks.
+
+        Each chunk of the rarest posting list is filtered by binary search
+        in the others, so a search stopping early never reads whole lists.
+
+        Args:
+            codes (set[int]): The trigrams, which must not be empty.
+
+        Yields:
+            np.ndarray: The next matching handles, in ascending order.
+        """
+        lists = sorted((self._postings.get(code, _EMPTY) for code in codes), key=len)
+        rarest = np.frombuffer(lists[0], dtype=np.uint32)
+        others = [np.frombuffer(postings, dtype=np.uint32) for postings in lists[1:]]
+        start, size = 0, _FIRST_CHUNK
+        while start < len(rarest):
+            chunk = rarest[start : start + size]
+            start, size = start + size, min(2 * size, _MAX_CHUNK)
+            for other in others:
+                found = np.minimum(np.searchsorted(other, chunk), len(other) - 1)
+                chunk = chunk[other[found] == chunk]
+                if not len(chunk):
+                    break
+            if len(chunk):
+                yield chunk
+
+    def _scan(self, folded: bytes, limit: int) -> list[int]:
+        """Find names containing ``folded`` by searching the whole heap."""
+        heap, offsets, sizes = self._heap, self._offsets, self._sizes
+        matches: list[int] = []
+        position = heap.find(folded)
+        while 0 <= position < len(heap) and len(matches) < limit:
+            handle = bisect_right(offsets, position) - 1
+            if sizes[handle]:
+                matches.append(handle)
+            position = heap.find(folded, self._end(handle) + len(_SEPARATOR))
+        return matches
+
+    def prefix(self, text: str, limit: int = 10) -> list[int]:
+        """
+        Find names starting with ``text``, ignoring case.
+
+        Args:
+            text (str): The prefix.
+            limit (int): The largest number of handles returned.
+
+        Returns:
+            list[int]: The handles of the first matching names added.
+
+        Raises:
+            ValueError: If the limit is not positive.
+        """
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        folded = _fold(text)
+        codes = _trigrams(_START + folded)
+        if not codes:
+            return self._scan(folded, limit)
+        heap, offsets = self._heap, self._offsets
+        matches: list[int] = []
+        for chunk in self._candidates(codes):
+            for handle in chunk.tolist():
+                if heap.startswith(folded, offsets[handle]):
+                    matches.append(handle)
+                    if len(matches) >= limit:
+                        return matches
+        return matches
+
+    def substring(self, text: str, limit: int = 10) -> list[int]:
+        """
+        Find names containing ``text``, ignoring case.
+
+        Texts shorter than three bytes have no trigram to look up and are
+        searched for in the name heap instead, which is much slower.
+
+        Args:
+            text (str): The text to find.
+            limit (int): The largest number of handles returned.
+
+        Returns:
+            list[int]: The handles of the first matching names added.
+
+        Raises:
+            ValueError: If the limit is not positive.
+        """
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        folded = _fold(text)
+        codes = _trigrams(folded)
+        if not codes:
+            return self._scan(folded, limit)
+        heap, offsets = self._heap, self._offsets
+        matches: list[int] = []
+        for chunk in self._candidates(codes):
+            for handle in chunk.tolist():
+                if heap.find(folded, offsets[handle], self._end(handle)) >= 0:
+                    matches.append(handle)
+                    if len(matches) >= limit:
+                        return matches
+        return matches
+
+    def _similar(
+        self, lists: list[np.ndarray], query_size: int, threshold: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find every name at least ``threshold`` similar to a query.
+
+        A name reaching ``threshold`` shares at least ``threshold`` of the
+        query's trigrams, so it appears in one of the rarest posting lists
+        that leave fewer than that many in the others. Only those lists are
+        read in full; the others are searched for the remaining candidates,
+        dropping those that can no longer reach the threshold.
+
+        Args:
+            lists (list[np.ndarray]): The posting list of each trigram of
+                the query, shortest first.
+            query_size (int): The number of trigrams of the query.
+            threshold (float): The smallest similarity.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The handles of the similar names,
+                ascending, and their similarities.
+        """
+        needed = max(math.ceil(threshold * query_size - 1e-9), 1)
+        split = query_size - needed + 1
+        candidates, shared = np.unique(
+            np.concatenate(lists[:split]), return_counts=True
+        )
+        # Names with far fewer or far more trigrams cannot be similar enough
+        sizes = np.frombuffer(self._sizes, dtype=np.uint16)[candidates].astype(np.int64)
+        fits = (sizes >= needed) & (threshold * sizes <= query_size + 1e-9)
+        candidates, shared, sizes = candidates[fits], shared[fits], sizes[fits]
+        rest = lists[split:]
+        for i, postings in enumerate(rest):
+            viable = shared + len(rest) - i >= needed
+            candidates, shared, sizes = (
+                candidates[viable],
+                shared[viable],
+                sizes[viable],
+            )
+            if not len(candidates):
+                break
+            found = np.minimum(np.searchsorted(postings, candidates), len(postings) - 1)
+            shared += postings[found] == candidates
+        similarity = shared / (query_size + sizes - shared)
+        keep = similarity >= threshold
+        return candidates[keep], similarity[keep]
+
+    def fuzzy(
+        self, text: str, limit: int = 10, threshold: float = 0.3
+    ) -> list[tuple[int, float]]:
+        """
+        Rank names by their trigram similarity to ``text``, ignoring case.
+
+        The similarity of two names is the number of trigrams they share
+        divided by the number of distinct trigrams of both, so a transposed
+        or missing letter only costs the few trigrams it touches. Higher
+        thresholds read fewer posting lists and answer faster.
+
+        Args:
+            text (str): The possibly misspelled name.
+            limit (int): The largest number of results.
+            threshold (float): The smallest similarity, between 0 and 1.
+
+        Returns:
+            list[tuple[int, float]]: Handles and similarities of the most
+                similar names, most similar first.
+
+        Raises:
+            ValueError: If the limit is not positive or the threshold is not
+                within (0, 1].
+        """
+        if limit < 1 or not 0 < threshold <= 1:
+            raise ValueError("limit must be positive and threshold within (0, 1]")
+        codes = _trigrams(_START + _fold(text) + _END)
+        lists = sorted(
+            (
+                np.frombuffer(self._postings.get(code, _EMPTY), dtype=np.uint32)
+                for code in codes
+            ),
+            key=len,
+        )
+        handles, similarity = self._similar(lists, len(codes), threshold)
+        if len(handles) > limit:
+            # Ties with the last similarity kept go to the first names added
+            last = np.partition(similarity, len(handles) - limit)[len(handles) - limit]
+            above = similarity > last
+            ties = np.flatnonzero(similarity == last)[: limit - int(above.sum())]
+            keep = np.union1d(np.flatnonzero(above), ties)
+            handles, similarity = handles[keep], similarity[keep]
+        order = np.lexsort((handles, -similarity))
+        return list(
+            zip(handles[order].tolist(), similarity[order].tolist(), strict=True)
+        )
@@ -0,0 +1,194 @@
+import io
+from collections.abc import Hashable, Iterable, Iterator
+from typing import IO, Any
+
+from pydantic_core import from_json, to_json
+
+from anvil_engine.factories import CharacterFactory, RaceFactory
+from anvil_engine.factories.race_registry import race_key
+from anvil_engine.interfaces import CharacterInterface
+from anvil_engine.models import Character, Race
+
+DEFAULT_CHUNK_SIZE = 1_000
+_MAX_TRACKED_RACE_OBJECTS = 1_024
+
+_RACE_RECORD_KEYS = frozenset({"race_id", "race"})
+"""Keys of a race record line; lines with any other keys are characters."""
+_RACE_RECORD_SHAPE = (
+    '{"race_id": <id>, "race": {"name": ..., "description": ..., '
+    '"base_attributes": {...}}}'
+)
+
+
+def iter_characters(
+    fp: IO[bytes] | IO[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    character_factory: CharacterFactory | None = None,
+    race_factory: RaceFactory | None = None,
+) -> Iterator[Character]:
+    """
+    Lazily read the characters of an NDJSON roster.
+
+    Lines are validated in chunks of ``chunk_size`` rows through the
+    character factory's batch API, and every race is interned so characters
+    of the same race share one Race instance. Besides the race records and
+    race ids written by ``write_characters``, lines with an embedded ``race``
+    object, as produced by ``Character.model_dump_json()``, are accepted.
+    Race records are the lines holding exactly the ``race_id`` and ``race``
+    keys; every other line is read as a character.
+
+    Args:
+        fp (IO[bytes] | IO[str]): The roster file, opened in binary or text mode.
+        chunk_size (int): The number of characters validated at once.
+        character_factory (CharacterFactory | None): The factory validating
+            the characters. Use one in ``trusted`` mode to reload rosters
+            written by ``write_characters``.
+        race_factory (RaceFactory | None): The factory interning the races.
+
+    Yields:
+        Character: The characters of the roster, in file order.
+
+    Raises:
+        ValueError: If a line is not valid JSON, refers to an unknown race or
+            holds an invalid race record or character.
+    """
+    character_factory = character_factory or CharacterFactory()
+    race_factory = race_factory or RaceFactory(
+        validation_mode=character_factory.validation_mode
+    )
+    races: dict[Any, Race] = {}
+    rows: list[Any] = []
+    line_numbers: list[int] = []
+
+    for line_number, line in enumerate(fp, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = from_json(line)
+        except ValueError as e:
+            raise ValueError(f"Error reading line {line_number}: {e}") from e
+        if isinstance(record, dict) and record.keys() == _RACE_RECORD_KEYS:
+            try:
+                races[record["race_id"]] = race_factory.create_race(**record["race"])
+            except (TypeError, ValueError) as e:
+                raise ValueError(
+                    f"Invalid race record on line {line_number}, expected "
+                    f"{_RACE_RECORD_SHAPE}: {e}"
+                ) from e
+            continue
+        if isinstance(record, dict) and "race_id" in record:
+            try:
+                record["race"] = races[record.pop("race_id")]
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"Unknown race id {e} on line {line_number}") from e
+
+        rows.append(record)
+        line_numbers.append(line_number)
+        if len(rows) >= chunk_size:
+            yield from _validate_chunk(character_factory, rows, line_numbers)
+            rows, line_numbers = [], []
+
+    if rows:
+        yield from _validate_chunk(character_factory, rows, line_numbers)
+
+
+def _validate_chunk(
+    factory: CharacterFactory, rows: list[Any], line_numbers: list[int]
+) -> list[Character]:
+    """
+    Validate a chunk of character rows read from a roster.
+
+    Args:
+        factory (CharacterFactory): The factory validating the rows.
+        rows (list[Any]): The raw character rows.
+        line_numbers (list[int]): The line number of each row.
+
+    Returns:
+        list[Character]: The validated characters.
+
+    Raises:
+        ValueError: If a row is invalid, naming its line number.
+    """
+    result = factory.create_characters(rows)
+    if result.errors:
+        error = result.errors[0]
+        detail = error.errors[0]
+        raise ValueError(
+            f"Invalid character on line {line_numbers[error.index]}: "
+            f"{'.'.join(map(str, detail['loc']))}: {detail['msg']}"
+        )
+    return result.items
+
+
+def write_characters(
+    fp: IO[bytes] | IO[str],
+    characters: Iterable[CharacterInterface],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Write characters to an NDJSON roster, consuming them lazily.
+
+    Each distinct race is written once as a race record, before the first
+    character of that race, and characters refer to it by id::
+
+        {"race_id": 0, "race": {"name": "Elf", "description": "...", ...}}
+        {"name": "Legolas", "age": 2931, "gender": "male", "attributes": {...}, "race_id": 0}
+
+    Memory use only depends on the number of distinct races.
+
+    Args:
+        fp (IO[bytes] | IO[str]): The roster file, opened in binary or text mode.
+        characters (Iterable[CharacterInterface]): The characters to write,
+            e.g. a generator over ``iter_characters`` of another roster.
+        chunk_size (int): The number of lines buffered before each write.
+
+    Returns:
+        int: The number of characters written.
+    """
+    text = isinstance(fp, io.TextIOBase)
+    race_ids: dict[Hashable, int] = {}
+    race_ids_by_object: dict[int, tuple[Race, int]] = {}
+    buffer: list[bytes] = []
+    count = 0
+
+    def flush() -> None:
+        data = b"".join(buffer)
+        fp.write(data.decode() if text else data)
+        buffer.clear()
+
+    for character in characters:
+        race = character.get_race()
+        # Races are usually shared instances, so look them up by identity first
+        known = race_ids_by_object.get(id(race))
+        if known is not None and known[0] is race:
+            race_id = known[1]
+        else:
+            key = race_key(race)
+            race_id = race_ids.get(key)
+            if race_id is None:
+                race_id = race_ids[key] = len(race_ids)
+                buffer.append(
+                    to_json({"race_id": race_id, "race": race.model_dump()}) + b"\n"
+                )
+            if len(race_ids_by_object) >= _MAX_TRACKED_RACE_OBJECTS:
+                race_ids_by_object.clear()
+            race_ids_by_object[id(race)] = (race, race_id)
+
+        buffer.append(
+            to_json(
+                {
+                    "name": character.get_name(),
+                    "age": character.get_age(),
+                    "gender": character.get_gender(),
+                    "attributes": character.get_attributes(),
+                    "race_id": race_id,
+                }
+            )
+            + b"\n"
+        )
+        count += 1
+        if len(buffer) >= chunk_size:
+            flush()
+
+    flush()
+    return count
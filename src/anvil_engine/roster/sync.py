@@ -0,0 +1,190 @@
+from collections.abc import Hashable, Mapping, MutableMapping
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+from pydantic_core import from_json, to_json
+
+from anvil_engine.factories import CharacterFactory
+from anvil_engine.models import Character, CompactCharacter
+
+RosterCharacter = Character | CompactCharacter
+"""Characters with a cached content hash, which rosters can be diffed on."""
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeSet:
+    """
+    Difference between two snapshots of a keyed roster.
+
+    Only changed entries are carried, so a change set's size scales with
+    the churn between the snapshots rather than with the roster size.
+
+    Attributes:
+        added (Mapping[Hashable, RosterCharacter]): New characters by key.
+        changed (Mapping[Hashable, RosterCharacter]): New versions of
+            existing characters by key.
+        removed (tuple[Hashable, ...]): Keys of the removed characters.
+        expected (Mapping[Hashable, bytes]): Content hash on the sending side
+            of every changed or removed character before the change, used to
+            detect a receiver whose roster has diverged.
+    """
+
+    added: Mapping[Hashable, RosterCharacter] = field(default_factory=dict)
+    changed: Mapping[Hashable, RosterCharacter] = field(default_factory=dict)
+    removed: tuple[Hashable, ...] = ()
+    expected: Mapping[Hashable, bytes] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.changed) + len(self.removed)
+
+    def to_json(self) -> bytes:
+        """
+        Serialize the change set for replication.
+
+        Races are written once and referenced by position, however many
+        characters share them. Keys must be JSON strings or integers.
+
+        Returns:
+            bytes: The JSON encoded change set.
+        """
+        races: dict[bytes, int] = {}
+        race_rows: list[dict[str, Any]] = []
+
+        def row(character: RosterCharacter) -> dict[str, Any]:
+            race = character.get_race()
+            content_hash = race.content_hash()
+            index = races.get(content_hash)
+            if index is None:
+                index = races[content_hash] = len(race_rows)
+                race_rows.append(race.model_dump())
+            return {
+                "name": character.get_name(),
+                "age": character.get_age(),
+                "gender": character.get_gender(),
+                "attributes": character.get_attributes(),
+                "race": index,
+            }
+
+        return to_json(
+            {
+                "added": [[key, row(c)] for key, c in self.added.items()],
+                "changed": [[key, row(c)] for key, c in self.changed.items()],
+                "removed": list(self.removed),
+                "expected": [[key, h.hex()] for key, h in self.expected.items()],
+                "races": race_rows,
+            }
+        )
+
+    @classmethod
+    def from_json(
+        cls, data: bytes | str, character_factory: CharacterFactory | None = None
+    ) -> Self:
+        """
+        Deserialize a change set written by ``to_json``.
+
+        Characters are validated in one batch and characters of the same race
+        share one interned Race instance.
+
+        Args:
+            data (bytes | str): The JSON encoded change set.
+            character_factory (CharacterFactory | None): The factory creating
+                the characters, e.g. in ``trusted`` mode for an internal link.
+
+        Returns:
+            ChangeSet: The change set, holding Character instances.
+
+        Raises:
+            ValueError: If the data is not a valid change set.
+        """
+        character_factory = character_factory or CharacterFactory()
+        try:
+            document = from_json(data)
+            races = document["races"]
+            entries = [*document["added"], *document["changed"]]
+            result = character_factory.create_characters(
+                {**row, "race": races[row["race"]]} for _, row in entries
+            )
+            result.raise_for_errors()
+            keys = [key for key, _ in entries]
+            added = len(document["added"])
+            return cls(
+                added=dict(zip(keys[:added], result.items[:added], strict=True)),
+                changed=dict(zip(keys[added:], result.items[added:], strict=True)),
+                removed=tuple(document["removed"]),
+                expected={key: bytes.fromhex(h) for key, h in document["expected"]},
+            )
+        except (KeyError, TypeError, IndexError, ValueError) as e:
+            raise ValueError(f"Error loading change set: {e}") from e
+
+
+def diff_rosters(
+    old: Mapping[Hashable, RosterCharacter], new: Mapping[Hashable, RosterCharacter]
+) -> ChangeSet:
+    """
+    Compute the change set turning one roster snapshot into another.
+
+    Characters are compared by their cached content hashes, and the same
+    instance present in both snapshots is skipped without hashing, so
+    diffing costs a dictionary walk plus hashing of the new versions only.
+
+    Args:
+        old (Mapping[Hashable, RosterCharacter]): The previous snapshot.
+        new (Mapping[Hashable, RosterCharacter]): The current snapshot.
+
+    Returns:
+        ChangeSet: The characters added, changed and removed by ``new``.
+    """
+    added: dict[Hashable, RosterCharacter] = {}
+    changed: dict[Hashable, RosterCharacter] = {}
+    expected: dict[Hashable, bytes] = {}
+    for key, character in new.items():
+        previous = old.get(key)
+        if previous is None:
+            added[key] = character
+        elif previous is not character:
+            previous_hash = previous.content_hash()
+            if previous_hash != character.content_hash():
+                changed[key] = character
+                expected[key] = previous_hash
+    removed = tuple(key for key in old if key not in new)
+    for key in removed:
+        expected[key] = old[key].content_hash()
+    return ChangeSet(added, changed, removed, expected)
+
+
+def apply_changeset[R: MutableMapping[Hashable, Any]](
+    roster: R, changeset: ChangeSet, verify: bool = True
+) -> R:
+    """
+    Apply a change set to a roster in place.
+
+    The cost is proportional to the size of the change set. Either every
+    change is applied or, if verification fails, none is.
+
+    Args:
+        roster (R): The receiver's roster, keyed like the sender's.
+        changeset (ChangeSet): The changes to apply.
+        verify (bool): Whether to check first that the roster matches the
+            sender's previous snapshot for every changed or removed key and
+            holds none of the added keys.
+
+    Returns:
+        R: The updated ``roster``.
+
+    Raises:
+        ValueError: If verification fails, meaning the roster has diverged
+            from the sender's and needs a full resynchronization.
+    """
+    if verify:
+        for key in changeset.added:
+            if key in roster:
+                raise ValueError(f"Roster already holds added character {key!r}")
+        for key, content_hash in changeset.expected.items():
+            current = roster.get(key)
+            if current is None or current.content_hash() != content_hash:
+                raise ValueError(f"Roster has diverged at character {key!r}")
+    for key in changeset.removed:
+        roster.pop(key, None)
+    roster.update(changeset.changed)
+    roster.update(changeset.added)
+    return roster
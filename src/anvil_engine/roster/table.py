@@ -0,0 +1,488 @@
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Self
+
+import numpy as np
+
+from anvil_engine.factories import CharacterFactory
+from anvil_engine.interfaces import CharacterInterface
+from anvil_engine.models import Character, Race
+from anvil_engine.models.attributes import (
+    ATTRIBUTE_INDEX,
+    ATTRIBUTE_NAMES,
+    race_modifiers,
+)
+
+NAME_DTYPE = np.dtypes.StringDType()
+AGE_DTYPE = np.dtype(np.int32)
+CODE_DTYPE = np.dtype(np.uint16)
+ATTRIBUTE_DTYPE = np.dtype(np.int16)
+
+
+def effective_attribute_matrix(
+    attributes: np.ndarray, race_codes: np.ndarray, races: Sequence[Race]
+) -> np.ndarray:
+    """
+    Apply race modifiers to a whole attribute matrix at once.
+
+    Args:
+        attributes (np.ndarray): The N x 7 attribute matrix.
+        race_codes (np.ndarray): Index of each row's race within ``races``.
+        races (Sequence[Race]): The race dictionary.
+
+    Returns:
+        np.ndarray: A new N x 7 int16 matrix of effective attributes.
+    """
+    modifiers = np.array(
+        [race_modifiers(race.base_attributes) for race in races],
+        dtype=ATTRIBUTE_DTYPE,
+    ).reshape(len(races), len(ATTRIBUTE_NAMES))
+    return attributes + modifiers[race_codes]
+
+
+def _as_column(values: Sequence | np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """
+    Convert values to an integer column, rejecting values that would wrap.
+
+    Args:
+        values (Sequence | np.ndarray): The values to convert.
+        dtype (np.dtype): The integer dtype of the column.
+
+    Returns:
+        np.ndarray: The values as an array of ``dtype``.
+
+    Raises:
+        ValueError: If a value does not fit in ``dtype``.
+    """
+    array = np.asarray(values)
+    if array.size and array.dtype != dtype:
+        if array.dtype.kind not in "iu":
+            raise ValueError(f"Expected integers, got {array.dtype}")
+        info = np.iinfo(dtype)
+        if array.min() < info.min or array.max() > info.max:
+            raise ValueError(f"Values out of range for {dtype}")
+    return array.astype(dtype, copy=False)
+
+
+class CharacterTable:
+    """
+    Columnar container holding a roster of characters in NumPy arrays.
+
+    Attributes are stored as an N x 7 int16 matrix in ``ATTRIBUTE_NAMES``
+    order, races and genders as categorical code columns and names as a
+    separate string column. Filtering, sorting and top-k selection are
+    vectorized, so roster analytics never touch individual Python objects.
+
+    Example:
+        table = CharacterTable.from_characters(characters)
+        strongest_elves = table.filter(table.race_mask("Elf")).top_k("strength", 100)
+    """
+
+    __slots__ = (
+        "_ages",
+        "_attributes",
+        "_gender_codes",
+        "_genders",
+        "_names",
+        "_race_codes",
+        "_races",
+    )
+
+    def __init__(
+        self,
+        names: Sequence[str] | np.ndarray,
+        ages: Sequence[int] | np.ndarray,
+        gender_codes: Sequence[int] | np.ndarray,
+        genders: Sequence[str],
+        race_codes: Sequence[int] | np.ndarray,
+        races: Sequence[Race],
+        attributes: Sequence[Sequence[int]] | np.ndarray,
+    ):
+        """
+        Create a table from its columns.
+
+        Args:
+            names (Sequence[str] | np.ndarray): The character names.
+            ages (Sequence[int] | np.ndarray): The character ages.
+            gender_codes (Sequence[int] | np.ndarray): Index of each
+                character's gender within ``genders``.
+            genders (Sequence[str]): The distinct genders.
+            race_codes (Sequence[int] | np.ndarray): Index of each
+                character's race within ``races``.
+            races (Sequence[Race]): The distinct races.
+            attributes (Sequence[Sequence[int]] | np.ndarray): N x 7 attribute
+                scores in ``ATTRIBUTE_NAMES`` order.
+
+        Raises:
+            ValueError: If the columns are inconsistent or out of range.
+        """
+        try:
+            self._names = np.asarray(names, dtype=NAME_DTYPE)
+            self._ages = _as_column(ages, AGE_DTYPE)
+            self._gender_codes = _as_column(gender_codes, CODE_DTYPE)
+            self._race_codes = _as_column(race_codes, CODE_DTYPE)
+            self._attributes = _as_column(attributes, ATTRIBUTE_DTYPE).reshape(
+                -1, len(ATTRIBUTE_NAMES)
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Error creating character table: {e}") from e
+        self._genders = tuple(genders)
+        self._races = tuple(races)
+
+        size = len(self._names)
+        columns = (self._ages, self._gender_codes, self._race_codes, self._attributes)
+        if any(len(column) != size for column in columns):
+            raise ValueError("All character table columns must have the same length")
+        if size and (
+            self._gender_codes.max() >= len(self._genders)
+            or self._race_codes.max() >= len(self._races)
+        ):
+            raise ValueError("Categorical code out of range")
+
+    @classmethod
+    def from_characters(cls, characters: Iterable[CharacterInterface]) -> Self:
+        """
+        Build a table from character objects.
+
+        Args:
+            characters (Iterable[CharacterInterface]): The characters to store.
+
+        Returns:
+            CharacterTable: A table holding the given characters in order.
+
+        Raises:
+            ValueError: If a character does not have exactly the seven
+                attributes of ``ATTRIBUTE_NAMES`` or a value is out of range.
+        """
+        names: list[str] = []
+        ages: list[int] = []
+        gender_codes: list[int] = []
+        race_codes: list[int] = []
+        attributes: list[list[int]] = []
+        genders: dict[str, int] = {}
+        races: list[Race] = []
+        race_codes_by_id: dict[int, int] = {}
+
+        for character in characters:
+            race = character.get_race()
+            race_code = race_codes_by_id.get(id(race))
+            if race_code is None:
+                race_code = next(
+                    (i for i, known in enumerate(races) if known == race), len(races)
+                )
+                if race_code == len(races):
+                    races.append(race)
+                race_codes_by_id[id(race)] = race_code
+
+            values = character.get_attributes()
+            if values.keys() != ATTRIBUTE_INDEX.keys():
+                raise ValueError(
+                    f"Character {character.get_name()!r} must have exactly the "
+                    f"attributes {', '.join(ATTRIBUTE_NAMES)}"
+                )
+
+            names.append(character.get_name())
+            ages.append(character.get_age())
+            gender_codes.append(
+                genders.setdefault(character.get_gender(), len(genders))
+            )
+            race_codes.append(race_code)
+            attributes.append([values[name] for name in ATTRIBUTE_NAMES])
+
+        return cls(
+            names,
+            ages,
+            gender_codes,
+            list(genders),
+            race_codes,
+            races,
+            attributes,
+        )
+
+    @classmethod
+    def concat(cls, tables: Sequence[Self]) -> Self:
+        """
+        Concatenate several tables, merging their race and gender categories.
+
+        Args:
+            tables (Sequence[CharacterTable]): The tables to concatenate.
+
+        Returns:
+            CharacterTable: A table holding the rows of every table in order.
+        """
+        genders: dict[str, int] = {}
+        races: list[Race] = []
+        gender_codes: list[np.ndarray] = []
+        race_codes: list[np.ndarray] = []
+        for table in tables:
+            gender_map = np.array(
+                [genders.setdefault(g, len(genders)) for g in table._genders],
+                dtype=CODE_DTYPE,
+            )
+            race_map = np.empty(len(table._races), dtype=CODE_DTYPE)
+            for i, race in enumerate(table._races):
+                code = next((j for j, known in enumerate(races) if known == race), None)
+                if code is None:
+                    code = len(races)
+                    races.append(race)
+                race_map[i] = code
+            gender_codes.append(gender_map[table._gender_codes])
+            race_codes.append(race_map[table._race_codes])
+
+        return cls(
+            np.concatenate([t._names for t in tables]) if tables else [],
+            np.concatenate([t._ages for t in tables]) if tables else [],
+            np.concatenate(gender_codes) if tables else [],
+            list(genders),
+            np.concatenate(race_codes) if tables else [],
+            races,
+            np.concatenate([t._attributes for t in tables]) if tables else [],
+        )
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getitem__(self, index: int) -> Character:
+        """
+        Materialize a single row as a Character.
+
+        Args:
+            index (int): The row position.
+
+        Returns:
+            Character: The character stored at ``index``.
+        """
+        return Character(
+            name=str(self._names[index]),
+            age=int(self._ages[index]),
+            gender=self._genders[self._gender_codes[index]],
+            attributes=dict(
+                zip(ATTRIBUTE_NAMES, self._attributes[index].tolist(), strict=True)
+            ),
+            race=self._races[self._race_codes[index]],
+        )
+
+    @property
+    def names(self) -> np.ndarray:
+        """np.ndarray: The character names."""
+        return self._names
+
+    @property
+    def ages(self) -> np.ndarray:
+        """np.ndarray: The character ages."""
+        return self._ages
+
+    @property
+    def genders(self) -> tuple[str, ...]:
+        """tuple[str, ...]: The distinct genders indexed by ``gender_codes``."""
+        return self._genders
+
+    @property
+    def gender_codes(self) -> np.ndarray:
+        """np.ndarray: Index of each character's gender within ``genders``."""
+        return self._gender_codes
+
+    @property
+    def races(self) -> tuple[Race, ...]:
+        """tuple[Race, ...]: The distinct races indexed by ``race_codes``."""
+        return self._races
+
+    @property
+    def race_codes(self) -> np.ndarray:
+        """np.ndarray: Index of each character's race within ``races``."""
+        return self._race_codes
+
+    @property
+    def attributes(self) -> np.ndarray:
+        """np.ndarray: The N x 7 attribute matrix in ``ATTRIBUTE_NAMES`` order."""
+        return self._attributes
+
+    def effective_attributes(self) -> np.ndarray:
+        """
+        Compute every character's attributes with race modifiers applied.
+
+        Returns:
+            np.ndarray: A new N x 7 int16 matrix in ``ATTRIBUTE_NAMES`` order.
+        """
+        return effective_attribute_matrix(
+            self._attributes, self._race_codes, self._races
+        )
+
+    def column(self, attribute: str) -> np.ndarray:
+        """
+        Get one attribute for every character.
+
+        Args:
+            attribute (str): The attribute name.
+
+        Returns:
+            np.ndarray: A view of the attribute column.
+
+        Raises:
+            ValueError: If the attribute is unknown.
+        """
+        try:
+            return self._attributes[:, ATTRIBUTE_INDEX[attribute]]
+        except KeyError as e:
+            raise ValueError(f"Unknown attribute: {attribute}") from e
+
+    def race_mask(self, *race_names: str) -> np.ndarray:
+        """
+        Select the characters belonging to any of the given races.
+
+        Args:
+            *race_names (str): The race names to match.
+
+        Returns:
+            np.ndarray: A boolean mask over the rows.
+        """
+        codes = [i for i, race in enumerate(self._races) if race.name in race_names]
+        return np.isin(self._race_codes, codes)
+
+    def apply_delta(
+        self, delta: Mapping[str, int], mask: np.ndarray | None = None
+    ) -> Self:
+        """
+        Add attribute deltas to every character, or to the selected ones.
+
+        The table is not modified. The new table shares every column but the
+        attribute matrix with this one.
+
+        Args:
+            delta (Mapping[str, int]): Attribute names mapped to the amount to
+                add, e.g. ``{"strength": 2}``.
+            mask (np.ndarray | None): A boolean mask over the rows to update.
+                Defaults to every row.
+
+        Returns:
+            CharacterTable: The updated table.
+
+        Raises:
+            ValueError: If an attribute is unknown or a result does not fit
+                the attribute column.
+        """
+        changes = np.zeros(len(ATTRIBUTE_NAMES), dtype=np.int32)
+        for attribute, change in delta.items():
+            if attribute not in ATTRIBUTE_INDEX:
+                raise ValueError(f"Unknown attribute: {attribute}")
+            changes[ATTRIBUTE_INDEX[attribute]] = change
+        if mask is None:
+            attributes = self._attributes + changes
+        else:
+            attributes = self._attributes.astype(np.int32)
+            attributes[mask] += changes
+        return type(self)(
+            self._names,
+            self._ages,
+            self._gender_codes,
+            self._genders,
+            self._race_codes,
+            self._races,
+            attributes,
+        )
+
+    def take(self, indices: Sequence[int] | np.ndarray) -> Self:
+        """
+        Select rows by position.
+
+        Args:
+            indices (Sequence[int] | np.ndarray): The row positions, in the
+                order they should appear in the result.
+
+        Returns:
+            CharacterTable: A new table holding the selected rows.
+        """
+        return type(self)(
+            self._names[indices],
+            self._ages[indices],
+            self._gender_codes[indices],
+            self._genders,
+            self._race_codes[indices],
+            self._races,
+            self._attributes[indices],
+        )
+
+    def filter(self, mask: np.ndarray) -> Self:
+        """
+        Select the rows where ``mask`` is true.
+
+        Args:
+            mask (np.ndarray): A boolean mask over the rows, e.g.
+                ``table.column("strength") >= 14``.
+
+        Returns:
+            CharacterTable: A new table holding the selected rows.
+        """
+        return self.take(np.flatnonzero(mask))
+
+    def sort_by(self, attribute: str, descending: bool = False) -> Self:
+        """
+        Sort the rows by an attribute, keeping ties in their current order.
+
+        Args:
+            attribute (str): The attribute to sort by.
+            descending (bool): Whether to put the highest values first.
+
+        Returns:
+            CharacterTable: A new, sorted table.
+        """
+        column = self.column(attribute).astype(np.int32)
+        order = np.argsort(-column if descending else column, kind="stable")
+        return self.take(order)
+
+    def top_k(self, attribute: str, k: int) -> Self:
+        """
+        Select the ``k`` characters with the highest value of an attribute.
+
+        Args:
+            attribute (str): The attribute to rank by.
+            k (int): The number of characters to keep.
+
+        Returns:
+            CharacterTable: A new table with the top rows, highest first.
+        """
+        column = self.column(attribute)
+        k = min(k, len(column))
+        if k <= 0:
+            return self.take(np.empty(0, dtype=np.intp))
+        candidates = np.argpartition(column, len(column) - k)[len(column) - k :]
+        order = candidates[np.argsort(-column[candidates].astype(np.int32))]
+        return self.take(order)
+
+    def to_characters(
+        self, character_factory: CharacterFactory | None = None
+    ) -> list[Character]:
+        """
+        Convert the table back into Character objects.
+
+        Characters of the same race share the same Race instance.
+
+        Args:
+            character_factory (CharacterFactory | None): The factory creating
+                the characters, e.g. in ``trusted`` mode for rows that were
+                valid characters when stored.
+
+        Returns:
+            list[Character]: One character per row, in order.
+        """
+        character_factory = character_factory or CharacterFactory()
+        genders = [self._genders[code] for code in self._gender_codes.tolist()]
+        races = [self._races[code] for code in self._race_codes.tolist()]
+        result = character_factory.create_characters(
+            {
+                "name": name,
+                "age": age,
+                "gender": gender,
+                "attributes": dict(zip(ATTRIBUTE_NAMES, values, strict=True)),
+                "race": race,
+            }
+            for name, age, gender, race, values in zip(
+                self._names.tolist(),
+                self._ages.tolist(),
+                genders,
+                races,
+                self._attributes.tolist(),
+                strict=True,
+            )
+        )
+        result.raise_for_errors()
+        return result.items
@@ -0,0 +1,37 @@
+"""
+Simulation module for the Anvil Engine RPG system.
+
+This module contains a vectorized Monte Carlo combat simulator for
+balance testing: duels between whole batches of characters are fought
+round by round with NumPy, and sweeps between two rosters are sharded
+across processes and reported as win-rate matrices by class and race.
+"""
+
+from typing import TYPE_CHECKING
+
+from anvil_engine._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .balance import BalanceReport, Grouping, WinRateMatrix, simulate_matchups
+    from .combat import DuelRules, simulate_duels
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BalanceReport": ".balance",
+        "DuelRules": ".combat",
+        "Grouping": ".balance",
+        "WinRateMatrix": ".balance",
+        "simulate_duels": ".combat",
+        "simulate_matchups": ".balance",
+    },
+)
+
+__all__ = [
+    "BalanceReport",
+    "DuelRules",
+    "Grouping",
+    "WinRateMatrix",
+    "simulate_duels",
+    "simulate_matchups",
+]
@@ -0,0 +1,295 @@
+import math
+import os
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+
+import numpy as np
+
+from anvil_engine.interfaces import CharacterInterface
+from anvil_engine.matchmaking import RoleClassifier
+from anvil_engine.roster import CharacterTable
+from anvil_engine.simulation.combat import LOSS, WIN, DuelRules, simulate_duels
+
+DEFAULT_SHARD_SIZE = 250_000
+
+_OUTCOMES = 3
+"""Outcome slots of the count arrays: wins, losses and draws of the first side."""
+
+
+class Grouping(StrEnum):
+    """
+    How duel outcomes are grouped in a win-rate matrix.
+
+    Attributes:
+        CLASS: By character class, e.g. ``archer``.
+        RACE: By race name, e.g. ``Elf``.
+        CLASS_AND_RACE: By race and class, e.g. ``Elf archer``.
+    """
+
+    CLASS = "class"
+    RACE = "race"
+    CLASS_AND_RACE = "class_race"
+
+
+@dataclass(frozen=True, slots=True)
+class WinRateMatrix:
+    """
+    Duel outcomes between groups of the first and the second roster.
+
+    Attributes:
+        rows (tuple[str, ...]): The groups of the first roster.
+        columns (tuple[str, ...]): The groups of the second roster.
+        wins (np.ndarray): Duels the row group won against the column group.
+        losses (np.ndarray): Duels the row group lost against the column group.
+        draws (np.ndarray): Drawn duels between the row and column groups.
+    """
+
+    rows: tuple[str, ...]
+    columns: tuple[str, ...]
+    wins: np.ndarray
+    losses: np.ndarray
+    draws: np.ndarray
+
+    @property
+    def duels(self) -> np.ndarray:
+        """np.ndarray: Duels fought between each row and column group."""
+        return self.wins + self.losses + self.draws
+
+    @property
+    def rates(self) -> np.ndarray:
+        """np.ndarray: Win rate of each row group, draws counting half; NaN if none."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (self.wins + self.draws / 2) / self.duels
+
+    def format(self) -> str:
+        """
+        Render the win rates as a text table.
+
+        Returns:
+            str: One line per row group, with its win rate against each
+                column group, or ``-`` where they never met.
+        """
+        width = max(len(label) for label in (*self.rows, *self.columns, "")) + 2
+        lines = ["".ljust(width) + "".join(c.rjust(width) for c in self.columns)]
+        for label, rates in zip(self.rows, self.rates.tolist(), strict=True):
+            cells = "".join(
+                ("-" if math.isnan(rate) else f"{rate:.1%}").rjust(width)
+                for rate in rates
+            )
+            lines.append(label.ljust(width) + cells)
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True, slots=True)
+class BalanceReport:
+    """
+    Outcomes of simulated duels between two rosters, by class and race.
+
+    Attributes:
+        classes (tuple[str, ...]): The character classes.
+        races (tuple[str, ...]): The race names found in either roster.
+        counts (np.ndarray): Outcome counts indexed by the first side's class
+            and race, the second side's class and race, then wins, losses
+            and draws of the first side.
+    """
+
+    classes: tuple[str, ...]
+    races: tuple[str, ...]
+    counts: np.ndarray
+
+    @property
+    def duels(self) -> int:
+        """int: The number of duels fought."""
+        return int(self.counts.sum())
+
+    def win_rates(self, by: Grouping | str = Grouping.CLASS) -> WinRateMatrix:
+        """
+        Aggregate the outcomes into a win-rate matrix.
+
+        Args:
+            by (Grouping | str): How to group the characters.
+
+        Returns:
+            WinRateMatrix: The outcomes between every pair of groups.
+
+        Raises:
+            ValueError: If the grouping is unknown.
+        """
+        by = Grouping(by)
+        if by is Grouping.CLASS:
+            labels = self.classes
+            counts = self.counts.sum(axis=(1, 3))
+        elif by is Grouping.RACE:
+            labels = self.races
+            counts = self.counts.sum(axis=(0, 2))
+        else:
+            labels = tuple(f"{r} {c}" for c in self.classes for r in self.races)
+            size = len(labels)
+            counts = self.counts.reshape(size, size, _OUTCOMES)
+        return WinRateMatrix(
+            rows=labels,
+            columns=labels,
+            wins=counts[..., 0],
+            losses=counts[..., 1],
+            draws=counts[..., 2],
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _Side:
+    """Effective attributes and group code of each character of a roster."""
+
+    attributes: np.ndarray
+    groups: np.ndarray
+
+
+@dataclass(frozen=True, slots=True)
+class _Shard:
+    """Work description of one shard, sent to a worker process."""
+
+    size: int
+    seed: np.random.SeedSequence
+    rules: DuelRules
+    group_count: int
+
+
+_sides: tuple[_Side, ...] = ()
+"""Both rosters, set in each worker process by ``_init_worker``."""
+
+
+def _init_worker(first: _Side, second: _Side) -> None:
+    """Keep the rosters in the worker process, sent once instead of per shard."""
+    global _sides
+    _sides = (first, second)
+
+
+def _run_shard(shard: _Shard, first: _Side, second: _Side) -> np.ndarray:
+    """
+    Fight the duels of one shard between randomly paired characters.
+
+    Args:
+        shard (_Shard): The shard to run.
+        first (_Side): The first roster.
+        second (_Side): The second roster.
+
+    Returns:
+        np.ndarray: Flat outcome counts by first group, second group and outcome.
+    """
+    rng = np.random.default_rng(shard.seed)
+    i = rng.integers(len(first.groups), size=shard.size)
+    j = rng.integers(len(second.groups), size=shard.size)
+    outcomes = simulate_duels(
+        first.attributes[i], second.attributes[j], rng, shard.rules
+    )
+    slots = np.where(outcomes == WIN, 0, np.where(outcomes == LOSS, 1, 2))
+    pairs = first.groups[i].astype(np.int64) * shard.group_count + second.groups[j]
+    return np.bincount(
+        pairs * _OUTCOMES + slots, minlength=shard.group_count**2 * _OUTCOMES
+    )
+
+
+def _run_shard_in_worker(shard: _Shard) -> np.ndarray:
+    return _run_shard(shard, *_sides)
+
+
+def _side(
+    roster: CharacterTable, classifier: RoleClassifier, races: Sequence[str]
+) -> _Side:
+    """Compute a roster's effective attributes and (class, race) group codes."""
+    race_index = np.array(
+        [races.index(race.get_name()) for race in roster.races], dtype=np.int64
+    )
+    classes = classifier.classify_matrix(roster.attributes)
+    return _Side(
+        attributes=roster.effective_attributes(),
+        groups=classes * len(races) + race_index[roster.race_codes],
+    )
+
+
+def simulate_matchups(
+    first: CharacterTable | Iterable[CharacterInterface],
+    second: CharacterTable | Iterable[CharacterInterface],
+    duels: int = 1_000_000,
+    seed: int = 0,
+    rules: DuelRules | None = None,
+    classifier: RoleClassifier | None = None,
+    workers: int | None = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> BalanceReport:
+    """
+    Simulate duels between random pairs drawn from two rosters.
+
+    Each duel pairs a uniformly drawn character of the first roster with
+    one of the second; pass the same roster twice for a self-play sweep.
+    The duels are split into shards of ``shard_size``, each drawing its
+    pairs and dice from its own random stream derived from ``seed``, so
+    the report only depends on ``seed`` and ``shard_size``, not on the
+    number of workers. Both rosters are sent to each worker once, and
+    workers only send back per-group counts.
+
+    Args:
+        first (CharacterTable | Iterable[CharacterInterface]): The first roster.
+        second (CharacterTable | Iterable[CharacterInterface]): The second roster.
+        duels (int): The number of duels to fight.
+        seed (int): The seed making the report reproducible.
+        rules (DuelRules | None): The duel rules. Defaults to ``DuelRules()``.
+        classifier (RoleClassifier | None): Assigns the characters' classes.
+            Defaults to a classifier over the class templates.
+        workers (int | None): The number of worker processes. Defaults to the
+            number of CPUs; with 1, shards are run in this process.
+        shard_size (int): The number of duels per shard.
+
+    Returns:
+        BalanceReport: Outcome counts by class and race of both sides.
+
+    Raises:
+        ValueError: If a roster is empty or the arguments are invalid.
+    """
+    if duels < 0 or shard_size < 1:
+        raise ValueError("duels must not be negative and shard_size must be positive")
+    tables = [
+        roster
+        if isinstance(roster, CharacterTable)
+        else CharacterTable.from_characters(roster)
+        for roster in (first, second)
+    ]
+    if not all(len(table) for table in tables):
+        raise ValueError("Both rosters need at least one character")
+    rules = rules or DuelRules()
+    classifier = classifier or RoleClassifier()
+    races = list(dict.fromkeys(race.get_name() for t in tables for race in t.races))
+    sides = [_side(table, classifier, races) for table in tables]
+
+    group_count = len(classifier.roles) * len(races)
+    shard_count = math.ceil(duels / shard_size)
+    seeds = np.random.SeedSequence(seed).spawn(shard_count)
+    shards = [
+        _Shard(
+            size=min(shard_size, duels - i * shard_size),
+            seed=seeds[i],
+            rules=rules,
+            group_count=group_count,
+        )
+        for i in range(shard_count)
+    ]
+
+    counts = np.zeros(group_count**2 * _OUTCOMES, dtype=np.int64)
+    workers = min(workers or os.cpu_count() or 1, max(shard_count, 1))
+    if workers == 1:
+        for shard in shards:
+            counts += _run_shard(shard, *sides)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=tuple(sides)
+        ) as executor:
+            for shard_counts in executor.map(_run_shard_in_worker, shards):
+                counts += shard_counts
+
+    shape = (len(classifier.roles), len(races))
+    return BalanceReport(
+        classes=classifier.roles,
+        races=tuple(races),
+        counts=counts.reshape(*shape, *shape, _OUTCOMES),
+    )
@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from anvil_engine.models.attributes import ATTRIBUTE_INDEX, ATTRIBUTE_NAMES
+
+WIN = 1
+LOSS = -1
+DRAW = 0
+
+_ATTACK_ATTRIBUTES = [
+    ATTRIBUTE_INDEX["strength"],
+    ATTRIBUTE_INDEX["dexterity"],
+    ATTRIBUTE_INDEX["intelligence"],
+]
+_AGILITY = ATTRIBUTE_INDEX["agility"]
+_CONSTITUTION = ATTRIBUTE_INDEX["constitution"]
+
+
+@dataclass(frozen=True, slots=True)
+class DuelRules:
+    """
+    Rules of a one-on-one duel.
+
+    Both combatants attack every round at the same time. An attack hits
+    when ``d(hit_die) + attack modifier`` reaches the defender's
+    ``defence_base + agility modifier``, and then deals ``d(damage_die) +
+    attack modifier`` damage, at least 1. The attack modifier is
+    ``(score - 10) // 2`` of the best of strength, dexterity and
+    intelligence, so each character fights in melee, at range or with
+    spells, whichever suits it. A combatant starts with ``base_hp +
+    constitution`` hit points and is defeated at 0. A duel where both fall
+    in the same round, or nobody falls within ``max_rounds``, is a draw.
+
+    Attributes:
+        hit_die (int): Faces of the attack roll die.
+        defence_base (int): Defence of a character with an agility of 10.
+        damage_die (int): Faces of the damage die.
+        base_hp (int): Hit points on top of constitution.
+        max_rounds (int): Rounds after which a duel is a draw.
+    """
+
+    hit_die: int = 20
+    defence_base: int = 10
+    damage_die: int = 8
+    base_hp: int = 10
+    max_rounds: int = 50
+
+    def __post_init__(self) -> None:
+        if min(self.hit_die, self.damage_die, self.base_hp, self.max_rounds) < 1:
+            raise ValueError("Dice, base_hp and max_rounds must be positive")
+
+
+def _modifier(scores: np.ndarray) -> np.ndarray:
+    return (scores.astype(np.int32) - 10) // 2
+
+
+def _combat_stats(attributes: np.ndarray, rules: DuelRules) -> np.ndarray:
+    """Derive attack modifier, defence and hit points, one row each."""
+    return np.stack(
+        [
+            _modifier(attributes[:, _ATTACK_ATTRIBUTES].max(axis=1)),
+            rules.defence_base + _modifier(attributes[:, _AGILITY]),
+            rules.base_hp + attributes[:, _CONSTITUTION].astype(np.int32),
+        ]
+    )
+
+
+def simulate_duels(
+    first: np.ndarray,
+    second: np.ndarray,
+    seed: int | np.random.Generator | None = None,
+    rules: DuelRules | None = None,
+) -> np.ndarray:
+    """
+    Fight many duels at once.
+
+    Each round is resolved for every ongoing duel with a handful of NumPy
+    operations, and finished duels are dropped from the working arrays, so
+    the cost is proportional to the number of rounds actually fought.
+
+    Args:
+        first (np.ndarray): N x 7 effective attributes in ``ATTRIBUTE_NAMES``
+            order of one side of each duel, e.g. from
+            ``CharacterTable.effective_attributes()``.
+        second (np.ndarray): N x 7 effective attributes of the other side.
+        seed (int | np.random.Generator | None): A seed or generator making
+            the outcomes reproducible.
+        rules (DuelRules | None): The duel rules. Defaults to ``DuelRules()``.
+
+    Returns:
+        np.ndarray: The int8 outcome of each duel for the first side:
+            ``WIN``, ``LOSS`` or ``DRAW``.
+
+    Raises:
+        ValueError: If the attribute matrices do not have the same N x 7 shape.
+    """
+    rules = rules or DuelRules()
+    first, second = np.asarray(first), np.asarray(second)
+    if first.shape != second.shape or first.shape[1:] != (len(ATTRIBUTE_NAMES),):
+        raise ValueError("Both sides need N x 7 attribute matrices of the same size")
+    rng = np.random.default_rng(seed)
+    outcomes = np.full(len(first), DRAW, dtype=np.int8)
+
+    # Rows: attack, defence and hit points of each side, then the duel index
+    state = np.concatenate(
+        [
+            _combat_stats(first, rules),
+            _combat_stats(second, rules),
+            np.arange(len(first), dtype=np.int32)[None, :],
+        ]
+    )
+    for _ in range(rules.max_rounds):
+        if not state.shape[1]:
+            break
+        attack_a, defence_a, hp_a, attack_b, defence_b, hp_b, index = state
+        hits = rng.integers(
+            1, rules.hit_die, size=(2, len(index)), endpoint=True, dtype=np.int32
+        )
+        damage = rng.integers(
+            1, rules.damage_die, size=(2, len(index)), endpoint=True, dtype=np.int32
+        )
+        hp_b -= (hits[0] + attack_a >= defence_b) * np.maximum(damage[0] + attack_a, 1)
+        hp_a -= (hits[1] + attack_b >= defence_a) * np.maximum(damage[1] + attack_b, 1)
+
+        a_down, b_down = hp_a <= 0, hp_b <= 0
+        ended = a_down | b_down
+        outcomes[index[ended]] = b_down[ended].astype(np.int8) - a_down[ended]
+        state = state[:, ~ended]
+    return outcomes
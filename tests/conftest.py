@@ -8,6 +8,7 @@ all test modules in the project.
 import pytest
 
 from anvil_engine.factories import CharacterFactory, RaceFactory
+from anvil_engine.generation import generate_characters
 
 
 @pytest.fixture
@@ -75,3 +76,25 @@ def sample_race_data():
             "charisma": 10,
         },
     }
+
+
+@pytest.fixture
+def dwarf_race(race_factory):
+    """Provide a dwarf race, a custom race with uneven base attributes."""
+    return race_factory.create_race(
+        name="Dwarf",
+        description="Stout and stubborn mountain folk",
+        base_attributes={"strength": 12, "constitution": 12, "agility": 8},
+    )
+
+
+@pytest.fixture
+def rolled_characters(human_race, elf_race, dwarf_race):
+    """Provide 2,000 characters with rolled attributes across three races."""
+    return generate_characters(
+        2_000,
+        races=[human_race, elf_race, dwarf_race],
+        seed=7,
+        workers=1,
+        stat_method="roll",
+    ).to_characters()
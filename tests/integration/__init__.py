@@ -0,0 +1 @@
+"""Integration tests for the Anvil Engine RPG system."""
@@ -0,0 +1,97 @@
+"""Tests for the HTTP service."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from anvil_engine.api import create_app
+
+
+@pytest.fixture
+def app():
+    """Provide a fresh application."""
+    return create_app()
+
+
+def batch_rows(sample_character_data, count):
+    return [
+        {**sample_character_data, "name": f"Recruit {i}", "race": "elf"}
+        for i in range(count)
+    ]
+
+
+def test_batch_works_in_every_lifespan(app, sample_character_data):
+    rows = batch_rows(sample_character_data, 40)  # Above the inline threshold
+    for _ in range(2):
+        with TestClient(app) as client:
+            response = client.post("/characters/batch", json=rows)
+
+            assert response.status_code == 200
+            assert len(response.json()["items"]) == 40
+
+
+@pytest.fixture
+def client(app):
+    with TestClient(app) as client:
+        yield client
+
+
+def test_race_catalog_supports_conditional_requests(client, elf_race):
+    response = client.get("/races")
+
+    assert response.status_code == 200
+    assert response.json()["elf"] == elf_race.model_dump()
+    etag = response.headers["etag"]
+    assert client.get("/races", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/races/ELF").json() == elf_race.model_dump()
+    assert client.get("/races/orc").status_code == 404
+
+
+def test_create_race(client, sample_race_data):
+    response = client.post("/races", json=sample_race_data)
+
+    assert response.status_code == 201
+    assert response.json() == sample_race_data
+    invalid = client.post("/races", json={**sample_race_data, "name": None})
+    assert invalid.status_code == 422
+    assert invalid.json()["detail"][0]["loc"] == ["name"]
+
+
+def test_create_character_resolves_catalog_races(
+    client, sample_character_data, elf_race
+):
+    response = client.post("/characters", json={**sample_character_data, "race": "elf"})
+
+    assert response.status_code == 201
+    assert response.json()["race"] == elf_race.model_dump()
+    missing = client.post("/characters", json=sample_character_data)
+    assert missing.status_code == 422
+
+
+def test_batches_report_invalid_rows(client, sample_character_data, sample_race_data):
+    rows = batch_rows(sample_character_data, 3)
+    rows[1]["name"] = "X"
+
+    response = client.post("/characters/batch", json=rows)
+
+    assert response.status_code == 207
+    body = response.json()
+    assert [item["name"] for item in body["items"]] == ["Recruit 0", "Recruit 2"]
+    assert body["errors"][0]["index"] == 1
+    races = client.post("/races/batch", json=[sample_race_data, sample_race_data])
+    assert races.status_code == 200
+    assert len(races.json()["items"]) == 2
+    assert client.post("/races/batch", json={}).status_code == 422
+    assert client.post("/characters/batch", content=b"[").status_code == 422
+
+
+def test_stream_characters(client):
+    response = client.get(
+        "/characters/stream", params={"class": "archer", "race": "elf", "count": 2500}
+    )
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert len(lines) == 2500
+    assert lines[-1].startswith('{"name":"Archer 2499"')
+    unknown = client.get("/characters/stream", params={"class": "bard"})
+    assert unknown.status_code == 404
@@ -0,0 +1,61 @@
+"""Allocation regression gate against the committed benchmark baseline."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.suite import (
+    ALLOCATION_SLACK,
+    DEFAULT_THRESHOLD,
+    build_cases,
+    bytes_per_operation,
+    find_regressions,
+)
+
+BASELINE = Path(__file__).parents[2] / "benchmarks" / "baseline.json"
+
+
+@pytest.mark.slow
+def test_allocations_do_not_regress():
+    baseline = json.loads(BASELINE.read_text())["results"]
+    results = {
+        name: {"bytes_per_op": bytes_per_operation(run)}
+        for name, run in build_cases().items()
+    }
+
+    assert set(results) <= set(baseline)
+    assert (
+        find_regressions(
+            results, baseline, DEFAULT_THRESHOLD, metrics=("bytes_per_op",)
+        )
+        == []
+    )
+
+
+@pytest.mark.slow
+def test_gate_reports_regressions():
+    baseline = json.loads(BASELINE.read_text())["results"]
+    name = "character_factory.create_archer"
+    reference = baseline[name]
+    slower = {
+        name: {
+            "ops_per_sec": reference["ops_per_sec"] / 2,
+            "bytes_per_op": reference["bytes_per_op"] * 2,
+        }
+    }
+
+    assert len(find_regressions(slower, baseline, DEFAULT_THRESHOLD)) == 2
+    assert find_regressions(slower, baseline, 1.5) == []
+
+
+def test_small_allocations_may_grow_by_the_slack():
+    baseline = {"create_human": {"ops_per_sec": 1.0, "bytes_per_op": 10.0}}
+
+    def allocating(bytes_per_op):
+        return {"create_human": {"ops_per_sec": 1.0, "bytes_per_op": bytes_per_op}}
+
+    assert find_regressions(allocating(40.0), baseline, DEFAULT_THRESHOLD) == []
+    limit = 10.0 + ALLOCATION_SLACK
+    assert find_regressions(allocating(limit), baseline, DEFAULT_THRESHOLD) == []
+    assert find_regressions(allocating(limit + 1), baseline, DEFAULT_THRESHOLD)
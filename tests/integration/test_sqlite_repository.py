@@ -0,0 +1,90 @@
+"""Tests for the SQLite character repository."""
+
+import pytest
+
+from anvil_engine.persistence import SQLiteCharacterRepository
+
+
+@pytest.fixture
+def repository(tmp_path):
+    with SQLiteCharacterRepository(tmp_path / "roster.db") as repository:
+        yield repository
+
+
+def test_bulk_load_and_query_match_python(repository, rolled_characters):
+    stored = repository.add_characters(rolled_characters, chunk_size=300)
+
+    assert stored == len(repository) == len(rolled_characters)
+    assert list(repository.query(page_size=128)) == rolled_characters
+    strong_dwarves = [
+        character
+        for character in rolled_characters
+        if character.get_race().get_name() == "Dwarf"
+        and 14 <= character.get_attributes()["strength"] <= 17
+    ]
+    query = {
+        "race": "Dwarf",
+        "min_attributes": {"strength": 14},
+        "max_attributes": {"strength": 17},
+    }
+    assert list(repository.query(**query, page_size=50)) == strong_dwarves
+    assert repository.count(**query) == len(strong_dwarves)
+
+
+def test_loaded_races_are_shared(repository, rolled_characters):
+    repository.add_characters(rolled_characters[:50])
+
+    races = {id(character.get_race()) for character in repository.query()}
+
+    assert races <= {id(character.get_race()) for character in rolled_characters}
+
+
+def test_single_rows_can_be_added_read_and_deleted(
+    repository, character_factory, elf_race
+):
+    legolas = character_factory.create_archer("Legolas", 2931, "male", elf_race)
+
+    character_id = repository.add_character(legolas)
+
+    assert repository.get(character_id) == legolas
+    assert repository.delete(character_id)
+    assert not repository.delete(character_id)
+    assert repository.get(character_id) is None
+
+
+def test_failed_bulk_load_stores_nothing(repository, rolled_characters):
+    broken = rolled_characters[0].model_copy(update={"attributes": {"strength": 1}})
+
+    with pytest.raises(ValueError):
+        repository.add_characters([*rolled_characters[:10], broken])
+    assert len(repository) == 0
+    repository.add_characters(rolled_characters[:10])
+    assert len(repository) == 10
+
+
+def test_unknown_attributes_raise(repository):
+    with pytest.raises(ValueError, match="Unknown attribute"):
+        repository.count(min_attributes={"luck": 3})
+
+
+def test_data_survives_reopening(tmp_path, rolled_characters):
+    path = tmp_path / "roster.db"
+    with SQLiteCharacterRepository(path) as repository:
+        repository.add_characters(rolled_characters[:100])
+
+    with SQLiteCharacterRepository(path) as repository:
+        assert list(repository.query()) == rolled_characters[:100]
+
+
+def test_failed_add_does_not_leak_its_race(repository, race_factory, rolled_characters):
+    orc = race_factory.create_race("Orc", "Fierce", {"strength": 14})
+    gnome = race_factory.create_race("Gnomish", "Tinkers", {"intelligence": 14})
+    template = rolled_characters[0]
+    broken = template.model_copy(update={"race": orc, "attributes": {"strength": 1}})
+
+    with pytest.raises(ValueError):
+        repository.add_character(broken)
+    repository.add_character(template.model_copy(update={"race": gnome}))
+    orc_id = repository.add_character(template.model_copy(update={"race": orc}))
+
+    assert repository.get(orc_id).get_race().get_name() == "Orc"
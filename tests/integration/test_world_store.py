@@ -0,0 +1,128 @@
+"""Tests for the world store and its write-ahead log."""
+
+import pytest
+
+from anvil_engine.models import Character
+from anvil_engine.persistence import WorldStore, WriteAheadLog, read_log
+from anvil_engine.persistence.world import LOG_FILE, SNAPSHOT_FILE
+from anvil_engine.roster import SnapshotCharacter
+
+
+def open_store(directory, **options):
+    return WorldStore(directory, sync_interval=None, **options)
+
+
+def contents(world):
+    return {
+        key: (
+            character.get_name(),
+            character.get_age(),
+            character.get_gender(),
+            dict(character.get_attributes()),
+            character.get_race().get_name(),
+        )
+        for key, character in world.characters.items()
+    }
+
+
+@pytest.fixture
+def populated(tmp_path, rolled_characters):
+    with open_store(tmp_path, snapshot_every=None) as world:
+        world.put_many(enumerate(rolled_characters[:300]))
+        world.snapshot()
+        world.put_many(enumerate(rolled_characters[300:350], start=300))
+        world.put("legolas", rolled_characters[400])
+        world.delete(5)
+        expected = contents(world)
+    return tmp_path, expected
+
+
+def test_log_round_trips_and_drops_a_torn_tail(tmp_path):
+    path = tmp_path / "test.wal"
+    with WriteAheadLog(path, sync_interval=None) as log:
+        log.append_many([[1, "put", "a"], [2, "delete", "a"]])
+    valid = path.stat().st_size
+    with open(path, "ab") as fp:
+        fp.write(b"\x10\x00\x00\x00torn")
+
+    records, size = read_log(path)
+
+    assert records == [[1, "put", "a"], [2, "delete", "a"]]
+    assert size == valid
+    with WriteAheadLog(path, sync_interval=None, valid_size=size) as log:
+        log.append([3, "put", "b"])
+    assert read_log(path)[0][-1] == [3, "put", "b"]
+    assert read_log(tmp_path / "missing.wal") == ([], 0)
+
+
+def test_restart_restores_snapshot_and_log_tail(populated):
+    directory, expected = populated
+
+    with open_store(directory) as world:
+        assert contents(world) == expected
+        assert isinstance(world.get(0), SnapshotCharacter)
+        assert isinstance(world.get("legolas"), Character)
+        assert 5 not in world
+        assert {race.get_name() for race in world.races} == {"Human", "Elf", "Dwarf"}
+
+
+def test_hydrated_restart_builds_characters(populated):
+    directory, expected = populated
+
+    with open_store(directory, hydrate=True) as world:
+        assert contents(world) == expected
+        assert all(isinstance(c, Character) for c in world.characters.values())
+
+
+def test_torn_log_tail_loses_only_the_last_change(populated, rolled_characters):
+    directory, expected = populated
+    log = directory / LOG_FILE
+    with open_store(directory) as world:
+        world.put("gimli", rolled_characters[401])
+    with open(log, "r+b") as fp:
+        fp.truncate(log.stat().st_size - 3)
+
+    with open_store(directory) as world:
+        assert contents(world) == expected
+        world.put("gimli", rolled_characters[401])
+    with open_store(directory) as world:
+        assert world.get("gimli").get_name() == rolled_characters[401].get_name()
+
+
+def test_crash_between_snapshot_and_truncate_replays_nothing_twice(populated):
+    directory, expected = populated
+    log = directory / LOG_FILE
+    stale_log = log.read_bytes()
+    with open_store(directory) as world:
+        sequence = world.sequence
+        world.snapshot()
+    log.write_bytes(stale_log)
+
+    with open_store(directory) as world:
+        assert contents(world) == expected
+        assert world.sequence == sequence
+
+
+def test_snapshots_are_taken_automatically(tmp_path, rolled_characters):
+    with open_store(tmp_path, snapshot_every=100) as world:
+        for key, character in enumerate(rolled_characters[:150]):
+            world.put(key, character)
+        expected = contents(world)
+
+    assert (tmp_path / SNAPSHOT_FILE).exists()
+    assert len(read_log(tmp_path / LOG_FILE)[0]) < 100
+    with open_store(tmp_path) as world:
+        assert contents(world) == expected
+
+
+def test_invalid_input_raises(tmp_path, rolled_characters):
+    with pytest.raises(ValueError, match="snapshot_every"):
+        open_store(tmp_path, snapshot_every=0)
+    with open_store(tmp_path) as world:
+        with pytest.raises(ValueError, match="strings or integers"):
+            world.put(1.5, rolled_characters[0])
+        assert len(world) == 0
+        assert not world.delete("nobody")
+    (tmp_path / SNAPSHOT_FILE).write_bytes(b"not a snapshot")
+    with pytest.raises(ValueError, match="Error loading world store"):
+        open_store(tmp_path)
@@ -0,0 +1 @@
+"""Unit tests for the Anvil Engine RPG system."""
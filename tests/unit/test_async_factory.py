@@ -0,0 +1,68 @@
+"""Tests for the asyncio factory front ends."""
+
+import asyncio
+
+import pytest
+
+from anvil_engine.factories import AsyncCharacterFactory, AsyncRaceFactory
+
+
+def character_rows(sample_character_data, race, count):
+    return [
+        {**sample_character_data, "name": f"Recruit {i}", "race": race}
+        for i in range(count)
+    ]
+
+
+def test_batches_are_chunked_in_order_with_shifted_error_indexes(
+    sample_character_data, human_race
+):
+    rows = character_rows(sample_character_data, human_race, 25)
+    rows[13] = {**rows[13], "name": "X"}
+    factory = AsyncCharacterFactory(chunk_size=4, inline_rows=0)
+
+    async def run():
+        async with factory:
+            return await factory.create_characters(rows)
+
+    result = asyncio.run(run())
+
+    assert [c.name for c in result.items] == [
+        row["name"] for i, row in enumerate(rows) if i != 13
+    ]
+    assert [error.index for error in result.errors] == [13]
+
+
+def test_factory_can_be_reopened_on_a_new_loop(sample_character_data, elf_race):
+    rows = character_rows(sample_character_data, elf_race, 40)
+    factory = AsyncCharacterFactory(chunk_size=8, max_concurrency=2)
+
+    async def run():
+        async with factory:
+            return await asyncio.gather(
+                *(factory.create_characters(rows) for _ in range(3))
+            )
+
+    for _ in range(2):
+        results = asyncio.run(run())
+        assert all(len(result.items) == 40 for result in results)
+
+
+def test_race_batches(sample_race_data):
+    factory = AsyncRaceFactory(inline_rows=0)
+
+    async def run():
+        async with factory:
+            return await factory.create_races([sample_race_data, {"name": "X"}])
+
+    result = asyncio.run(run())
+
+    assert [race.name for race in result.items] == ["Test Race"]
+    assert [error.index for error in result.errors] == [1]
+
+
+def test_invalid_limits_raise():
+    with pytest.raises(ValueError):
+        AsyncCharacterFactory(max_concurrency=0)
+    with pytest.raises(ValueError):
+        AsyncRaceFactory(chunk_size=0)
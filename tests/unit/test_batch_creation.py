@@ -0,0 +1,72 @@
+"""Tests for the batch creation API of the factories."""
+
+import pytest
+
+from anvil_engine.factories import BatchResult
+
+
+@pytest.fixture
+def rows(sample_character_data, human_race):
+    row = {**sample_character_data, "race": human_race}
+    return [
+        {**row, "name": "Aragorn"},
+        {**row, "name": "X"},
+        {**row, "name": "Boromir"},
+        {**row, "age": "old"},
+    ]
+
+
+def test_character_batches_report_invalid_rows(character_factory, rows):
+    result = character_factory.create_characters(rows)
+
+    assert not result.ok
+    assert [character.get_name() for character in result.items] == [
+        "Aragorn",
+        "Boromir",
+    ]
+    assert [error.index for error in result.errors] == [1, 3]
+    assert result.errors[0].errors[0]["loc"] == ("name",)
+    assert result.errors[1].errors[0]["loc"] == ("age",)
+    with pytest.raises(ValueError, match="2 invalid row"):
+        result.raise_for_errors()
+
+
+def test_valid_batches_match_single_creation(character_factory, rows):
+    valid = [rows[0], rows[2]]
+
+    result = character_factory.create_characters(valid)
+
+    assert result.ok
+    result.raise_for_errors()
+    assert result.items == [character_factory.create_character(**row) for row in valid]
+
+
+def test_raw_race_mappings_share_one_race(character_factory, sample_character_data):
+    dwarf = {
+        "name": "Dwarf",
+        "description": "Stout and stubborn mountain folk",
+        "base_attributes": {"strength": 12},
+    }
+    rows = [
+        {**sample_character_data, "race": dwarf},
+        {**sample_character_data, "race": dict(dwarf)},
+    ]
+
+    first, second = character_factory.create_characters(rows).items
+
+    assert first.get_race() is second.get_race()
+
+
+def test_race_batches_share_identical_rows(race_factory, sample_race_data):
+    result = race_factory.create_races(
+        [sample_race_data, {**sample_race_data, "name": None}, dict(sample_race_data)]
+    )
+
+    assert [error.index for error in result.errors] == [1]
+    assert result.items[0] is result.items[1]
+    assert result.items[0] is race_factory.create_race(**sample_race_data)
+
+
+def test_empty_batches_succeed(character_factory, race_factory):
+    assert character_factory.create_characters([]) == BatchResult()
+    assert race_factory.create_races([]).ok
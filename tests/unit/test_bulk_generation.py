@@ -0,0 +1,53 @@
+"""Tests for sharded bulk character generation."""
+
+import numpy as np
+import pytest
+
+from anvil_engine.factories.character_factory import CLASS_TEMPLATES
+from anvil_engine.generation import generate_characters
+from anvil_engine.models.attributes import pack_attributes
+
+
+def test_output_does_not_depend_on_the_number_of_workers(human_race, dwarf_race):
+    def generate(workers):
+        return generate_characters(
+            5_000,
+            "archer",
+            races=[human_race, dwarf_race],
+            seed=11,
+            workers=workers,
+            shard_size=1_000,
+            stat_method="point_buy",
+        )
+
+    local, pooled = generate(1), generate(2)
+
+    assert len(local) == 5_000
+    assert np.array_equal(local.names, pooled.names)
+    assert np.array_equal(local.attributes, pooled.attributes)
+    assert np.array_equal(local.race_codes, pooled.race_codes)
+    assert set(local.races) == {human_race, dwarf_race}
+
+
+def test_template_attributes_and_unique_names():
+    table = generate_characters(2_500, "warrior", seed=3, workers=1, shard_size=1_000)
+
+    assert (table.attributes == pack_attributes(CLASS_TEMPLATES["warrior"])).all()
+    assert len(set(table.names.tolist())) == 2_500
+    assert table.to_characters()[0].get_race().get_name() in {"Human", "Elf"}
+
+
+def test_seeds_change_the_draw():
+    first = generate_characters(500, seed=1, workers=1)
+    second = generate_characters(500, seed=2, workers=1)
+
+    assert not np.array_equal(first.ages, second.ages)
+    assert len(generate_characters(0, workers=1)) == 0
+
+
+@pytest.mark.parametrize(
+    "arguments", [{"character_class": "bard"}, {"count": -1}, {"shard_size": 0}]
+)
+def test_invalid_arguments_raise(arguments):
+    with pytest.raises(ValueError):
+        generate_characters(**{"count": 10, **arguments})
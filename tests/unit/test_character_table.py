@@ -0,0 +1,79 @@
+"""Tests for the columnar CharacterTable."""
+
+import numpy as np
+import pytest
+
+from anvil_engine.roster import CharacterTable
+
+
+@pytest.fixture
+def table(rolled_characters):
+    return CharacterTable.from_characters(rolled_characters)
+
+
+def test_round_trips_characters(table, rolled_characters):
+    assert len(table) == len(rolled_characters)
+    assert table[5] == rolled_characters[5]
+    assert table.to_characters() == rolled_characters
+
+
+def test_filter_sort_and_top_k_match_python(table, rolled_characters):
+    strong_elves = table.filter(
+        table.race_mask("Elf") & (table.column("strength") >= 12)
+    )
+    expected = [
+        character
+        for character in rolled_characters
+        if character.get_race().get_name() == "Elf"
+        and character.get_attributes()["strength"] >= 12
+    ]
+    assert strong_elves.to_characters() == expected
+
+    by_agility = sorted(
+        rolled_characters, key=lambda c: c.get_attributes()["agility"], reverse=True
+    )
+    assert table.sort_by("agility", descending=True).to_characters() == by_agility
+    top = table.top_k("agility", 50)
+    assert list(top.column("agility")) == [
+        c.get_attributes()["agility"] for c in by_agility[:50]
+    ]
+    assert len(table.top_k("agility", 0)) == 0
+
+
+def test_effective_attributes_match_characters(table, rolled_characters):
+    effective = table.effective_attributes()
+
+    assert [list(row) for row in effective.tolist()] == [
+        list(character.get_effective_attributes().values())
+        for character in rolled_characters
+    ]
+
+
+def test_apply_delta_returns_an_updated_copy(table):
+    mask = table.race_mask("Dwarf")
+
+    updated = table.apply_delta({"strength": 2}, mask)
+
+    assert np.array_equal(
+        updated.column("strength"), table.column("strength") + 2 * mask
+    )
+    assert np.array_equal(updated.column("agility"), table.column("agility"))
+
+
+def test_concat_merges_category_dictionaries(table, human_race, elf_race):
+    humans = table.filter(table.race_mask("Human"))
+    elves = table.filter(table.race_mask("Elf"))
+
+    merged = CharacterTable.concat([elves, humans])
+
+    assert merged.to_characters() == elves.to_characters() + humans.to_characters()
+    assert {human_race, elf_race} <= set(merged.races)
+
+
+def test_invalid_columns_raise():
+    with pytest.raises(ValueError, match="same length"):
+        CharacterTable(["Aragorn"], [87, 88], [0], ["male"], [0], [], [[10] * 7])
+    with pytest.raises(ValueError, match="out of range"):
+        CharacterTable(["Aragorn"], [87], [1], ["male"], [0], [], [[10] * 7])
+    with pytest.raises(ValueError, match="Unknown attribute"):
+        CharacterTable.from_characters([]).column("luck")
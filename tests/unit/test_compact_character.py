@@ -0,0 +1,60 @@
+"""Tests for the slotted CompactCharacter."""
+
+import sys
+
+import pytest
+
+from anvil_engine.models import CompactCharacter
+from anvil_engine.models.attributes import ATTRIBUTE_NAMES
+
+
+def test_round_trips_characters(rolled_characters):
+    for character in rolled_characters[:200]:
+        compact = CompactCharacter.from_character(character)
+
+        assert compact.get_name() == character.get_name()
+        assert compact.get_attributes() == character.get_attributes()
+        assert compact.get_race() is character.get_race()
+        assert compact.get_effective_attributes() == (
+            character.get_effective_attributes()
+        )
+        assert compact.content_hash() == character.content_hash()
+        assert compact.to_character() == character
+
+
+def test_is_immutable_and_hashable(sample_character_data, human_race):
+    compact = CompactCharacter(**sample_character_data, race=human_race)
+
+    with pytest.raises(AttributeError, match="immutable"):
+        compact.name = "Renamed"
+    twin = CompactCharacter(**sample_character_data, race=human_race)
+    assert compact == twin
+    assert len({compact, twin}) == 1
+    assert not hasattr(compact, "__dict__")
+
+
+def test_is_smaller_than_a_character(
+    character_factory, sample_character_data, human_race
+):
+    character = character_factory.create_character(
+        **sample_character_data, race=human_race
+    )
+    compact = CompactCharacter.from_character(character)
+
+    model_size = sys.getsizeof(character) + sys.getsizeof(character.__dict__)
+    assert sys.getsizeof(compact) < model_size
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"name": "X"},
+        {"age": "25"},
+        {"attributes": {"strength": 10}},
+        {"attributes": {**dict.fromkeys(ATTRIBUTE_NAMES, 10), "strength": "10"}},
+        {"race": "Human"},
+    ],
+)
+def test_invalid_fields_raise(sample_character_data, human_race, changes):
+    with pytest.raises(ValueError):
+        CompactCharacter(**{**sample_character_data, "race": human_race, **changes})
@@ -0,0 +1,46 @@
+"""Tests for race-modified effective attributes."""
+
+import pytest
+
+from anvil_engine.models import Character
+from anvil_engine.models.attributes import ATTRIBUTE_NAMES
+
+
+def test_race_modifiers_are_applied(character_factory, elf_race):
+    archer = character_factory.create_archer("Legolas", 2931, "male", elf_race)
+
+    effective = archer.get_effective_attributes()
+    assert effective == {
+        name: value + elf_race.base_attributes[name] - 10
+        for name, value in archer.get_attributes().items()
+    }
+    with pytest.raises(TypeError):
+        effective["agility"] = 1
+
+
+def test_characters_sharing_race_and_class_share_the_result(
+    character_factory, elf_race
+):
+    first = character_factory.create_archer("Legolas", 2931, "male", elf_race)
+    second = character_factory.create_archer("Tauriel", 600, "female", elf_race)
+
+    assert first.get_effective_attributes() is second.get_effective_attributes()
+
+
+@pytest.mark.parametrize(
+    "attributes",
+    [{"strength": 14}, {"strength": 14, "luck": 3}, {}],
+)
+def test_partial_attributes_count_missing_ones_as_zero(
+    sample_character_data, dwarf_race, attributes
+):
+    character = Character(
+        **{**sample_character_data, "attributes": attributes, "race": dwarf_race}
+    )
+
+    effective = character.get_effective_attributes()
+    assert set(effective) == set(ATTRIBUTE_NAMES)
+    for name in ATTRIBUTE_NAMES:
+        assert effective[name] == attributes.get(name, 0) + (
+            dwarf_race.base_attributes.get(name, 10) - 10
+        )
@@ -0,0 +1,72 @@
+"""Tests for factory call instrumentation."""
+
+from contextlib import nullcontext
+
+import pytest
+
+from anvil_engine.factories import (
+    CharacterFactory,
+    disable_instrumentation,
+    enable_instrumentation,
+)
+
+
+@pytest.fixture
+def metrics():
+    registry = enable_instrumentation()
+    yield registry
+    disable_instrumentation()
+
+
+def test_nested_calls_are_recorded_once(character_factory, human_race, metrics):
+    character_factory.create_archer("Legolas", 2931, "male", human_race)
+    with pytest.raises(ValueError):
+        character_factory.create_archer("X", 2931, "male", human_race)
+
+    snapshot = metrics.snapshot()
+    assert set(snapshot) == {"CharacterFactory.create_archer"}
+    archer = snapshot["CharacterFactory.create_archer"]
+    assert archer["calls"] == 2
+    assert archer["errors"] == {"string_too_short": 1}
+    assert sum(archer["latency_buckets"].values()) == 2
+
+
+def test_batch_rows_are_reported_as_errors(sample_character_data, human_race, metrics):
+    row = {**sample_character_data, "race": human_race}
+    rows = [row, {**row, "name": "X"}]
+
+    CharacterFactory().create_characters(rows)
+
+    batch = metrics.snapshot()["CharacterFactory.create_characters"]
+    assert batch["calls"] == 1
+    assert batch["errors"] == {"string_too_short": 1}
+    assert (
+        'anvil_factory_calls_total{method="CharacterFactory.create_characters"} 1'
+        in metrics.to_prometheus()
+    )
+
+
+def test_spans_wrap_only_outermost_calls(character_factory, human_race):
+    spans = []
+
+    def span_hook(name, attributes):
+        spans.append((name, attributes))
+        return nullcontext()
+
+    enable_instrumentation(span_hook=span_hook)
+    try:
+        character_factory.create_warrior("Gimli", 139, "male", human_race)
+    finally:
+        disable_instrumentation()
+
+    method = "CharacterFactory.create_warrior"
+    assert spans == [(method, {"code.function": method})]
+
+
+def test_disabled_instrumentation_records_nothing(character_factory, human_race):
+    registry = enable_instrumentation()
+    disable_instrumentation()
+
+    character_factory.create_warrior("Gimli", 139, "male", human_race)
+
+    assert registry.snapshot() == {}
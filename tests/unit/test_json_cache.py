@@ -0,0 +1,43 @@
+"""Tests for cached JSON encodings and spliced list serialization."""
+
+from pydantic import TypeAdapter
+
+from anvil_engine.models import Character, Race
+from anvil_engine.models.serialization import dump_characters_json, dump_races_json
+
+
+def test_cached_json_matches_pydantic(rolled_characters, human_race, dwarf_race):
+    characters = rolled_characters[:300]
+
+    for character in characters:
+        assert character.json_bytes() == character.model_dump_json().encode()
+    expected = TypeAdapter(list[Character]).dump_json(characters)
+    assert dump_characters_json(characters) == expected
+    races = [human_race, dwarf_race]
+    assert dump_races_json(races) == TypeAdapter(list[Race]).dump_json(races)
+    assert dump_characters_json([]) == b"[]"
+
+
+def test_encodings_are_computed_once(character_factory, elf_race):
+    legolas = character_factory.create_archer("Legolas", 2931, "male", elf_race)
+
+    assert legolas.json_bytes() is legolas.json_bytes()
+    assert elf_race.json_bytes() is elf_race.json_bytes()
+
+
+def test_copies_render_their_own_json(sample_character_data, human_race):
+    character = Character(**sample_character_data, race=human_race)
+    cached = character.json_bytes()
+
+    renamed = character.model_copy(update={"name": "Renamed Character"})
+
+    assert renamed.json_bytes() == renamed.model_dump_json().encode()
+    assert character.json_bytes() is cached
+
+
+def test_non_ascii_names_round_trip(sample_character_data, elf_race):
+    character = Character(
+        **{**sample_character_data, "name": 'Éowyn "Ǝ"'}, race=elf_race
+    )
+
+    assert Character.model_validate_json(character.json_bytes()) == character
@@ -0,0 +1,63 @@
+"""Tests for lazily imported package exports."""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+PACKAGES = [
+    "anvil_engine",
+    "anvil_engine.api",
+    "anvil_engine.factories",
+    "anvil_engine.generation",
+    "anvil_engine.matchmaking",
+    "anvil_engine.models",
+    "anvil_engine.persistence",
+    "anvil_engine.roster",
+    "anvil_engine.simulation",
+]
+
+
+def test_importing_the_package_loads_no_dependencies():
+    script = (
+        "import sys, anvil_engine, anvil_engine.models, anvil_engine.factories; "
+        "print(sorted({'pydantic', 'numpy'} & sys.modules.keys()))"
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+
+    assert output.strip() == "[]"
+
+
+def test_model_schemas_are_built_on_first_use():
+    script = (
+        "from anvil_engine.models import Character; "
+        "print(Character.__pydantic_complete__); "
+        "Character.model_json_schema(); "
+        "print(Character.__pydantic_complete__)"
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+
+    assert output.split() == ["False", "True"]
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_every_export_resolves(package):
+    module = importlib.import_module(package)
+
+    assert set(module.__all__) <= set(dir(module))
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+
+
+def test_unknown_names_raise_attribute_error():
+    module = importlib.import_module("anvil_engine")
+
+    with pytest.raises(AttributeError, match="has no attribute 'Dragon'"):
+        _ = module.Dragon
@@ -0,0 +1,125 @@
+"""Tests for role classification, the attribute grid and the match queue."""
+
+import random
+
+import numpy as np
+import pytest
+
+from anvil_engine.matchmaking import (
+    AttributeGrid,
+    MatchQueue,
+    RoleClassifier,
+    chebyshev,
+)
+from anvil_engine.models.attributes import pack_attributes
+
+
+@pytest.fixture
+def vectors():
+    rng = random.Random(11)
+    return [tuple(rng.randint(-8, 8) for _ in range(7)) for _ in range(600)]
+
+
+@pytest.mark.parametrize("cell_size", [None, 1, 5])
+def test_grid_queries_match_brute_force(vectors, cell_size):
+    grid = AttributeGrid[int](radius=4, cell_size=cell_size)
+    for handle, vector in enumerate(vectors):
+        grid.insert(handle, vector)
+    queries = [*vectors[:40], (0,) * 7, (30,) * 7]
+
+    for query in queries:
+        ranked = sorted(
+            (chebyshev(query, vector), handle)
+            for handle, vector in enumerate(vectors)
+            if chebyshev(query, vector) <= 4
+        )
+        assert sorted(grid.within(query)) == sorted(handle for _, handle in ranked)
+        assert grid.k_nearest(query, 5) == [handle for _, handle in ranked[:5]]
+        assert grid.nearest(query) == (ranked[0][1] if ranked else None)
+
+
+def test_grid_insert_and_remove():
+    grid = AttributeGrid[str](radius=3)
+    grid.insert("gimli", (15, 9, 8, 9, 11, 14, 4))
+
+    assert "gimli" in grid
+    assert grid.nearest((14, 10, 8, 9, 12, 13, 5)) == "gimli"
+    with pytest.raises(ValueError, match="already in grid"):
+        grid.insert("gimli", (0,) * 7)
+    assert grid.remove("gimli")
+    assert not grid.remove("gimli")
+    assert len(grid) == 0
+    assert grid.nearest((15, 9, 8, 9, 11, 14, 4)) is None
+    with pytest.raises(ValueError):
+        AttributeGrid(radius=-1)
+
+
+def test_classifier_recognises_class_templates(character_factory, elf_race):
+    classifier = RoleClassifier()
+    legolas = character_factory.create_archer("Legolas", 2931, "male", elf_race)
+    gimli = character_factory.create_warrior("Gimli", 139, "male", elf_race)
+
+    assert classifier.classify(legolas) == "archer"
+    assert classifier.classify(gimli) == "warrior"
+    with pytest.raises(ValueError, match="Unknown role"):
+        classifier.template("bard")
+
+
+def test_vectorized_classification_matches_single(rolled_characters):
+    classifier = RoleClassifier()
+    characters = rolled_characters[:500]
+    packed = np.array([pack_attributes(c.get_attributes()) for c in characters])
+
+    expected = [classifier.classify(character) for character in characters]
+
+    assert classifier.classify_many(characters) == expected
+    indexes = classifier.classify_matrix(packed).tolist()
+    assert [classifier.roles[index] for index in indexes] == expected
+
+
+def test_queue_forms_parties_of_the_composition(rolled_characters):
+    queue = MatchQueue({"warrior": 2, "archer": 1})
+    characters = rolled_characters[:600]
+
+    parties = queue.add_many(characters)
+
+    assert parties
+    for party in parties:
+        assert sorted(party.roles) == ["archer", "warrior", "warrior"]
+        assert party.spread <= 2 * queue.tolerance
+        assert all(member not in queue for member in party.members)
+    formed = sum(len(party.members) for party in parties)
+    assert formed + len(queue) == len(characters)
+    assert sum(queue.waiting().values()) == len(queue)
+
+
+def test_single_adds_match_batched_adds(rolled_characters):
+    characters = rolled_characters[:300]
+    batched = MatchQueue().add_many(characters)
+    queue = MatchQueue()
+
+    single = [party for c in characters if (party := queue.add(c)) is not None]
+
+    assert [party.members for party in single] == [p.members for p in batched]
+
+
+def test_queued_characters_can_leave(rolled_characters):
+    queue = MatchQueue({"warrior": 3})
+    character = next(
+        c for c in rolled_characters if RoleClassifier().classify(c) == "warrior"
+    )
+
+    assert queue.add(character) is None
+    assert character in queue
+    with pytest.raises(ValueError, match="already queued"):
+        queue.add(character)
+    assert queue.remove(character)
+    assert not queue.remove(character)
+    assert queue.waiting() == {"warrior": 0}
+
+
+def test_invalid_compositions_raise():
+    with pytest.raises(ValueError, match="Unknown roles: bard"):
+        MatchQueue({"bard": 1})
+    with pytest.raises(ValueError, match="at least one member"):
+        MatchQueue({"archer": 0})
@@ -0,0 +1,110 @@
+"""Tests for the trigram name index."""
+
+import random
+
+import pytest
+
+from anvil_engine.roster import CharacterTable, NameIndex
+
+SYLLABLES = ["le", "go", "las", "gim", "li", "ara", "gorn", "éo", "wyn", "bo", "ro"]
+
+
+def padded_trigrams(name):
+    data = b"\x02\x02" + name.casefold().encode() + b"\x03"
+    return {data[i : i + 3] for i in range(len(data) - 2)}
+
+
+@pytest.fixture
+def names():
+    rng = random.Random(3)
+    names = [
+        "".join(rng.choices(SYLLABLES, k=rng.randint(1, 4))).title()
+        for _ in range(3_000)
+    ]
+    return [*names, "Legolas", "LEGOLAS", "Lególas"]
+
+
+@pytest.fixture
+def index(names):
+    return NameIndex(names)
+
+
+@pytest.mark.parametrize("text", ["l", "le", "LEG", "gorn", "éow", "xyz"])
+def test_prefix_matches_brute_force(index, names, text):
+    expected = [
+        i for i, n in enumerate(names) if n.casefold().startswith(text.casefold())
+    ]
+
+    assert index.prefix(text, limit=len(names)) == expected
+    assert index.prefix(text, limit=5) == expected[:5]
+
+
+@pytest.mark.parametrize("text", ["o", "go", "olas", "RAGO", "wynbo", "zzz"])
+def test_substring_matches_brute_force(index, names, text):
+    expected = [i for i, n in enumerate(names) if text.casefold() in n.casefold()]
+
+    assert index.substring(text, limit=len(names)) == expected
+    assert index.substring(text, limit=3) == expected[:3]
+
+
+def test_fuzzy_ranks_by_trigram_similarity(index, names):
+    query = padded_trigrams("Lgeolas")
+    scored = []
+    for handle, name in enumerate(names):
+        trigrams = padded_trigrams(name)
+        similarity = len(query & trigrams) / len(query | trigrams)
+        if similarity >= 0.3:
+            scored.append((-similarity, handle))
+    expected = [handle for _, handle in sorted(scored)[:10]]
+
+    ranked = index.fuzzy("Lgeolas")
+
+    assert [handle for handle, _ in ranked] == expected
+    assert names.index("Legolas") in [handle for handle, _ in ranked]
+    similarities = [similarity for _, similarity in ranked]
+    assert similarities == sorted(similarities, reverse=True)
+
+
+def test_single_adds_match_batched_adds(names):
+    batched = NameIndex(names)
+    single = NameIndex()
+
+    handles = [single.add(name) for name in names]
+
+    assert handles == list(range(len(names)))
+    assert single.nbytes == batched.nbytes
+    for text in ("leg", "gorn", "wyn"):
+        assert single.prefix(text, limit=50) == batched.prefix(text, limit=50)
+        assert single.fuzzy(text) == batched.fuzzy(text)
+
+
+def test_removed_names_are_not_found(index, names):
+    legolas = names.index("Legolas")
+
+    index.remove(legolas)
+
+    assert legolas not in index
+    assert len(index) == len(names) - 1
+    assert legolas not in index.prefix("legolas", limit=10)
+    assert legolas not in index.substring("go", limit=len(names))
+    assert legolas not in [handle for handle, _ in index.fuzzy("Legolas")]
+    with pytest.raises(KeyError):
+        index.remove(legolas)
+    assert index.add("Legolas") == len(names)
+
+
+def test_table_rows_are_handles(rolled_characters):
+    table = CharacterTable.from_characters(rolled_characters[:100])
+    index = NameIndex(table.names)
+
+    rows = index.prefix(table.names[42], limit=1)
+
+    assert [table.names[row] for row in rows] == [table.names[42]]
+    assert index.nbytes > 0
+
+
+def test_invalid_limits_raise(index):
+    with pytest.raises(ValueError, match="limit"):
+        index.prefix("leg", limit=0)
+    with pytest.raises(ValueError, match="threshold"):
+        index.fuzzy("leg", threshold=0)
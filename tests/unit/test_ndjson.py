@@ -0,0 +1,65 @@
+"""Tests for streaming NDJSON roster import and export."""
+
+import io
+
+import pytest
+
+from anvil_engine.factories import CharacterFactory
+from anvil_engine.roster import iter_characters, write_characters
+
+
+def test_round_trips_in_binary_and_text_mode(rolled_characters):
+    for buffer in (io.BytesIO(), io.StringIO()):
+        written = write_characters(buffer, rolled_characters, chunk_size=64)
+        buffer.seek(0)
+
+        assert written == len(rolled_characters)
+        assert list(iter_characters(buffer, chunk_size=100)) == rolled_characters
+
+
+def test_races_are_written_once_and_shared_on_read(rolled_characters):
+    buffer = io.BytesIO()
+    write_characters(buffer, rolled_characters)
+
+    lines = buffer.getvalue().splitlines()
+    assert len(lines) == len(rolled_characters) + 3
+    buffer.seek(0)
+    trusted = CharacterFactory(validation_mode="trusted")
+    characters = list(iter_characters(buffer, character_factory=trusted))
+    assert characters == rolled_characters
+    assert len({id(character.get_race()) for character in characters}) == 3
+
+
+def test_embedded_races_are_accepted(character_factory, elf_race):
+    legolas = character_factory.create_archer("Legolas", 2931, "male", elf_race)
+    buffer = io.BytesIO(b"\n" + legolas.model_dump_json().encode() + b"\n")
+
+    assert list(iter_characters(buffer)) == [legolas]
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        (b"{not json", "Error reading line 1"),
+        (b'{"name": "Aragorn", "race_id": 4}', "Unknown race id 4 on line 1"),
+        (
+            b'{"race_id": 0, "race": {"name": "Elf", "description": "Elves", '
+            b'"base_attributes": {}}}\n\n'
+            b'{"name": "X", "age": 1, "gender": "m", "attributes": {}, "race_id": 0}',
+            "Invalid character on line 3: name",
+        ),
+        (
+            b'{"race_id": 0, "race": {"name": "Elf", "description": "Elves", '
+            b'"base_attributes": {}}}\n'
+            b'{"age": 1, "gender": "m", "attributes": {}, "race_id": 0}',
+            "Invalid character on line 2: name",
+        ),
+        (
+            b'{"race_id": 0, "race": {"name": "Elf"}}',
+            'Invalid race record on line 1, expected {"race_id"',
+        ),
+    ],
+)
+def test_invalid_lines_name_their_line_number(content, message):
+    with pytest.raises(ValueError, match=message):
+        list(iter_characters(io.BytesIO(content)))
@@ -0,0 +1,112 @@
+"""Tests for race creation, interning and validation modes."""
+
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from anvil_engine.factories import CharacterFactory, RaceFactory, RaceRegistry
+
+INVALID_ORC = {
+    "name": "Orc",
+    "description": "xxxx",
+    "base_attributes": {"strength": "high"},
+}
+
+
+def test_trusted_races_do_not_bypass_later_validation():
+    trusted = RaceFactory(validation_mode="trusted").create_race(**INVALID_ORC)
+
+    assert trusted.base_attributes == {"strength": "high"}
+    with pytest.raises(ValueError, match="Error creating race"):
+        RaceFactory().create_race(**INVALID_ORC)
+    with pytest.raises(ValueError, match="Error creating race"):
+        RaceFactory(validation_mode="strict").create_race(**INVALID_ORC)
+
+
+def test_trusted_batches_do_not_bypass_later_validation():
+    registry = RaceRegistry()
+    races = RaceFactory(registry, validation_mode="trusted").create_races(
+        [INVALID_ORC, INVALID_ORC]
+    )
+
+    assert races.ok
+    assert races.items[0] is races.items[1]
+    assert len(registry) == 0
+    assert not RaceFactory(registry).create_races([INVALID_ORC]).ok
+
+
+def test_trusted_lookups_share_validated_races():
+    registry = RaceRegistry()
+    orc = {**INVALID_ORC, "base_attributes": {"strength": 14}}
+    validated = RaceFactory(registry).create_race(**orc)
+
+    trusted = RaceFactory(registry, validation_mode="trusted")
+    assert trusted.create_race(**orc) is validated
+
+
+def test_built_in_races_are_shared(race_factory, human_race, elf_race):
+    assert race_factory.create_human() is human_race
+    assert RaceFactory().create_elf() is elf_race
+
+
+def test_identical_races_are_interned(sample_race_data):
+    factory = RaceFactory(RaceRegistry())
+
+    race = factory.create_race(**sample_race_data)
+
+    assert factory.create_race(**sample_race_data) is race
+    assert factory.create_race(**{**sample_race_data, "name": "Other"}) is not race
+    with pytest.raises(ValidationError):
+        race.name = "Renamed"
+
+
+def test_custom_races_are_evicted_but_pinned_ones_kept(sample_race_data):
+    registry = RaceRegistry(maxsize=2)
+    factory = RaceFactory(registry)
+    human = factory.create_human()
+    first = factory.create_race(**sample_race_data)
+    for i in range(2):
+        factory.create_race(**{**sample_race_data, "name": f"Race {i}"})
+
+    assert len(registry) == 3
+    assert factory.create_race(**sample_race_data) is not first
+    registry.clear()
+    assert len(registry) == 1
+    assert factory.create_human() is human
+
+
+def test_shared_races_and_characters_are_read_only(character_factory, human_race):
+    legolas = character_factory.create_archer("Legolas", 2931, "male", human_race)
+    content_hash = human_race.content_hash()
+
+    with pytest.raises(TypeError, match="read-only"):
+        RaceFactory().create_human().base_attributes["strength"] = 99
+    with pytest.raises(TypeError, match="read-only"):
+        legolas.get_attributes().update(strength=99)
+    assert human_race.content_hash() == content_hash
+    assert RaceFactory().create_human().get_base_attributes()["strength"] != 99
+    assert pickle.loads(pickle.dumps(legolas)) == legolas
+
+
+def test_strict_lookups_do_not_bypass_validation(
+    sample_character_data, sample_race_data
+):
+    registry = RaceRegistry()
+    lax = RaceFactory(registry)
+    strict = RaceFactory(registry, validation_mode="strict")
+    race = lax.create_race(
+        **{**sample_race_data, "base_attributes": {"strength": "12"}}
+    )
+    coerced = {**sample_race_data, "base_attributes": {"strength": 12.0}}
+
+    with pytest.raises(ValueError, match="Error creating race"):
+        strict.create_race(**coerced)
+    assert not strict.create_races([coerced]).ok
+    characters = CharacterFactory(registry, validation_mode="strict")
+    assert not characters.create_characters(
+        [{**sample_character_data, "race": coerced}]
+    ).ok
+    exact = {**sample_race_data, "base_attributes": {"strength": 12}}
+    assert strict.create_race(**exact) is race
+    assert lax.create_race(**coerced) is race
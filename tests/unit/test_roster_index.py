@@ -0,0 +1,98 @@
+"""Tests for the RosterIndex secondary indexes."""
+
+import random
+
+import pytest
+
+from anvil_engine.models.attributes import ATTRIBUTE_NAMES
+from anvil_engine.roster import RosterIndex
+from anvil_engine.roster.index import _SortedKeys
+
+
+def scan(characters, race=None, min_attributes=None, max_attributes=None):
+    """Answer a query by checking every character."""
+    return [
+        i
+        for i, character in enumerate(characters)
+        if (race is None or character.get_race().get_name() == race)
+        and all(
+            character.get_attributes()[name] >= low
+            for name, low in (min_attributes or {}).items()
+        )
+        and all(
+            character.get_attributes()[name] <= high
+            for name, high in (max_attributes or {}).items()
+        )
+    ]
+
+
+def test_random_queries_match_linear_scan(rolled_characters):
+    index = RosterIndex(rolled_characters)
+    rng = random.Random(0)
+    for _ in range(300):
+        race = rng.choice([None, "Human", "Elf", "Dwarf"])
+        names = rng.sample(ATTRIBUTE_NAMES, rng.randint(0, 2))
+        min_attributes = {name: rng.randint(1, 20) for name in names}
+        max_attributes = {
+            name: rng.randint(1, 20) for name in rng.sample(ATTRIBUTE_NAMES, 1)
+        }
+        expected = scan(rolled_characters, race, min_attributes, max_attributes)
+        actual = index.query_handles(race, min_attributes, max_attributes)
+        assert sorted(actual) == expected
+
+
+@pytest.mark.parametrize("low, high", [(15, 3), (18, 3), (19, 3), (20, 1)])
+def test_inverted_range_matches_nothing(rolled_characters, low, high):
+    index = RosterIndex(rolled_characters)
+
+    assert (
+        index.query(min_attributes={"strength": low}, max_attributes={"strength": high})
+        == []
+    )
+
+
+def test_add_remove_and_update_keep_indexes_in_sync(rolled_characters):
+    index = RosterIndex(rolled_characters[:100])
+    handle = index.add(rolled_characters[100])
+    index.remove(0)
+    index.update(1, rolled_characters[101])
+
+    assert len(index) == 100
+    assert 0 not in index
+    assert index.get(handle) is rolled_characters[100]
+    live = {h: index.get(h) for h in range(1, handle + 1)}
+    for name in ATTRIBUTE_NAMES:
+        low = rolled_characters[101].get_attributes()[name]
+        expected = sorted(h for h, c in live.items() if c.get_attributes()[name] >= low)
+        assert sorted(index.query_handles(min_attributes={name: low})) == expected
+
+
+def test_unknown_attribute_raises(rolled_characters):
+    index = RosterIndex(rolled_characters[:10])
+
+    with pytest.raises(ValueError, match="Unknown attribute"):
+        index.query(min_attributes={"luck": 3})
+
+
+def test_range_counts_stay_exact_as_buckets_split_and_empty():
+    rng = random.Random(1)
+    keys = [rng.randint(0, 50_000) for _ in range(5_000)]
+    sorted_keys = _SortedKeys(list(keys))
+    for _ in range(6_000):
+        key = rng.randint(20_000, 21_000)
+        sorted_keys.insert(key)
+        keys.append(key)
+    for key in rng.sample(keys, 3_000):
+        sorted_keys.remove(key)
+        keys.remove(key)
+    # Empty the first buckets entirely
+    for key in [key for key in keys if key < 12_000]:
+        sorted_keys.remove(key)
+        keys.remove(key)
+
+    assert list(sorted_keys) == sorted(keys)
+    for _ in range(200):
+        low, high = sorted(rng.randint(-10, 50_010) for _ in range(2))
+        expected = sum(low <= key <= high for key in keys)
+        assert sorted_keys.count(low, high) == expected
+        assert len(list(sorted_keys.range(low, high))) == expected
@@ -0,0 +1,77 @@
+"""Tests for the binary roster snapshot."""
+
+import mmap
+
+import pytest
+
+from anvil_engine.models.attributes import ATTRIBUTE_NAMES
+from anvil_engine.roster import RosterSnapshot, binary, write_snapshot
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, rolled_characters):
+    path = tmp_path / "roster.bin"
+    write_snapshot(path, rolled_characters, metadata={"turn": 3})
+    return path
+
+
+def test_snapshot_round_trips_characters(snapshot_path, rolled_characters):
+    with RosterSnapshot(snapshot_path) as snapshot:
+        assert len(snapshot) == len(rolled_characters)
+        assert snapshot.metadata == {"turn": 3}
+        for stored, original in zip(snapshot, rolled_characters, strict=True):
+            assert stored.get_name() == original.get_name()
+            assert stored.get_age() == original.get_age()
+            assert stored.get_gender() == original.get_gender()
+            assert stored.get_attributes() == original.get_attributes()
+            assert stored.get_race() is original.get_race()
+
+
+def test_table_outlives_the_snapshot(snapshot_path, rolled_characters):
+    with RosterSnapshot(snapshot_path) as snapshot:
+        table = snapshot.to_table()
+        effective = snapshot.effective_attributes()
+
+    assert len(table) == len(rolled_characters)
+    assert table.to_characters()[-1].get_name() == rolled_characters[-1].get_name()
+    assert [
+        dict(zip(ATTRIBUTE_NAMES, row, strict=True)) for row in effective.tolist()
+    ] == [character.get_effective_attributes() for character in rolled_characters]
+
+
+def test_close_refuses_while_views_are_referenced(snapshot_path):
+    snapshot = RosterSnapshot(snapshot_path)
+    ages = snapshot.ages
+
+    with pytest.raises(BufferError):
+        snapshot.close()
+    del ages
+    snapshot.close()
+
+
+def test_invalid_file_raises(tmp_path):
+    path = tmp_path / "roster.bin"
+    path.write_bytes(b"not a roster snapshot at all, just some bytes")
+
+    with pytest.raises(ValueError, match="Error opening roster snapshot"):
+        RosterSnapshot(path)
+
+
+@pytest.mark.parametrize(
+    ("original", "corrupted"),
+    [(b'"races"', b'"racez"'), (b'"name":"Human"', b'"name":"Hu"   ')],
+)
+def test_invalid_races_raise_and_unmap(snapshot_path, monkeypatch, original, corrupted):
+    data = snapshot_path.read_bytes()
+    snapshot_path.write_bytes(data.replace(original, corrupted, 1))
+    maps = []
+    open_mmap = mmap.mmap
+
+    def tracked_mmap(*args, **kwargs):
+        maps.append(open_mmap(*args, **kwargs))
+        return maps[-1]
+
+    monkeypatch.setattr(binary.mmap, "mmap", tracked_mmap)
+    with pytest.raises(ValueError, match="Error opening roster snapshot"):
+        RosterSnapshot(snapshot_path)
+    assert all(mapped.closed for mapped in maps)
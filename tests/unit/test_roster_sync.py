@@ -0,0 +1,67 @@
+"""Tests for content hashes and change-set replication."""
+
+import pytest
+
+from anvil_engine.factories import apply_delta
+from anvil_engine.models import CompactCharacter
+from anvil_engine.roster import ChangeSet, apply_changeset, diff_rosters
+
+
+@pytest.fixture
+def rosters(rolled_characters):
+    old = dict(enumerate(rolled_characters[:500]))
+    new = dict(old)
+    for key in range(0, 100, 10):
+        new[key] = apply_delta(old[key], {"strength": 1})
+    for key in range(400, 405):
+        del new[key]
+    new.update(enumerate(rolled_characters[500:503], start=1_000))
+    return old, new
+
+
+def test_content_hashes_depend_only_on_content(character_factory, elf_race):
+    legolas = character_factory.create_archer("Legolas", 2931, "male", elf_race)
+    twin = character_factory.create_archer("Legolas", 2931, "male", elf_race)
+
+    assert legolas.content_hash() == twin.content_hash()
+    compact = CompactCharacter.from_character(twin)
+    assert legolas.content_hash() == compact.content_hash()
+    assert legolas.content_hash() != apply_delta(twin, {"agility": 1}).content_hash()
+
+
+def test_diff_carries_only_the_changes(rosters):
+    old, new = rosters
+
+    changeset = diff_rosters(old, new)
+
+    assert sorted(changeset.changed) == list(range(0, 100, 10))
+    assert changeset.removed == tuple(range(400, 405))
+    assert sorted(changeset.added) == [1_000, 1_001, 1_002]
+    assert len(changeset) == 18
+    assert len(diff_rosters(new, new)) == 0
+
+
+def test_replicated_change_sets_reproduce_the_new_roster(rosters):
+    old, new = rosters
+    changeset = ChangeSet.from_json(diff_rosters(old, new).to_json())
+
+    replica = apply_changeset(dict(old), changeset)
+
+    assert replica == new
+
+
+def test_diverged_rosters_are_left_untouched(rosters):
+    old, new = rosters
+    changeset = diff_rosters(old, new)
+    diverged = {**old, 0: apply_delta(old[0], {"wisdom": 1})}
+
+    with pytest.raises(ValueError, match="diverged at character 0"):
+        apply_changeset(diverged, changeset)
+    assert diverged.keys() == old.keys()
+    with pytest.raises(ValueError, match="already holds"):
+        apply_changeset(dict(new), diff_rosters({}, {1_000: new[1_000]}))
+
+
+def test_invalid_change_sets_raise():
+    with pytest.raises(ValueError, match="Error loading change set"):
+        ChangeSet.from_json(b'{"added": [[1, {"race": 3}]], "races": []}')
@@ -0,0 +1,92 @@
+"""Tests for the vectorized duel simulator and balance reports."""
+
+import numpy as np
+import pytest
+
+from anvil_engine.roster import CharacterTable
+from anvil_engine.simulation import (
+    DuelRules,
+    Grouping,
+    simulate_duels,
+    simulate_matchups,
+)
+from anvil_engine.simulation.combat import DRAW, LOSS, WIN
+
+
+@pytest.fixture
+def table(rolled_characters):
+    return CharacterTable.from_characters(rolled_characters[:400])
+
+
+def test_duels_are_reproducible(table):
+    attributes = table.effective_attributes()
+    first, second = attributes[:200], attributes[200:]
+
+    outcomes = simulate_duels(first, second, seed=3)
+
+    assert outcomes.dtype == np.int8
+    assert set(np.unique(outcomes).tolist()) <= {WIN, LOSS, DRAW}
+    assert np.array_equal(outcomes, simulate_duels(first, second, seed=3))
+    assert not np.array_equal(outcomes, simulate_duels(first, second, seed=4))
+
+
+def test_stronger_side_wins_more():
+    strong = np.full((2_000, 7), 18)
+    weak = np.full((2_000, 7), 6)
+
+    outcomes = simulate_duels(strong, weak, seed=1)
+
+    assert (outcomes == WIN).mean() > 0.9
+
+
+def test_duels_without_a_winner_are_draws():
+    attributes = np.full((50, 7), 10)
+    rules = DuelRules(damage_die=1, base_hp=1_000, max_rounds=3)
+
+    outcomes = simulate_duels(attributes, attributes, seed=0, rules=rules)
+
+    assert (outcomes == DRAW).all()
+
+
+def test_invalid_duels_raise():
+    with pytest.raises(ValueError, match="N x 7"):
+        simulate_duels(np.zeros((3, 7)), np.zeros((4, 7)))
+    with pytest.raises(ValueError, match="must be positive"):
+        DuelRules(max_rounds=0)
+
+
+def test_reports_depend_only_on_seed_and_shard_size(table):
+    single = simulate_matchups(table, table, duels=5_000, seed=2, shard_size=1_000)
+    pooled = simulate_matchups(
+        table, table, duels=5_000, seed=2, shard_size=1_000, workers=2
+    )
+
+    assert single.duels == 5_000
+    assert np.array_equal(single.counts, pooled.counts)
+    other = simulate_matchups(table, table, duels=5_000, seed=3, shard_size=1_000)
+    assert not np.array_equal(single.counts, other.counts)
+
+
+def test_win_rates_aggregate_the_counts(table, rolled_characters):
+    report = simulate_matchups(
+        table, rolled_characters[400:800], duels=4_000, seed=5, workers=1
+    )
+
+    assert report.classes == ("archer", "warrior")
+    assert set(report.races) == {"Human", "Elf", "Dwarf"}
+    for by in Grouping:
+        matrix = report.win_rates(by)
+        assert int(matrix.duels.sum()) == report.duels
+        assert len(matrix.format().splitlines()) == len(matrix.rows) + 1
+    by_class = report.win_rates("class")
+    rates = by_class.rates
+    assert np.all((rates >= 0) & (rates <= 1) | np.isnan(rates))
+    with pytest.raises(ValueError):
+        report.win_rates("height")
+
+
+def test_invalid_matchups_raise(table):
+    with pytest.raises(ValueError, match="at least one character"):
+        simulate_matchups(table, [], duels=10)
+    with pytest.raises(ValueError, match="shard_size"):
+        simulate_matchups(table, table, shard_size=0)
@@ -0,0 +1,75 @@
+"""Tests for vectorized random attribute generation."""
+
+import numpy as np
+import pytest
+
+from anvil_engine.factories.character_factory import CLASS_TEMPLATES
+from anvil_engine.generation import generate_attributes
+from anvil_engine.models.attributes import pack_attributes, race_modifiers
+
+
+def test_rolls_stay_within_bounds_around_the_template(dwarf_race):
+    scores = generate_attributes(5_000, "archer", dwarf_race, seed=1)
+
+    centre = np.add(
+        pack_attributes(CLASS_TEMPLATES["archer"]),
+        race_modifiers(dwarf_race.base_attributes),
+    )
+    assert scores.shape == (5_000, 7)
+    assert scores.dtype == np.int16
+    assert scores.min() >= 1
+    assert scores.max() <= 20
+    assert np.abs(scores.mean(axis=0) - centre).max() < 1.5
+
+
+def test_seeds_make_draws_reproducible():
+    first = generate_attributes(100, method="point_buy", seed=3)
+
+    assert np.array_equal(first, generate_attributes(100, method="point_buy", seed=3))
+    assert not np.array_equal(first, generate_attributes(100, method="point_buy"))
+
+
+@pytest.mark.parametrize("template", ["warrior", "archer"])
+def test_point_buy_keeps_the_total_when_clamped(elf_race, template):
+    scores = generate_attributes(
+        5_000, template, elf_race, "point_buy", budget=21, high=14, seed=2
+    )
+
+    expected = np.add(
+        pack_attributes(CLASS_TEMPLATES[template]),
+        race_modifiers(elf_race.base_attributes),
+    ).sum()
+    assert scores.max() == 14
+    assert scores.min() >= 1
+    assert (scores.sum(axis=1) == expected).all()
+
+
+def test_point_buy_totals_beyond_the_bounds_are_capped():
+    template = dict.fromkeys(CLASS_TEMPLATES["warrior"], 18)
+    scores = generate_attributes(100, template, None, "point_buy", high=15, seed=4)
+
+    assert (scores == 15).all()
+
+
+@pytest.mark.parametrize("method", ["roll", "point_buy"])
+def test_large_budgets_and_templates_do_not_wrap(method):
+    template = dict.fromkeys(CLASS_TEMPLATES["warrior"], 40_000)
+
+    huge = generate_attributes(10, template, method=method, high=30_000, seed=5)
+    large = generate_attributes(20, method=method, budget=300_000, seed=5)
+
+    assert huge.dtype == large.dtype == np.int16
+    assert (huge == 30_000).all()
+    assert large.min() >= 1
+    assert large.max() <= 20
+
+
+def test_invalid_arguments_raise():
+    with pytest.raises(ValueError, match="Unknown character class"):
+        generate_attributes(1, "bard")
+    with pytest.raises(ValueError):
+        generate_attributes(1, low=10, high=5)
+    with pytest.raises(ValueError):
+        generate_attributes(1, method="dice")
+    with pytest.raises(ValueError, match="within"):
+        generate_attributes(1, high=40_000)
@@ -0,0 +1,93 @@
+"""Tests for the class and race template registry."""
+
+import json
+
+import pytest
+
+from anvil_engine.factories import RaceFactory, RaceRegistry, TemplateRegistry
+
+RANGER = {
+    "strength": 9,
+    "agility": 13,
+    "intelligence": 10,
+    "wisdom": 12,
+    "dexterity": 13,
+    "constitution": 9,
+    "charisma": 6,
+}
+
+TEMPLATE_FILE = """\
+[classes.ranger]
+strength = 9
+agility = 13
+intelligence = 10
+wisdom = 12
+dexterity = 13
+constitution = 9
+charisma = 6
+
+[races.dwarf]
+name = "Dwarf"
+description = "Stout and stubborn mountain folk"
+base_attributes = { strength = 12, constitution = 12, agility = 8 }
+"""
+
+
+@pytest.fixture
+def template_path(tmp_path):
+    path = tmp_path / "templates.toml"
+    path.write_text(TEMPLATE_FILE)
+    return path
+
+
+def test_file_templates_extend_the_built_in_ones(template_path, dwarf_race):
+    templates = TemplateRegistry.from_file(template_path)
+
+    assert set(templates.classes) >= {"archer", "warrior", "ranger"}
+    assert templates.race("Dwarf") is dwarf_race
+    ranger = templates.create_by_class("Ranger", "Aragorn", 87, "male", "dwarf")
+    assert ranger.get_attributes() == RANGER
+    assert ranger.get_race() is dwarf_race
+
+
+def test_json_templates_load(tmp_path):
+    path = tmp_path / "templates.json"
+    path.write_text(json.dumps({"classes": {"ranger": RANGER}}))
+
+    ranger = TemplateRegistry.from_file(path).class_template("ranger")
+    assert dict(ranger.attributes) == RANGER
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        [1],
+        {"classes": [1]},
+        {"classes": {"ranger": {"strength": 9}}},
+        {"races": {"dwarf": 1}},
+        {"races": {"dwarf": {"name": "Dwarf"}}},
+    ],
+)
+def test_invalid_reload_keeps_previous_templates(template_path, document):
+    templates = TemplateRegistry.from_file(template_path)
+    template_path.with_suffix(".json").write_text(json.dumps(document))
+
+    with pytest.raises(ValueError, match="Error loading templates"):
+        templates.load(template_path.with_suffix(".json"))
+    assert "ranger" in templates.classes
+    assert "dwarf" in templates.races
+
+
+def test_reloads_do_not_pin_races(template_path):
+    registry = RaceRegistry(maxsize=4)
+    templates = TemplateRegistry(race_factory=RaceFactory(registry))
+    templates.load(template_path)
+
+    for generation in range(10):
+        template_path.write_text(
+            TEMPLATE_FILE.replace("mountain folk", f"mountain folk {generation}")
+        )
+        templates.reload()
+
+    assert templates.race("dwarf").description == "Stout and stubborn mountain folk 9"
+    assert len(registry) <= 2 + 4
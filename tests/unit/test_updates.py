@@ -0,0 +1,70 @@
+"""Tests for copy-on-write attribute deltas and the change log."""
+
+import pytest
+
+from anvil_engine.factories import ChangeLog, apply_delta, apply_deltas
+from anvil_engine.models import CompactCharacter
+
+
+@pytest.fixture
+def party(rolled_characters):
+    return rolled_characters[:20]
+
+
+def test_delta_creates_a_new_version(party):
+    original = party[0]
+    attributes = dict(original.get_attributes())
+
+    updated = apply_delta(original, {"strength": 2, "agility": -1})
+
+    assert original.get_attributes() == attributes
+    assert updated.get_attributes() == {
+        **attributes,
+        "strength": attributes["strength"] + 2,
+        "agility": attributes["agility"] - 1,
+    }
+    assert updated.get_race() is original.get_race()
+    assert updated.get_name() is original.get_name()
+    assert updated.content_hash() != original.content_hash()
+    assert updated.json_bytes() == updated.model_copy().model_dump_json().encode()
+    assert apply_delta(original, {"strength": 0}) is original
+
+
+def test_compact_characters_are_updated_alike(party):
+    compact = CompactCharacter.from_character(party[0])
+
+    updated = apply_delta(compact, {"wisdom": 3})
+
+    assert isinstance(updated, CompactCharacter)
+    assert updated.to_character() == apply_delta(party[0], {"wisdom": 3})
+
+
+def test_log_replays_changes_onto_another_copy(party):
+    log = ChangeLog()
+    keys = list(range(len(party)))
+
+    buffed = apply_deltas(party, {"strength": 1}, log=log, keys=keys)
+    healed = apply_deltas(
+        buffed, [{"constitution": i % 3} for i in keys], log=log, keys=keys
+    )
+
+    assert len(log) == 2 * len(party)
+    assert [change.sequence for change in log] == list(range(len(log)))
+    assert log.since(len(party))[0].before == buffed[0].get_attributes()
+    expected = dict(enumerate(healed))
+    assert log.replay(dict(enumerate(party))) == expected
+    assert log.replay(dict(enumerate(buffed)), since=len(party)) == expected
+    with pytest.raises(ValueError, match="No character"):
+        log.replay({})
+
+
+@pytest.mark.parametrize(
+    "deltas",
+    [{"luck": 1}, {"strength": 1.5}, [{"strength": 1}]],
+)
+def test_invalid_deltas_change_and_log_nothing(party, deltas):
+    log = ChangeLog()
+
+    with pytest.raises(ValueError):
+        apply_deltas(party, deltas, log=log)
+    assert len(log) == 0
@@ -0,0 +1,49 @@
+"""Tests for the strict, lax and trusted factory validation modes."""
+
+import pytest
+
+from anvil_engine.factories import CharacterFactory, ValidationMode
+
+
+@pytest.fixture
+def coercible_row(sample_character_data, human_race):
+    return {**sample_character_data, "age": "25", "race": human_race}
+
+
+def test_lax_mode_coerces(coercible_row):
+    character = CharacterFactory().create_character(**coercible_row)
+
+    assert character.get_age() == 25
+
+
+def test_strict_mode_rejects_coercion(coercible_row):
+    factory = CharacterFactory(validation_mode=ValidationMode.STRICT)
+
+    with pytest.raises(ValueError, match="Error creating character"):
+        factory.create_character(**coercible_row)
+    result = factory.create_characters([coercible_row])
+    assert result.errors[0].errors[0]["loc"] == ("age",)
+
+
+def test_trusted_mode_skips_validation(coercible_row):
+    factory = CharacterFactory(validation_mode="trusted")
+
+    assert factory.create_character(**coercible_row).get_age() == "25"
+    invalid = {**coercible_row, "name": "X"}
+    assert factory.create_characters([invalid]).items[0].get_name() == "X"
+
+
+def test_modes_produce_equal_characters(sample_character_data, human_race):
+    row = {**sample_character_data, "race": human_race}
+
+    created = {
+        mode: CharacterFactory(validation_mode=mode).create_characters([row]).items
+        for mode in ValidationMode
+    }
+
+    assert created["strict"] == created["lax"] == created["trusted"]
+
+
+def test_unknown_mode_raises():
+    with pytest.raises(ValueError):
+        CharacterFactory(validation_mode="paranoid")